@@ -0,0 +1,9 @@
+"""
+Benchmark suite for DynamicModelViewSet.
+
+Run from the repository root::
+
+    python -m benchmarks.run --rows 10000 100000 --output report.json
+
+See benchmarks/README.md.
+"""
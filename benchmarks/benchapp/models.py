@@ -0,0 +1,48 @@
+"""
+Sample models exercised by the benchmarks: a UUID-keyed lookup table, two
+integer-keyed parents with soft delete and unit scoping, and a child table
+for nested writes and reverse embeds.
+"""
+
+import uuid
+
+from django.db import models
+
+
+class Region(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    name = models.CharField(max_length=50)
+
+
+class Customer(models.Model):
+    name = models.CharField(max_length=100)
+    email = models.CharField(max_length=100, blank=True, default="")
+    region_id = models.ForeignKey(Region, on_delete=models.PROTECT)
+    is_deleted = models.BooleanField(default=False)
+    unit_id = models.IntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(null=True, blank=True)
+
+
+class Invoice(models.Model):
+    number = models.CharField(max_length=30, blank=True, null=True)
+    title = models.CharField(max_length=100)
+    status = models.CharField(max_length=20, default="open")
+    customer_id = models.ForeignKey(Customer, on_delete=models.CASCADE)
+    total = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    issued_date = models.DateField(null=True, blank=True)
+    is_deleted = models.BooleanField(default=False)
+    unit_id = models.IntegerField(null=True, blank=True)
+    created_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "id"])]
+
+
+class InvoiceLine(models.Model):
+    invoice_id = models.ForeignKey(
+        Invoice, on_delete=models.CASCADE, related_name="lines"
+    )
+    product = models.CharField(max_length=100)
+    qty = models.IntegerField(default=1)
+    price = models.DecimalField(max_digits=10, decimal_places=2, default=0)
@@ -0,0 +1,540 @@
+"""
+Benchmark DynamicModelViewSet actions against seeded SQLite databases.
+
+Each action is called through the full request/response cycle (URL routing,
+DRF parsing, rendering) with the test client. For every dataset size the
+runner reports per action the latency (median, p95, min over --repeat
+calls after one warm-up call), the number of queries and the peak Python
+memory of one extra call traced with tracemalloc. Reports are JSON, and
+--compare prints the difference against an earlier report.
+
+    python -m benchmarks.run --rows 10000 100000 1000000 --output after.json
+    python -m benchmarks.run --compare before.json --output after.json
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.core.files.uploadedfile import SimpleUploadedFile  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.db import connection  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+from django_react_admin.instrumentation import record_queries  # noqa: E402
+from django_react_admin.renderers import FastJSONRenderer  # noqa: E402
+from django_react_admin.embeds import apply_embeds  # noqa: E402
+from django_react_admin.views import (  # noqa: E402
+    get_embed_fields,
+    model_to_dict,
+    parse_filters,
+)
+
+from .benchapp.models import Customer, Invoice, InvoiceLine  # noqa: E402
+from .seed import SEED_VERSION, seed  # noqa: E402
+
+REPORT_VERSION = 1
+DEFAULT_ROWS = [10000]
+DEFAULT_REPEAT = 5
+# A median this much slower (in percent) than the baseline is a regression
+DEFAULT_THRESHOLD = 10.0
+
+API = "/api/benchapp"
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+class Benchmark:
+    """
+    One measured action. call(client, ctx) performs a single request and
+    must leave the database able to take the next one. Heavy actions (whole
+    table scans) are timed once, without a warm-up call.
+    """
+
+    def __init__(self, name: str, call: Callable, heavy: bool = False):
+        self.name = name
+        self.call = call
+        self.heavy = heavy
+
+
+def _check(response):
+    if response.status_code >= 400:
+        raise BenchmarkError(f"HTTP {response.status_code}: {response.content[:500]!r}")
+    if response.streaming:
+        # Consume the stream so the rows are actually read and written
+        for _ in response.streaming_content:
+            pass
+    return response
+
+
+def _meta(**meta) -> Dict[str, str]:
+    return {"meta": json.dumps(meta)}
+
+
+class Context:
+    """Ids and payloads shared by the actions of one dataset."""
+
+    def __init__(self):
+        invoices = list(
+            Invoice.objects.filter(is_deleted=False)
+            .order_by("id")
+            .values_list("id", flat=True)[:1000]
+        )
+        self.invoice_id = invoices[len(invoices) // 2]
+        self.page_ids = invoices[-100:]
+        self.customer_id = (
+            Customer.objects.filter(is_deleted=False)
+            .order_by("id")
+            .values_list("id", flat=True)
+            .first()
+        )
+        self.line_ids = list(
+            InvoiceLine.objects.filter(invoice_id=self.invoice_id)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        self.calls = 0
+        self._page = None
+
+    @property
+    def page(self) -> List[Dict[str, Any]]:
+        # 500 serialized invoices with their customer and region embedded
+        if self._page is None:
+            embed = get_embed_fields(Invoice, ["customer.region"])
+            rows = apply_embeds(Invoice.objects.order_by("id"), embed)[:500]
+            self._page = [model_to_dict(row, embed=embed) for row in rows]
+        return self._page
+
+    def next(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+def _list(client, ctx):
+    return client.get(f"{API}/invoice/", {"sort": '["id","DESC"]', "range": "[0,24]"})
+
+
+def _list_filtered(client, ctx):
+    filters = {
+        "title|op=like": "%gadget%",
+        "status|op=in": ["open", "paid"],
+        "total|op=gt": 100,
+    }
+    return client.get(
+        f"{API}/invoice/",
+        {"filter": json.dumps(filters), "sort": '["total","DESC"]', "range": "[0,24]"},
+    )
+
+
+def _list_unit(client, ctx):
+    return client.get(f"{API}/invoice/", {"range": "[0,24]"}, HTTP_UNIT_ID="3")
+
+
+def _list_search(client, ctx):
+    return client.get(
+        f"{API}/customer/",
+        {"filter": json.dumps({"q": "customer1"}), "range": "[0,24]"},
+    )
+
+
+def _list_embed(client, ctx):
+    return client.get(
+        f"{API}/invoice/",
+        {"range": "[0,24]", **_meta(embed=["customer.region", "lines"])},
+    )
+
+
+def _list_cursor(client, ctx):
+    return client.get(
+        f"{API}/invoice/", {"cursor": "", "sort": '["id","ASC"]', "range": "[0,24]"}
+    )
+
+
+def _list_sparse(client, ctx):
+    return client.get(
+        f"{API}/invoice/", {"range": "[0,24]", **_meta(fields=["title", "total"])}
+    )
+
+
+def _retrieve_embed(client, ctx):
+    return client.get(
+        f"{API}/invoice/{ctx.invoice_id}/", _meta(embed=["customer.region", "lines"])
+    )
+
+
+def _list_500(client, ctx, api=API):
+    return client.get(
+        f"{api}/invoice/", {"range": "[0,499]", **_meta(embed=["customer.region"])}
+    )
+
+
+def _list_500_fast(client, ctx):
+    # The same page through a viewset using FastJSONRenderer
+    return _list_500(client, ctx, api="/api-fast/benchapp")
+
+
+def _render_drf(client, ctx):
+    JSONRenderer().render(ctx.page)
+
+
+def _render_fast(client, ctx):
+    FastJSONRenderer().render(ctx.page)
+
+
+def _get_many(client, ctx):
+    return client.post(f"{API}/invoice/get_many/", {"ids": ctx.page_ids}, format="json")
+
+
+def _parse_filters(client, ctx):
+    # No request: 100 calls of the filter compiler/binder per measurement
+    filters = {
+        "title|op=like": "%gadget%",
+        "status|op=in": "['open']",
+        "total|op=gt": 5,
+        "customer_id": 1,
+    }
+    for _ in range(100):
+        Invoice.objects.filter(parse_filters(filters, Invoice))
+
+
+def _create_nested(client, ctx):
+    n = ctx.next()
+    return client.post(
+        f"{API}/invoice/",
+        {
+            "title": f"bench {n}",
+            "customer_id": ctx.customer_id,
+            "total": "10.00",
+            "invoiceline": [
+                {"product": f"p{i}", "qty": i + 1, "price": "1.50"} for i in range(5)
+            ],
+        },
+        format="json",
+    )
+
+
+def _update_nested(client, ctx):
+    n = ctx.next()
+    return client.put(
+        f"{API}/invoice/{ctx.invoice_id}/",
+        {
+            "title": f"updated {n}",
+            "invoiceline": [
+                {"id": line_id, "qty": n % 9 + 1} for line_id in ctx.line_ids
+            ],
+        },
+        format="json",
+    )
+
+
+def _create_many(client, ctx):
+    n = ctx.next()
+    items = [
+        {"title": f"bulk {n}-{i}", "customer_id": ctx.customer_id, "total": "1.00"}
+        for i in range(500)
+    ]
+    return client.post(
+        f"{API}/invoice/create_many/",
+        {"items": items, "response": "count"},
+        format="json",
+    )
+
+
+def _import_data(client, ctx):
+    n = ctx.next()
+    buffer = io.StringIO()
+    buffer.write("title,customer_id,total,status\n")
+    for i in range(1000):
+        buffer.write(f"import {n}-{i},{ctx.customer_id},{i}.50,open\n")
+    upload = SimpleUploadedFile(
+        "invoices.csv", buffer.getvalue().encode("utf-8"), content_type="text/csv"
+    )
+    return client.post(
+        f"{API}/invoice/import_data/", {"file": upload}, format="multipart"
+    )
+
+
+def _export_data(client, ctx):
+    return client.get(f"{API}/invoice/export_data/")
+
+
+def _generate_id(client, ctx):
+    return client.get(
+        f"{API}/invoice/generate_id/",
+        {"column": "number", "options": json.dumps({"prefix": "INV-"})},
+    )
+
+
+def _generate_id_block(client, ctx):
+    return client.get(
+        f"{API}/invoice/generate_id/",
+        {"column": "number", "options": json.dumps({"prefix": "INV-"}), "count": 100},
+    )
+
+
+BENCHMARKS = [
+    Benchmark("list", _list),
+    Benchmark("list_filtered", _list_filtered),
+    Benchmark("list_unit", _list_unit),
+    Benchmark("list_search", _list_search),
+    Benchmark("list_embed", _list_embed),
+    Benchmark("list_cursor", _list_cursor),
+    Benchmark("list_sparse", _list_sparse),
+    Benchmark("retrieve_embed", _retrieve_embed),
+    Benchmark("get_many", _get_many),
+    Benchmark("list_500", _list_500),
+    Benchmark("list_500_fast", _list_500_fast),
+    Benchmark("render_drf", _render_drf),
+    Benchmark("render_fast", _render_fast),
+    Benchmark("parse_filters", _parse_filters),
+    Benchmark("create_nested", _create_nested),
+    Benchmark("update_nested", _update_nested),
+    Benchmark("create_many", _create_many),
+    Benchmark("import_data", _import_data),
+    Benchmark("generate_id", _generate_id),
+    Benchmark("generate_id_block", _generate_id_block),
+    Benchmark("export_data", _export_data, heavy=True),
+]
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def measure(
+    benchmark: Benchmark, client, ctx, repeat: int, memory: bool
+) -> Dict[str, Any]:
+    def call():
+        response = benchmark.call(client, ctx)
+        if response is not None:
+            _check(response)
+
+    if benchmark.heavy:
+        repeat = 1
+    else:
+        call()
+
+    timings = []
+    queries = 0
+    for _ in range(repeat):
+        with record_queries() as recorder:
+            start = time.perf_counter()
+            call()
+            timings.append(time.perf_counter() - start)
+        queries = recorder.count
+
+    result = {
+        "median_ms": round(statistics.median(timings) * 1000, 3),
+        "p95_ms": round(_percentile(timings, 95) * 1000, 3),
+        "min_ms": round(min(timings) * 1000, 3),
+        "calls": repeat,
+        "queries": queries,
+        "peak_kb": None,
+    }
+    if memory:
+        tracemalloc.start()
+        try:
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        result["peak_kb"] = round(peak / 1024, 1)
+    return result
+
+
+def prepare_database(rows: int, data_dir: str) -> str:
+    """
+    Return a fresh copy of the seeded database for rows, seeding it first if
+    needed. Runs start from an identical copy, so writes made by one run do
+    not skew the next.
+    """
+    os.makedirs(data_dir, exist_ok=True)
+    seed_path = os.path.join(data_dir, f"seed-v{SEED_VERSION}-{rows}.sqlite3")
+    run_path = os.path.join(data_dir, f"run-{rows}.sqlite3")
+
+    if not os.path.exists(seed_path):
+        print(f"Seeding {rows} rows into {seed_path} ...", file=sys.stderr)
+        started = time.perf_counter()
+        _use_database(seed_path + ".tmp")
+        call_command("migrate", run_syncdb=True, verbosity=0)
+        seed(rows)
+        connection.close()
+        os.replace(seed_path + ".tmp", seed_path)
+        print(f"Seeded in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    shutil.copyfile(seed_path, run_path)
+    _use_database(run_path)
+    return run_path
+
+
+def _use_database(path: str):
+    connection.close()
+    if os.path.exists(path) and path.endswith(".tmp"):
+        os.remove(path)
+    connection.settings_dict["NAME"] = path
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(
+    rows_list: List[int], repeat: int, names: List[str], data_dir: str, memory: bool
+) -> Dict[str, Any]:
+    selected = [b for b in BENCHMARKS if not names or b.name in names]
+    report = {
+        "version": REPORT_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+        },
+        "repeat": repeat,
+        "results": {},
+    }
+    client = APIClient()
+    for rows in rows_list:
+        prepare_database(rows, data_dir)
+        ctx = Context()
+        results = report["results"][str(rows)] = {}
+        for benchmark in selected:
+            print(f"[{rows}] {benchmark.name}", file=sys.stderr)
+            results[benchmark.name] = measure(benchmark, client, ctx, repeat, memory)
+        connection.close()
+    return report
+
+
+def _format_row(rows, name, result, change: str = "") -> str:
+    peak = "-" if result["peak_kb"] is None else f"{result['peak_kb']:.0f}"
+    return (
+        f"{rows:>8} {name:<18} {result['median_ms']:>10.2f} {result['p95_ms']:>10.2f} "
+        f"{result['queries']:>7} {peak:>9}{change}"
+    )
+
+
+def compare(
+    report: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """Print report against baseline; return the regressed "rows/action" keys."""
+    regressions = []
+    print(
+        f"{'rows':>8} {'action':<18} {'median ms':>10} {'p95 ms':>10} {'queries':>7} {'peak KiB':>9}  change"
+    )
+    for rows, results in report["results"].items():
+        for name, result in results.items():
+            before = baseline.get("results", {}).get(rows, {}).get(name)
+            change = ""
+            if before:
+                delta = (
+                    (result["median_ms"] - before["median_ms"])
+                    / max(before["median_ms"], 1e-6)
+                    * 100
+                )
+                change = f"  {delta:+.1f}%"
+                if result["queries"] != before["queries"]:
+                    change += f" queries {before['queries']} -> {result['queries']}"
+                if delta > threshold or result["queries"] > before["queries"]:
+                    change += "  REGRESSION"
+                    regressions.append(f"{rows}/{name}")
+            print(_format_row(int(rows), name, result, change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rows",
+        type=int,
+        nargs="+",
+        default=DEFAULT_ROWS,
+        help="dataset sizes (invoices)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=DEFAULT_REPEAT, help="timed calls per action"
+    )
+    parser.add_argument(
+        "--only", nargs="+", default=[], metavar="ACTION", help="run only these actions"
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=os.path.join(tempfile.gettempdir(), "django-react-admin-benchmarks"),
+        help="where seeded databases are kept between runs",
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="skip the tracemalloc call"
+    )
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument(
+        "--compare", metavar="REPORT", help="earlier JSON report to compare with"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="regression threshold, percent",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="exit with status 1 on regressions",
+    )
+    args = parser.parse_args(argv)
+
+    unknown = set(args.only) - {b.name for b in BENCHMARKS}
+    if unknown:
+        parser.error(f"unknown actions: {', '.join(sorted(unknown))}")
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    report = run(args.rows, args.repeat, args.only, args.data_dir, not args.no_memory)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    regressions = compare(report, baseline, args.threshold)
+    if regressions and args.fail_on_regression:
+        print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
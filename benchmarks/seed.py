@@ -0,0 +1,94 @@
+"""
+Deterministic data for the benchmarks.
+
+A dataset of N rows means N invoices, N // 10 customers, 2 * N invoice
+lines and 20 regions. Every run of the same size sees the same data.
+"""
+
+import random
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from django.db import connection, transaction
+
+from .benchapp.models import Customer, Invoice, InvoiceLine, Region
+
+# Bump when the models or the generated data change, so old seeds are rebuilt
+SEED_VERSION = 1
+SEED_BATCH_SIZE = 10000
+LINES_PER_INVOICE = 2
+REGIONS = 20
+
+STATUSES = ("open", "paid", "void", "overdue")
+PRODUCTS = ("widget", "gadget", "gizmo", "doohickey", "sprocket")
+
+
+def _batches(total, size=SEED_BATCH_SIZE):
+    for start in range(0, total, size):
+        yield start, min(start + size, total)
+
+
+def seed(rows: int, random_seed: int = 42):
+    """Fill an empty database with a dataset of rows invoices."""
+    rng = random.Random(random_seed)
+    customers = max(1, rows // 10)
+    epoch = datetime(2024, 1, 1)
+
+    with connection.cursor() as cursor:
+        # The seed database is a throwaway file; trade durability for speed
+        cursor.execute("PRAGMA journal_mode = OFF")
+        cursor.execute("PRAGMA synchronous = OFF")
+
+    with transaction.atomic():
+        regions = [
+            Region(id=uuid.UUID(int=rng.getrandbits(128)), name=f"Region {i}")
+            for i in range(REGIONS)
+        ]
+        Region.objects.bulk_create(regions)
+
+        for start, stop in _batches(customers):
+            Customer.objects.bulk_create(
+                Customer(
+                    id=i + 1,
+                    name=f"Customer {i}",
+                    email=f"customer{i}@example.com",
+                    region_id=regions[i % REGIONS],
+                    is_deleted=i % 50 == 0,
+                    unit_id=i % 5 + 1,
+                    created_at=epoch + timedelta(minutes=i),
+                )
+                for i in range(start, stop)
+            )
+
+        for start, stop in _batches(rows):
+            Invoice.objects.bulk_create(
+                Invoice(
+                    id=i + 1,
+                    number=f"INV-{i + 1:07d}",
+                    title=f"Invoice {i} {rng.choice(PRODUCTS)}",
+                    status=STATUSES[i % len(STATUSES)],
+                    customer_id_id=rng.randrange(customers) + 1,
+                    total=Decimal(rng.randrange(100, 1000000)) / 100,
+                    issued_date=date(2024, 1, 1) + timedelta(days=i % 365),
+                    is_deleted=i % 100 == 0,
+                    unit_id=i % 5 + 1,
+                    created_at=epoch + timedelta(seconds=i),
+                )
+                for i in range(start, stop)
+            )
+
+        for start, stop in _batches(rows):
+            InvoiceLine.objects.bulk_create(
+                InvoiceLine(
+                    invoice_id_id=i + 1,
+                    product=rng.choice(PRODUCTS),
+                    qty=rng.randrange(1, 10),
+                    price=Decimal(rng.randrange(100, 10000)) / 100,
+                )
+                for i in range(start, stop)
+                for _ in range(LINES_PER_INVOICE)
+            )
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
@@ -0,0 +1,34 @@
+"""Django settings for the benchmark suite (SQLite, no middleware)."""
+
+import os
+
+SECRET_KEY = "benchmarks"
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
+USE_TZ = False
+DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
+
+INSTALLED_APPS = [
+    "django.contrib.contenttypes",
+    "django.contrib.auth",
+    "rest_framework",
+    "django_react_admin",
+    "benchmarks.benchapp",
+]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        # Set per run by benchmarks.run (one database file per dataset size)
+        "NAME": os.environ.get("BENCHMARK_DB", "benchmark.sqlite3"),
+    }
+}
+
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+ROOT_URLCONF = "benchmarks.urls"
+
+REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [],
+    "UNAUTHENTICATED_USER": None,
+}
@@ -0,0 +1,46 @@
+from django.urls import path
+
+from django_react_admin.renderers import FastJSONRenderer
+from django_react_admin.views import DynamicModelViewSet
+
+V = DynamicModelViewSet
+
+
+class FastJSONViewSet(DynamicModelViewSet):
+    renderer_classes = [FastJSONRenderer]
+
+
+urlpatterns = [
+    path(
+        "api-fast/<str:app_label>/<str:model_name>/",
+        FastJSONViewSet.as_view({"get": "list"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/get_many/",
+        V.as_view({"post": "get_many", "get": "get_many"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/create_many/",
+        V.as_view({"post": "create_many"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/export_data/",
+        V.as_view({"get": "export_data"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/import_data/",
+        V.as_view({"post": "import_data"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/generate_id/",
+        V.as_view({"get": "generate_id_action", "post": "generate_id_action"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/",
+        V.as_view({"get": "list", "post": "create"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/<str:pk>/",
+        V.as_view({"get": "retrieve", "put": "update", "delete": "destroy"}),
+    ),
+]
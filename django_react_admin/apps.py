@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class DjangoReactAdminConfig(AppConfig):
+    name = "django_react_admin"
+    verbose_name = "Django React Admin"
+    default_auto_field = "django.db.models.AutoField"
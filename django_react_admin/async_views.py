@@ -0,0 +1,197 @@
+import asyncio
+import functools
+import time
+
+from asgiref.sync import async_to_sync, sync_to_async
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from .bulk import in_request_order
+from .counting import acount_queryset
+from .exports import aexport_rows, astream_csv
+from .instrumentation import record_queries, render_timed, server_timing
+from .metadata import get_descriptor
+from .views import DynamicModelViewSet
+
+
+class AsyncDynamicModelViewSet(DynamicModelViewSet):
+    """
+    DynamicModelViewSet for ASGI deployments.
+
+    list, retrieve, get_many and export_data are coroutines reading through
+    Django's async ORM; list runs its count on a separate connection while
+    the page is fetched (see counting.acount_queryset), so waiting on the
+    database no longer holds a worker thread. The other actions are the sync ones, run
+    in a thread. Route it like DynamicModelViewSet; ATOMIC_REQUESTS is not
+    supported by Django for async views.
+    """
+
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+
+        # dispatch() returns a coroutine; Django awaits views that are
+        # coroutine functions
+        async def async_view(request, *args, **kwargs):
+            return await view(request, *args, **kwargs)
+
+        functools.update_wrapper(async_view, view)
+        return async_view
+
+    def dispatch(self, request, *args, **kwargs):
+        return self._adispatch(request, *args, **kwargs)
+
+    async def _adispatch(self, request, *args, **kwargs):
+        # APIView.dispatch, awaiting async handlers and running the rest
+        # (authentication, permissions, sync actions) in a thread
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        if not self.instrument:
+            response = await self._ahandle(request, *args, **kwargs)
+            self.response = self.finalize_response(request, response, *args, **kwargs)
+            return self.response
+
+        start = time.perf_counter()
+        # The async ORM queries on the request's sync thread, so the wrappers
+        # go on that thread's connections; counts on separate connections
+        # (see acount_queryset) are not recorded
+        recording = record_queries()
+        recorder = await sync_to_async(recording.__enter__)()
+        try:
+            response = await self._ahandle(request, *args, **kwargs)
+            response = self.finalize_response(request, response, *args, **kwargs)
+            render = render_timed(response)
+        finally:
+            await sync_to_async(recording.__exit__)(None, None, None)
+        total = time.perf_counter() - start
+        self.response = response
+        if getattr(response, "streaming", False):
+            # See DynamicModelViewSet.dispatch
+            return response
+        response["Server-Timing"] = server_timing(recorder, total, render)
+        recorder.report_n_plus_one(f"{request.method} {request.path}")
+        return response
+
+    async def _ahandle(self, request, *args, **kwargs):
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            method = request.method.lower()
+            if method in self.http_method_names:
+                handler = getattr(self, method, self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            if asyncio.iscoroutinefunction(handler):
+                return await handler(request, *args, **kwargs)
+            return await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            return await sync_to_async(self.handle_exception)(exc)
+
+    async def _acached(self, request, Model, compute):
+        """_cached() for coroutine computes; cache lookups run in a thread."""
+        if not self._cache_timeout(Model):
+            return await compute()
+
+        async def run():
+            return await compute()
+
+        return await sync_to_async(self._cached)(
+            request, Model, lambda: async_to_sync(run)()
+        )
+
+    async def list(self, request, app_label=None, model_name=None):
+        Model = self.get_model(app_label, model_name)
+        return await self._acached(request, Model, lambda: self._alist(request, Model))
+
+    async def _alist(self, request, Model):
+        # Compiling filters can touch the database (search index checks)
+        query = await sync_to_async(self._list_query)(request, Model)
+        if isinstance(query, Response):
+            return query
+        count = None
+        if query.counts:
+            count = asyncio.ensure_future(
+                acount_queryset(
+                    query.queryset,
+                    query.count_strategy,
+                    self.count_cache_timeout,
+                    self.cache_alias,
+                )
+            )
+        try:
+            if query.by_cursor:
+                try:
+                    page, serialize = await sync_to_async(query.cursor_page)()
+                except ValueError as e:
+                    return Response(
+                        {"error": str(e)}, status=status.HTTP_400_BAD_REQUEST
+                    )
+                rows = None
+            else:
+                page = None
+                queryset, serialize = query.offset_page()
+                rows = [row async for row in queryset]
+            total_count = await count if count is not None else None
+        finally:
+            if count is not None and not count.done():
+                count.cancel()
+        return query.response(rows, serialize, total_count, page=page)
+
+    async def retrieve(self, request, pk=None, app_label=None, model_name=None):
+        Model = self.get_model(app_label, model_name)
+        return await self._acached(
+            request, Model, lambda: self._aretrieve(request, Model, pk)
+        )
+
+    async def _aretrieve(self, request, Model, pk):
+        query = self._detail_query(request, Model)
+        if isinstance(query, Response):
+            return query
+        queryset, serialize = query
+        try:
+            obj = await queryset.aget(pk=pk)
+        except Model.DoesNotExist:
+            return Response({"error": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(serialize(obj))
+
+    @action(detail=False, methods=["post", "get"])
+    async def get_many(self, request, app_label=None, model_name=None):
+        Model = self.get_model(app_label, model_name)
+        return await self._acached(
+            request, Model, lambda: self._aget_many(request, Model)
+        )
+
+    async def _aget_many(self, request, Model):
+        query = self._get_many_query(request, Model)
+        if isinstance(query, Response):
+            return query
+        querysets, serialize, pks = query
+        rows = [serialize(obj) for queryset in querysets async for obj in queryset]
+        return Response(in_request_order(rows, pks, get_descriptor(Model).pk_name))
+
+    @action(detail=False, methods=["get"])
+    async def export_data(self, request, app_label=None, model_name=None):
+        """
+        DynamicModelViewSet.export_data from an async iterator. ASGI servers
+        consume a sync iterator in one go, buffering the whole file.
+        """
+        Model = self.get_model(app_label, model_name)
+        fk_mode = request.GET.get("fk", "id")
+        if fk_mode not in ("id", "display"):
+            return Response(
+                {"error": "'fk' must be 'id' or 'display'"}, status=400
+            )
+        rows = aexport_rows(
+            Model.objects.all(), fk_mode=fk_mode, chunk_size=self.export_chunk_size
+        )
+
+        response = StreamingHttpResponse(astream_csv(rows), content_type="text/csv")
+        response["Content-Disposition"] = f"attachment; filename={model_name}.csv"
+        return response
@@ -0,0 +1,86 @@
+import copy
+import json
+from typing import Any, Dict, Tuple
+
+from django.http import QueryDict
+from rest_framework.request import Request
+
+# Read actions a batch may contain
+BATCH_ACTIONS = ("list", "retrieve", "get_many")
+# Largest number of sub-requests accepted in one batch
+MAX_BATCH_REQUESTS = 50
+# Response headers returned with each sub-request's result
+BATCH_HEADERS = ("Content-Range", "X-Next-Cursor", "X-Prev-Cursor", "ETag")
+# Request headers that describe the batch call itself, not its sub-requests
+_BATCH_ONLY_META = ("CONTENT_TYPE", "CONTENT_LENGTH", "HTTP_IF_NONE_MATCH")
+
+
+def parse_batch_item(item: Any) -> Tuple[str, str, str, Dict[str, Any]]:
+    """
+    Validate one sub-request, {"resource": "app_label/model_name", "action":
+    ..., "params": {...}}. Returns (app_label, model_name, action, params);
+    raises ValueError.
+    """
+    if not isinstance(item, dict):
+        raise ValueError("Each request must be an object")
+    resource = item.get("resource")
+    if not isinstance(resource, str) or resource.count("/") != 1:
+        raise ValueError("'resource' must be 'app_label/model_name'")
+    app_label, model_name = resource.split("/")
+    action = item.get("action")
+    if action not in BATCH_ACTIONS:
+        raise ValueError(f"'action' must be one of {', '.join(BATCH_ACTIONS)}")
+    params = item.get("params") or {}
+    if not isinstance(params, dict):
+        raise ValueError("'params' must be an object")
+    if action == "retrieve" and params.get("id") in (None, ""):
+        raise ValueError("retrieve needs an 'id' parameter")
+    if action == "get_many" and not isinstance(params.get("ids"), list):
+        raise ValueError("get_many needs an 'ids' list parameter")
+    return app_label, model_name, action, params
+
+
+def batch_key(app_label: str, model_name: str, action: str, params) -> str:
+    """Identical sub-requests share this key and run once."""
+    return json.dumps(
+        [app_label, model_name, action, params], sort_keys=True, default=str
+    )
+
+
+def batch_request(request: Request, params: Dict[str, Any]) -> Request:
+    """
+    A GET request carrying params as its query string, for running one
+    sub-request through the regular action. It shares the batch request's
+    user and headers (Unit-ID, ...), so authentication runs once per batch.
+    """
+    query = QueryDict(mutable=True)
+    for name, value in params.items():
+        if name in ("id", "ids"):
+            continue
+        query[name] = value if isinstance(value, str) else json.dumps(value)
+    if "ids" in params:
+        # get_many reads GET ids from the filter parameter
+        query["filter"] = json.dumps({"id": params["ids"]})
+    query._mutable = False
+
+    http_request = copy.copy(request._request)
+    # Drop cached properties derived from the copied request
+    for name in ("GET", "headers"):
+        http_request.__dict__.pop(name, None)
+    http_request.method = "GET"
+    http_request.GET = query
+    http_request.META = {
+        key: value for key, value in request.META.items() if key not in _BATCH_ONLY_META
+    }
+    http_request.META["QUERY_STRING"] = query.urlencode()
+
+    sub_request = Request(
+        http_request,
+        parsers=request.parsers,
+        authenticators=request.authenticators,
+        negotiator=request.negotiator,
+        parser_context=request.parser_context,
+    )
+    sub_request.user = request.user
+    sub_request.auth = request.auth
+    return sub_request
@@ -0,0 +1,104 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import F, Lookup
+
+# Rows per statement (and per transaction) for update_many and delete_many
+BULK_CHUNK_SIZE = 500
+# Ids per query for get_many, where the backend limits bind parameters
+GET_MANY_CHUNK_SIZE = 2000
+# Bind parameters kept free in a chunked query for the other conditions
+# (soft delete, unit, filters)
+PARAM_HEADROOM = 100
+
+
+def chunk_size_for(queryset, chunk_size: Optional[int]) -> int:
+    """
+    chunk_size bounded by the backend's bind parameter limit (999 on older
+    SQLite builds), so a chunk of ids always fits in one IN (...).
+    """
+    limit = connections[queryset.db].features.max_query_params
+    size = chunk_size or BULK_CHUNK_SIZE
+    return min(size, limit - PARAM_HEADROOM) if limit else size
+
+
+def unique_pks(model, ids: List[Any]) -> List[Any]:
+    """
+    ids converted with the model's primary key field, duplicates dropped,
+    first occurrence order kept. Raises ValidationError on a bad id.
+    """
+    pk_field = model._meta.pk
+    seen = set()
+    pks = []
+    for value in ids:
+        pk = pk_field.to_python(value)
+        if pk is None:
+            raise ValidationError("Ids must not be null.")
+        if pk not in seen:
+            seen.add(pk)
+            pks.append(pk)
+    return pks
+
+
+def id_chunks(pks: List[Any], size: int) -> Iterator[List[Any]]:
+    for start in range(0, len(pks), size):
+        yield pks[start : start + size]
+
+
+def queryset_chunks(queryset, size: int) -> Iterator[List[Any]]:
+    """
+    Primary keys of queryset in chunks of size, walking the primary key
+    index (pk > last seen) instead of OFFSET. Each chunk is read when the
+    previous one has been consumed, so rows changed by the caller in between
+    (no longer matching the filter) are simply skipped.
+    """
+    queryset = queryset.order_by("pk").values_list("pk", flat=True)
+    last = None
+    while True:
+        page = queryset if last is None else queryset.filter(pk__gt=last)
+        pks = list(page[:size])
+        if not pks:
+            return
+        yield pks
+        if len(pks) < size:
+            return
+        last = pks[-1]
+
+
+class AnyOf(Lookup):
+    """column = ANY(%s), binding a whole list as one array parameter."""
+
+    lookup_name = "any_of"
+    prepare_rhs = False
+
+    def get_db_prep_lookup(self, value, connection):
+        field = self.lhs.output_field
+        return "%s", [[field.get_db_prep_value(v, connection) for v in value]]
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} = ANY({rhs})", (*lhs_params, *rhs_params)
+
+
+def pk_lookups(queryset, pks: List[Any], chunk_size: int) -> List[Any]:
+    """
+    queryset narrowed to pks, as a list of querysets to run in turn.
+
+    PostgreSQL gets one query with the ids in a single array parameter, so
+    the statement is the same whatever the number of ids. Elsewhere the ids
+    are split into IN (...) lists that fit the bind parameter limit.
+    """
+    if not pks:
+        return []
+    if connections[queryset.db].vendor == "postgresql":
+        return [queryset.filter(AnyOf(F("pk"), pks))]
+    size = chunk_size_for(queryset, chunk_size)
+    return [queryset.filter(pk__in=chunk) for chunk in id_chunks(pks, size)]
+
+
+def in_request_order(rows: List[Dict[str, Any]], pks: List[Any], key: str):
+    """Serialized rows sorted like pks (by their key column); missing ones skipped."""
+    by_pk = {row[key]: row for row in rows}
+    return [by_pk[pk] for pk in pks if pk in by_pk]
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import time
+from typing import Any, Iterable, List, Optional, Tuple
+
+from django.core.cache import caches
+from django.db import transaction
+
+CACHE_PREFIX = "django_react_admin"
+# Response headers stored with a cached body
+CACHED_HEADERS = ("Content-Range", "X-Next-Cursor", "X-Prev-Cursor")
+
+
+def _version_key(model) -> str:
+    return f"{CACHE_PREFIX}:version:{model._meta.label_lower}"
+
+
+def model_versions(models: Iterable[Any], cache_alias: str = "default") -> List[int]:
+    """
+    Current version of each model's data, in one cache round trip.
+
+    A missing counter (never set, or evicted) starts at the current time in
+    nanoseconds rather than 0, so entries cached under an older incarnation
+    of the counter can never match again.
+    """
+    cache = caches[cache_alias]
+    keys = [_version_key(model) for model in models]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), None)
+            found[key] = cache.get(key)
+        versions.append(found[key])
+    return versions
+
+
+def bump_versions(models: Iterable[Any], cache_alias: str = "default"):
+    """
+    Invalidate every cached response built from models, in O(1) per model.
+
+    Runs once the current transaction commits, so a concurrent reader cannot
+    cache rows from before the write under the new version.
+    """
+    keys = {_version_key(model) for model in models}
+
+    def bump():
+        cache = caches[cache_alias]
+        for key in keys:
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.add(key, time.time_ns(), None)
+
+    transaction.on_commit(bump)
+
+
+def response_cache_key(request, models: List[Any], cache_alias: str = "default") -> str:
+    """
+    Cache key for a read request.
+
+    Covers the method, path and every query parameter (filter, sort, range,
+    meta with its embeds and fields), the JSON body of POST reads, the
+    Unit-ID header and the data version of every model the response is built
+    from, so any write to one of them yields a new key.
+    """
+    body = ""
+    if request.method == "POST":
+        body = json.dumps(request.data, sort_keys=True, default=str)
+    parts = {
+        "method": request.method,
+        "path": request.path,
+        "query": sorted(request.GET.lists()),
+        "body": body,
+        "unit": request.headers.get("Unit-ID"),
+        "versions": model_versions(models, cache_alias),
+    }
+    digest = hashlib.sha256(
+        json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+    return f"{CACHE_PREFIX}:response:{models[0]._meta.label_lower}:{digest}"
+
+
+def etag_for(key: str) -> str:
+    # The key already changes with every write, so it doubles as a strong ETag
+    return '"' + key.rsplit(":", 1)[-1][:40] + '"'
+
+
+def etag_matches(request, etag: str) -> bool:
+    """
+    Whether If-None-Match names etag (weak comparison). "*" is not honoured:
+    on these reads it would answer 304 without the client holding any copy.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return any(t == etag or t == "W/" + etag for t in tags)
+
+
+def get_cached_response(key: str, cache_alias: str = "default") -> Optional[Tuple]:
+    """Return (data, headers) stored for key, or None."""
+    return caches[cache_alias].get(key)
+
+
+def store_response(response, key: str, timeout: int, cache_alias: str = "default"):
+    headers = {name: response[name] for name in CACHED_HEADERS if name in response}
+    caches[cache_alias].set(key, (response.data, headers), timeout)
@@ -0,0 +1,157 @@
+import asyncio
+import contextvars
+import hashlib
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.db import close_old_connections, connections
+
+logger = logging.getLogger(__name__)
+
+EXACT = "exact"
+CACHED = "cached"
+ESTIMATE = "estimate"
+HAS_MORE = "has_more"
+
+COUNT_STRATEGIES = (EXACT, CACHED, ESTIMATE, HAS_MORE)
+
+# Below this planner estimate an exact count is cheap and more useful
+ESTIMATE_EXACT_THRESHOLD = 10000
+
+# Threads running the counts of async lists, each on a database connection
+# of its own so the count overlaps with the page query
+COUNT_WORKERS = 4
+
+
+def count_cache_key(queryset) -> str:
+    """
+    Cache key for a filtered queryset's count.
+
+    Keyed by the compiled WHERE clause and its bound parameters, i.e. by the
+    filter plan plus the request's values, so identical filters share a count.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.sha1(f"{sql}|{params!r}".encode("utf-8")).hexdigest()
+    return f"django_react_admin:count:{queryset.model._meta.label_lower}:{digest}"
+
+
+def cached_count(queryset, timeout: int = 60, cache_alias: str = "default") -> int:
+    cache = caches[cache_alias]
+    key = count_cache_key(queryset)
+    total = cache.get(key)
+    if total is None:
+        total = queryset.count()
+        cache.set(key, total, timeout)
+    return total
+
+
+def estimated_count(queryset, threshold: int = ESTIMATE_EXACT_THRESHOLD) -> int:
+    """
+    Row count from the query planner's estimate where the backend offers one
+    (PostgreSQL); small or unsupported results fall back to an exact count.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().query.sql_with_params()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+    except Exception:
+        logger.warning("Could not read planner estimate, counting exactly")
+        return queryset.count()
+    if estimate < threshold:
+        return queryset.count()
+    return estimate
+
+
+def count_queryset(
+    queryset, strategy: str = EXACT, timeout: int = 60, cache_alias: str = "default"
+) -> int:
+    """
+    Total for the Content-Range header using the given strategy; ``cached``
+    counts are kept in caches[cache_alias].
+
+    ``has_more`` is resolved by the caller from the page fetch itself and is
+    not handled here.
+    """
+    if strategy == CACHED:
+        return cached_count(queryset, timeout, cache_alias)
+    if strategy == ESTIMATE:
+        return estimated_count(queryset)
+    return queryset.count()
+
+
+_count_executor = None
+_count_executor_lock = threading.Lock()
+_count_worker = threading.local()
+
+
+def _get_count_executor() -> ThreadPoolExecutor:
+    global _count_executor
+    with _count_executor_lock:
+        if _count_executor is None:
+            _count_executor = ThreadPoolExecutor(
+                COUNT_WORKERS, thread_name_prefix="react-admin-count"
+            )
+        return _count_executor
+
+
+def _count_on_worker(queryset, strategy: str, timeout: int, cache_alias: str) -> int:
+    # A context per worker thread gives it connections of its own, kept
+    # between counts (subject to CONN_MAX_AGE like a request's)
+    context = getattr(_count_worker, "context", None)
+    if context is None:
+        context = _count_worker.context = contextvars.Context()
+    return context.run(_count_apart, queryset, strategy, timeout, cache_alias)
+
+
+def _count_apart(queryset, strategy: str, timeout: int, cache_alias: str) -> int:
+    close_old_connections()
+    try:
+        return count_queryset(queryset, strategy, timeout, cache_alias)
+    finally:
+        close_old_connections()
+
+
+def can_count_apart(using: str) -> bool:
+    """Whether a second connection would see the same rows as the caller's."""
+    connection = connections[using]
+    if connection.in_atomic_block:
+        # Rows written by the open transaction are invisible elsewhere
+        return False
+    return not (connection.vendor == "sqlite" and connection.is_in_memory_db())
+
+
+async def acount_queryset(
+    queryset, strategy: str = EXACT, timeout: int = 60, cache_alias: str = "default"
+) -> int:
+    """
+    count_queryset() for async views.
+
+    When it is safe, the count runs on a worker thread with its own
+    connection, so queries the caller awaits meanwhile (the page) run at the
+    same time; the async ORM would otherwise queue both on the request's
+    connection.
+    """
+    if can_count_apart(queryset.db):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_count_executor(),
+            _count_on_worker,
+            queryset,
+            strategy,
+            timeout,
+            cache_alias,
+        )
+    if strategy == EXACT:
+        return await queryset.acount()
+    return await sync_to_async(count_queryset)(queryset, strategy, timeout, cache_alias)
@@ -0,0 +1,194 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from django.db.models import Prefetch
+
+from .metadata import get_descriptor
+
+# Longest embed path accepted, e.g. "author.company.country"
+MAX_EMBED_DEPTH = 3
+# Rows embedded per parent row for a reverse (one-to-many) embed
+EMBED_LIMIT = 100
+
+
+class EmbedNode:
+    """
+    One embedded relation: a ForeignKey (forward) or the rows of another
+    model pointing at this one (reverse). children holds the embeds
+    requested below it, keyed like the response.
+    """
+
+    def __init__(self, key: str, model, field=None, rel=None):
+        self.key = key
+        self.model = model
+        self.field = field
+        self.rel = rel
+        self.children: Dict[str, "EmbedNode"] = {}
+
+    def __repr__(self):
+        return f"<EmbedNode {self.key}>"
+
+    @property
+    def is_reverse(self) -> bool:
+        return self.rel is not None
+
+    @property
+    def attr(self) -> str:
+        # Prefetched rows are stored here, leaving the related manager alone
+        return f"_embed_{self.key}"
+
+
+def _resolve(model, name: str) -> Optional[EmbedNode]:
+    """Resolve one path segment on model to an EmbedNode, or None."""
+    descriptor = get_descriptor(model)
+    # Handle both 'author' and 'author_id' formats
+    for candidate in (name, f"{name}_id"):
+        field = descriptor.relation_fields.get(candidate)
+        if field is not None and (field.many_to_one or field.one_to_one):
+            key = field.name[:-3] if field.name.endswith("_id") else field.name
+            return EmbedNode(key, field.related_model, field=field)
+    # Reverse relations go by accessor (related_name) or by model name, the
+    # same key nested writes use for child rows.
+    rel = descriptor.reverse_relations.get(name)
+    if rel is None:
+        for candidate in descriptor.reverse_relations.values():
+            if candidate.related_model._meta.model_name == name:
+                rel = candidate
+                break
+    if rel is not None:
+        return EmbedNode(name, rel.related_model, rel=rel)
+    return None
+
+
+def build_embed_tree(model, paths: List[Any]) -> Dict[str, EmbedNode]:
+    """
+    Turn embed paths such as ["author", "author.company", "lines"] into a
+    tree of EmbedNodes. Paths that do not resolve are ignored.
+    """
+    tree: Dict[str, EmbedNode] = {}
+    for path in paths:
+        if not isinstance(path, str) or not path:
+            continue
+        parts = path.split(".")
+        if len(parts) > MAX_EMBED_DEPTH:
+            continue
+        resolved = []
+        current = model
+        for part in parts:
+            node = _resolve(current, part)
+            if node is None:
+                break
+            resolved.append(node)
+            current = node.model
+        else:
+            nodes = tree
+            for node in resolved:
+                node = nodes.setdefault(node.key, node)
+                nodes = node.children
+    return tree
+
+
+def embed_fields(tree: Dict[str, EmbedNode]) -> List[str]:
+    """Names of the ForeignKeys a queryset must load to embed tree."""
+    return [node.field.name for node in tree.values() if not node.is_reverse]
+
+
+def _embed_limit(limits, path: str, default: int) -> Optional[int]:
+    if isinstance(limits, dict):
+        limit = limits.get(path, default)
+    elif limits is None:
+        limit = default
+    else:
+        limit = limits
+    if limit is None:
+        return None
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise ValueError(f"Embed limit for '{path}' must be a positive integer.")
+    return limit
+
+
+def _lookups(
+    tree: Dict[str, EmbedNode], prefix: str, path: str, limits, default: int
+) -> Tuple[List[str], List[Prefetch]]:
+    related: List[str] = []
+    prefetches: List[Prefetch] = []
+    for node in tree.values():
+        node_path = f"{path}{node.key}"
+        if node.is_reverse:
+            queryset = node.model._default_manager.all()
+            if get_descriptor(node.model).is_soft_delete:
+                queryset = queryset.filter(is_deleted=False)
+            queryset = apply_embeds(
+                queryset, node.children, limits, default, f"{node_path}."
+            ).order_by(node.model._meta.pk.name)
+            limit = _embed_limit(limits, node_path, default)
+            if limit:
+                # Sliced prefetches are limited per parent row in SQL
+                queryset = queryset[:limit]
+            prefetches.append(
+                Prefetch(
+                    prefix + node.rel.get_accessor_name(),
+                    queryset=queryset,
+                    to_attr=node.attr,
+                )
+            )
+        else:
+            lookup = prefix + node.field.name
+            related.append(lookup)
+            sub_related, sub_prefetches = _lookups(
+                node.children, f"{lookup}__", f"{node_path}.", limits, default
+            )
+            related.extend(sub_related)
+            prefetches.extend(sub_prefetches)
+    return related, prefetches
+
+
+def apply_embeds(
+    queryset,
+    tree: Dict[str, EmbedNode],
+    limits: Union[int, Dict[str, int], None] = None,
+    default_limit: int = EMBED_LIMIT,
+    path: str = "",
+):
+    """
+    Load everything tree embeds along with queryset.
+
+    ForeignKey chains are joined with select_related; reverse relations are
+    fetched with one Prefetch query each, at most ``limits`` rows per parent
+    (an int for all of them, or a dict keyed by embed path). The number of
+    queries depends on the embeds requested, not on the number of rows.
+    Raises ValueError for an invalid limit.
+    """
+    if not tree:
+        return queryset
+    related, prefetches = _lookups(tree, "", path, limits, default_limit)
+    if related:
+        queryset = queryset.select_related(*related)
+    if prefetches:
+        queryset = queryset.prefetch_related(*prefetches)
+    return queryset
+
+
+def embed_related(
+    data: Dict[str, Any], obj, tree: Dict[str, EmbedNode], to_dict: Callable
+):
+    """Add the embedded objects of obj to its serialized dict, in place."""
+    for node in tree.values():
+        if node.is_reverse:
+            rows = getattr(obj, node.attr, None)
+            if rows is None:
+                # Not prefetched (e.g. an object that was just saved)
+                rows = getattr(obj, node.rel.get_accessor_name()).all()
+            data[node.key] = [to_dict(row, embed=node.children) for row in rows]
+        else:
+            value = getattr(obj, node.field.name)
+            if value is not None:
+                data[node.key] = to_dict(value, embed=node.children)
+
+
+def embed_models(tree: Dict[str, EmbedNode]) -> List[Any]:
+    """Every model reached by tree, depth first."""
+    models = []
+    for node in tree.values():
+        models.append(node.model)
+        models.extend(embed_models(node.children))
+    return models
@@ -0,0 +1,167 @@
+import ast
+import json
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+
+from .metadata import get_descriptor
+from .search import get_search
+
+# Number of compiled (model, filter shape) plans kept per process
+FILTER_PLAN_CACHE_SIZE = 512
+
+SUPPORTED_OPERATIONS = frozenset(
+    ("like", "ilike", "gt", "lt", "not_eq", "in", "not_in", "isnull")
+)
+
+
+def parse_literal(value: Any) -> Any:
+    """
+    Parse a JSON/Python literal sent as a query string value, e.g. "[1, 2]".
+
+    Only literals are accepted (never arbitrary expressions); anything that
+    does not parse is returned unchanged.
+    """
+    if not isinstance(value, str):
+        return value
+    try:
+        return json.loads(value)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        return value
+
+
+def _like_lookup(field: str, value: Any) -> Q:
+    if isinstance(value, str) and "%" in value:
+        # Convert SQL-like % wildcards to Django's icontains/startswith/endswith
+        if value.startswith("%") and value.endswith("%"):
+            return Q(**{f"{field}__icontains": value.strip("%")})
+        if value.endswith("%"):
+            return Q(**{f"{field}__startswith": value.rstrip("%")})
+        if value.startswith("%"):
+            return Q(**{f"{field}__endswith": value.lstrip("%")})
+    # No usable % wildcards, treat as a plain contains
+    return Q(**{f"{field}__icontains": value})
+
+
+class FilterClause:
+    """A single compiled filter key; binds a request value into a Q object."""
+
+    __slots__ = ("key", "field", "op", "is_uuid", "search")
+
+    def __init__(self, key, field, op=None, is_uuid=False, search=None):
+        self.key = key
+        self.field = field
+        self.op = op
+        self.is_uuid = is_uuid
+        # Callable value -> Q for the ``q`` key (see search.py)
+        self.search = search
+
+    def coerce(self, value: Any) -> Any:
+        if isinstance(value, str) and value.startswith("[") and value.endswith("]"):
+            value = parse_literal(value)
+        if self.is_uuid:
+            try:
+                if isinstance(value, list):
+                    value = [UUID(str(v)) for v in value]
+                else:
+                    value = UUID(str(value))
+            except (ValueError, TypeError):
+                raise ValueError(f"'{value}' is not a valid UUID.")
+        return value
+
+    def bind(self, value: Any) -> Q:
+        value = self.coerce(value)
+        field, op = self.field, self.op
+        if self.key == "q":
+            return self.search(value)
+        if op is None:
+            return Q(**{field: value})
+        if op in ("like", "ilike"):
+            return _like_lookup(field, value)
+        if op == "gt":
+            return Q(**{f"{field}__gt": value})
+        if op == "lt":
+            return Q(**{f"{field}__lt": value})
+        if op == "not_eq":
+            return ~Q(**{field: value})
+        if op in ("in", "not_in"):
+            if not isinstance(value, list):
+                raise ValueError(f"Value for '{op}' operation must be a list.")
+            lookup = Q(**{f"{field}__in": value})
+            return lookup if op == "in" else ~lookup
+        # isnull
+        return Q(**{f"{field}__isnull": bool(value)})
+
+
+class FilterPlan:
+    """
+    Validated, reusable form of a react-admin filter for one model.
+
+    A plan only depends on the filter's shape (its keys and ``|op=``
+    operators), so it is compiled once and cached; request values are bound
+    with :meth:`bind`.
+    """
+
+    def __init__(self, model, clauses: Tuple[FilterClause, ...]):
+        self.model = model
+        self.clauses = clauses
+        self.key = (model._meta.label_lower,) + tuple(c.key for c in clauses)
+
+    def bind(self, filters: Dict[str, Any]) -> Q:
+        q = Q()
+        for clause in self.clauses:
+            q &= clause.bind(filters[clause.key])
+        return q
+
+
+def _validate_lookup(model, lookup: str):
+    root = lookup.split("__", 1)[0]
+    if root == "pk":
+        return
+    try:
+        model._meta.get_field(root)
+    except FieldDoesNotExist:
+        raise ValueError(f"Unknown filter field '{root}'.")
+
+
+def _compile_clause(model, key: str) -> FilterClause:
+    descriptor = get_descriptor(model)
+    if key == "q":
+        return FilterClause(key, None, search=get_search(model))
+
+    field_part = key.split("|")[0]
+    field = descriptor.get_field(field_part)
+    is_uuid = bool(field and field.get_internal_type() == "UUIDField")
+
+    if "|op=" in key:
+        name, op = key.split("|op=", 1)
+        if op not in SUPPORTED_OPERATIONS:
+            raise ValueError(f"Unsupported operation '{op}' for field '{name}'.")
+        _validate_lookup(model, name)
+        return FilterClause(key, name, op, is_uuid)
+
+    _validate_lookup(model, key)
+    return FilterClause(key, key, None, is_uuid)
+
+
+@lru_cache(maxsize=FILTER_PLAN_CACHE_SIZE)
+def _compile_filter_plan(model, keys: Tuple[str, ...]) -> FilterPlan:
+    return FilterPlan(model, tuple(_compile_clause(model, key) for key in keys))
+
+
+def compile_filter_plan(model, keys: Iterable[str]) -> FilterPlan:
+    """Return the cached FilterPlan for model and the given filter keys."""
+    return _compile_filter_plan(model, tuple(sorted(keys)))
+
+
+def parse_filter_param(filter_str: Optional[str]) -> Dict[str, Any]:
+    """Decode the ``filter`` query parameter, returning {} when it is unusable."""
+    filters = parse_literal(filter_str or "{}")
+    return filters if isinstance(filters, dict) else {}
@@ -0,0 +1,217 @@
+import codecs
+import csv
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+
+from .metadata import get_descriptor
+from .relations import find_missing_references
+
+# Rows inserted per bulk_create / savepoint
+IMPORT_BATCH_SIZE = 500
+# Per-row errors kept in the response; further failures are only counted
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportResult:
+    """
+    Running totals and per-row error reports for one import.
+
+    Errors are held until the batch their rows belong to has been inserted
+    (see flush_errors), so coercion errors, found while reading, and database
+    errors, found when the batch is written, are reported in row order.
+    """
+
+    def __init__(self):
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Any]] = []
+        self.pending: List[Dict[str, Any]] = []
+        self.started = time.monotonic()
+
+    def add_error(self, row: int, errors: Dict[str, Any]):
+        self.failed += 1
+        self.pending.append({"row": row, "errors": errors})
+
+    def flush_errors(self):
+        self.pending.sort(key=lambda error: error["row"])
+        room = MAX_REPORTED_ERRORS - len(self.errors)
+        self.errors.extend(self.pending[: max(room, 0)])
+        self.pending = []
+
+    def as_dict(self) -> Dict[str, Any]:
+        elapsed = time.monotonic() - self.started
+        return {
+            "message": (
+                "Imported successfully"
+                if not self.failed
+                else f"Imported with {self.failed} failed rows"
+            ),
+            "rows": self.rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "elapsed": round(elapsed, 3),
+            "rows_per_second": round(self.rows / elapsed, 1) if elapsed else None,
+        }
+
+
+def iter_csv_rows(
+    file, encoding: str = "utf-8-sig"
+) -> Iterator[Tuple[int, List[str], Dict[str, str]]]:
+    """
+    Decode an uploaded file line by line and yield (line_number, header, row).
+
+    Only one line is held in memory at a time; the default encoding also
+    strips a UTF-8 byte order mark.
+    """
+    reader = csv.DictReader(codecs.iterdecode(file, encoding))
+    for row in reader:
+        yield reader.line_num, reader.fieldnames, row
+
+
+def unknown_columns(model, header: Iterable[str]) -> List[str]:
+    """Header names that are neither a field name nor a field attname."""
+    descriptor = get_descriptor(model)
+    return [
+        name
+        for name in header
+        if name not in descriptor.field_names
+        and descriptor.get_field_by_attname(name) is None
+    ]
+
+
+def coerce_row(model, row: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Convert CSV strings into model field values.
+
+    ForeignKeys are assigned by attname so no related rows are loaded. Empty
+    cells become NULL on nullable fields and fall back to the field default
+    otherwise. Raises ValidationError with a field -> messages dict.
+    """
+    descriptor = get_descriptor(model)
+    values: Dict[str, Any] = {}
+    errors: Dict[str, List[str]] = {}
+    for name, raw in row.items():
+        if name is None:
+            # csv.DictReader collects surplus cells under a None key
+            errors["non_field_errors"] = ["Row has more values than the header."]
+            continue
+        field = descriptor.get_field(name) or descriptor.get_field_by_attname(name)
+        if raw is None or raw == "":
+            if field.null:
+                values[field.attname] = None
+                continue
+            if field.has_default():
+                continue
+            raw = ""
+        try:
+            if field.is_relation:
+                value = field.target_field.to_python(raw)
+            elif field.name in descriptor.json_fields:
+                try:
+                    value = json.loads(raw)
+                except ValueError:
+                    value = raw
+            else:
+                value = field.to_python(raw)
+        except ValidationError as e:
+            errors[field.name] = e.messages
+            continue
+        values[field.attname] = value
+    if errors:
+        raise ValidationError(errors)
+    return values
+
+
+def _reject_missing_references(model, batch, result: ImportResult):
+    """
+    Drop rows pointing at missing related rows, reporting each of them.
+
+    ForeignKey constraints are usually deferred to COMMIT, where a savepoint
+    can no longer isolate the offending row, so they are checked up front
+    with one query per ForeignKey field.
+    """
+    descriptor = get_descriptor(model)
+    attnames = [f.attname for f in descriptor.relation_fields.values()]
+    if not attnames:
+        return batch
+    rows = [{name: getattr(obj, name) for name in attnames} for _, obj in batch]
+    missing = find_missing_references(model, rows)
+    if not missing:
+        return batch
+    kept = []
+    for line, obj in batch:
+        errors = {}
+        for name, ids in missing.items():
+            value = getattr(obj, descriptor.relation_fields[name].attname)
+            if value in ids:
+                errors[name] = [f"Related object '{value}' does not exist."]
+        if errors:
+            result.add_error(line, errors)
+        else:
+            kept.append((line, obj))
+    return kept
+
+
+def _insert_batch(model, batch: List[Tuple[int, Any]], result: ImportResult):
+    batch = _reject_missing_references(model, batch, result)
+    if not batch:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.bulk_create([obj for _, obj in batch])
+        result.imported += len(batch)
+        return
+    except DatabaseError:
+        pass
+    # Something in the batch was rejected: retry row by row to report it
+    for line, obj in batch:
+        try:
+            with transaction.atomic():
+                model.objects.bulk_create([obj])
+            result.imported += 1
+        except DatabaseError as e:
+            result.add_error(line, {"non_field_errors": [str(e)]})
+
+
+def import_csv(
+    model, file, batch_size: int = IMPORT_BATCH_SIZE, encoding: str = "utf-8-sig"
+) -> ImportResult:
+    """
+    Import an uploaded CSV into model.
+
+    Rows are decoded incrementally, coerced with the model's field metadata
+    and inserted with one bulk_create per batch, each inside its own
+    savepoint. Rows that fail coercion or are rejected by the database are
+    reported individually; the remaining rows are still imported.
+    """
+    result = ImportResult()
+    batch: List[Tuple[int, Any]] = []
+    checked_header = False
+    with transaction.atomic():
+        for line, header, row in iter_csv_rows(file, encoding):
+            if not checked_header:
+                unknown = unknown_columns(model, header)
+                if unknown:
+                    raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+                checked_header = True
+            result.rows += 1
+            try:
+                values = coerce_row(model, row)
+            except ValidationError as e:
+                result.add_error(line, e.message_dict)
+                continue
+            batch.append((line, model(**values)))
+            if len(batch) >= batch_size:
+                _insert_batch(model, batch, result)
+                result.flush_errors()
+                batch = []
+        if batch:
+            _insert_batch(model, batch, result)
+        result.flush_errors()
+    return result
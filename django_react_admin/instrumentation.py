@@ -0,0 +1,127 @@
+import logging
+import os
+import time
+import traceback
+from contextlib import ExitStack, contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Identical SQL (same text, any parameters) run this often in one request is
+# reported as a likely N+1
+N_PLUS_ONE_THRESHOLD = 5
+
+# Frames from these paths are skipped when looking for the caller
+_LIBRARY_PATHS = tuple(
+    os.path.dirname(__import__(name).__file__) + os.sep
+    for name in ("django", "rest_framework")
+) + (os.path.abspath(__file__),)
+
+
+def _call_site() -> Optional[traceback.FrameSummary]:
+    """Innermost frame outside Django, DRF and this module."""
+    for frame in reversed(traceback.extract_stack()):
+        if not frame.filename.startswith(_LIBRARY_PATHS):
+            return frame
+    return None
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper timing every query of a block of code.
+
+    Install it with ``connection.execute_wrapper(recorder)`` (or use
+    record_queries()); it works without DEBUG and costs one perf_counter()
+    pair per query. Repeated identical statements are reported once as a
+    possible N+1 with the code that issued them.
+    """
+
+    def __init__(self, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD):
+        self.threshold = n_plus_one_threshold
+        self.queries: List[Tuple[str, float]] = []
+        self.duration = 0.0
+        self.repeats: Dict[str, int] = {}
+        self.n_plus_one: List[Tuple[str, int, Optional[traceback.FrameSummary]]] = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.duration += elapsed
+            self.queries.append((sql, elapsed))
+            seen = self.repeats.get(sql, 0) + 1
+            self.repeats[sql] = seen
+            if seen == self.threshold:
+                self.n_plus_one.append((sql, seen, _call_site()))
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    def report_n_plus_one(self, label: str = ""):
+        for sql, _, site in self.n_plus_one:
+            where = f"{site.filename}:{site.lineno} in {site.name}" if site else "?"
+            logger.warning(
+                "Possible N+1%s: %d identical queries from %s: %s",
+                f" in {label}" if label else "",
+                self.repeats[sql],
+                where,
+                sql,
+            )
+
+
+@contextmanager
+def record_queries(using=None, n_plus_one_threshold: int = N_PLUS_ONE_THRESHOLD):
+    """Record the queries run on every connection (or only using) in the block."""
+    recorder = QueryRecorder(n_plus_one_threshold)
+    aliases = [using] if using else list(connections)
+    with ExitStack() as stack:
+        for alias in aliases:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        yield recorder
+
+
+def render_timed(response) -> float:
+    """Render a not yet rendered response now; returns the seconds it took."""
+    if not hasattr(response, "render") or response.is_rendered:
+        return 0.0
+    start = time.perf_counter()
+    response.render()
+    return time.perf_counter() - start
+
+
+def server_timing(recorder: QueryRecorder, total: float, render: float) -> str:
+    """Server-Timing header value; durations in milliseconds."""
+    return ", ".join(
+        (
+            f'db;dur={recorder.duration * 1000:.1f};desc="{recorder.count} queries"',
+            f"serialize;dur={render * 1000:.1f}",
+            f"total;dur={total * 1000:.1f}",
+        )
+    )
+
+
+@contextmanager
+def max_queries(limit: int, using=None):
+    """
+    Test helper: fail when the block runs more than limit queries.
+
+    Unlike assertNumQueries it sets a ceiling rather than an exact count,
+    which suits per-action query budgets::
+
+        with max_queries(4):
+            client.get("/api/shop/order/?range=[0,99]")
+    """
+    with record_queries(using) as recorder:
+        yield recorder
+    if recorder.count > limit:
+        statements = "\n".join(
+            f"{i}. {sql}" for i, (sql, _) in enumerate(recorder.queries, 1)
+        )
+        raise AssertionError(
+            f"{recorder.count} queries executed, budget is {limit}:\n{statements}"
+        )
@@ -0,0 +1,54 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from django_react_admin.metadata import get_descriptor
+from django_react_admin.search import (
+    FULLTEXT,
+    drop_search_index,
+    ensure_search_index,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Create the full-text search index used by the 'q' filter for models "
+        "with ReactAdmin.search_backend = 'fulltext', or for the given models."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "models", nargs="*", help="Models as app_label.ModelName (optional)."
+        )
+        parser.add_argument(
+            "--drop", action="store_true", help="Remove the index instead."
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        if options["models"]:
+            try:
+                models = [apps.get_model(label) for label in options["models"]]
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+        else:
+            models = [
+                model
+                for model in apps.get_models()
+                if get_descriptor(model).option("search_backend") == FULLTEXT
+            ]
+
+        using = options["database"]
+        for model in models:
+            if options["drop"]:
+                drop_search_index(model, using)
+                self.stdout.write(f"Dropped search index for {model._meta.label}")
+            elif ensure_search_index(model, using):
+                self.stdout.write(f"Indexed {model._meta.label}")
+            else:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"{model._meta.label}: no full-text support on this "
+                        "database, 'q' keeps using icontains"
+                    )
+                )
@@ -0,0 +1,160 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from django.apps import apps
+
+# Internal types grouped by how the viewset treats them
+FILE_FIELD_TYPES = ("FileField", "ImageField")
+JSON_FIELD_TYPES = ("JSONField",)
+
+
+class ModelDescriptor:
+    """
+    Field metadata for a model, computed once and shared by every request.
+
+    The viewset used to rebuild field name lists and scan ``_meta.fields`` for
+    each row it touched; everything it needs is derived here up front.
+    """
+
+    def __init__(self, model):
+        opts = model._meta
+        self.model = model
+        self.label = opts.label_lower
+        self.pk_name = opts.pk.name
+        self.fields = tuple(opts.fields)
+        self.field_names = frozenset(f.name for f in self.fields)
+        self.fields_by_name = {f.name: f for f in self.fields}
+        self.fields_by_attname = {f.attname: f for f in self.fields}
+        self.relation_fields = {f.name: f for f in self.fields if f.is_relation}
+        # One-to-many relations pointing at this model, by accessor name
+        self.reverse_relations = {
+            rel.get_accessor_name(): rel
+            for rel in opts.related_objects
+            if rel.one_to_many
+        }
+        self.fk_targets = {
+            name: f.related_model for name, f in self.relation_fields.items()
+        }
+        self.uuid_fk_fields = frozenset(
+            name
+            for name, f in self.relation_fields.items()
+            if f.foreign_related_fields[0].get_internal_type() == "UUIDField"
+        )
+        self.char_fields = tuple(
+            f.name for f in self.fields if f.get_internal_type() == "CharField"
+        )
+        self.file_fields = frozenset(
+            f.name for f in self.fields if f.get_internal_type() in FILE_FIELD_TYPES
+        )
+        self.json_fields = frozenset(
+            f.name for f in self.fields if f.get_internal_type() in JSON_FIELD_TYPES
+        )
+
+        # Column used to label rows of this model when shown as a relation
+        self.display_field = getattr(
+            opts,
+            "verbose_name_field",
+            "name" if "name" in self.field_names else self.fields[0].name,
+        )
+
+        # Optional per-model settings declared on an inner ``ReactAdmin`` class
+        config = getattr(model, "ReactAdmin", None)
+        self.options: Dict[str, Any] = {}
+        if config is not None:
+            self.options = {
+                name: getattr(config, name)
+                for name in dir(config)
+                if not name.startswith("_")
+            }
+
+        # Behaviour flags, kept as hasattr checks to match the viewset semantics
+        self.is_soft_delete = hasattr(model, "is_deleted")
+        self.has_is_active = hasattr(model, "is_active")
+        self.has_unit_id = hasattr(model, "unit_id")
+
+        self._fk_to: Dict[Any, Optional[str]] = {}
+        self._children: Dict[Tuple[str, str], Optional[Tuple[Any, str]]] = {}
+
+    def __repr__(self):
+        return f"<ModelDescriptor {self.label}>"
+
+    def has_field(self, name: str) -> bool:
+        return name in self.field_names
+
+    def get_field(self, name: str):
+        return self.fields_by_name.get(name)
+
+    def get_field_by_attname(self, attname: str):
+        return self.fields_by_attname.get(attname)
+
+    def option(self, name: str, default: Any = None) -> Any:
+        """Return a ``ReactAdmin`` setting declared on the model, or default."""
+        return self.options.get(name, default)
+
+    def foreign_key_to(self, parent_model) -> Optional[str]:
+        """
+        Return the name of the first ForeignKey on this model pointing to
+        parent_model, or None.
+        """
+        try:
+            return self._fk_to[parent_model]
+        except KeyError:
+            pass
+        fk_name = None
+        for name, field in self.relation_fields.items():
+            if field.related_model == parent_model:
+                fk_name = name
+                break
+        self._fk_to[parent_model] = fk_name
+        return fk_name
+
+    def child_relation(self, app_label: str, key: str):
+        """
+        Resolve a list-valued payload key to a child table.
+
+        Returns ``(child_model, fk_field_name)`` when ``key`` names a model in
+        ``app_label`` that has a ForeignKey to this model, otherwise None.
+        """
+        cache_key = (app_label, key)
+        try:
+            return self._children[cache_key]
+        except KeyError:
+            pass
+        relation = None
+        try:
+            child_model = apps.get_model(app_label, key)
+        except (LookupError, ValueError):
+            child_model = None
+        if child_model is not None:
+            fk_name = get_descriptor(child_model).foreign_key_to(self.model)
+            if fk_name:
+                relation = (child_model, fk_name)
+        # Payload keys are client controlled, so only remember lookups that
+        # are bounded by the schema: real child tables and this model's fields.
+        if relation is not None or key in self.field_names:
+            self._children[cache_key] = relation
+        return relation
+
+
+_descriptors: Dict[Any, ModelDescriptor] = {}
+_descriptors_lock = threading.Lock()
+
+
+def get_descriptor(model) -> ModelDescriptor:
+    """Return the shared ModelDescriptor for model, building it on first use."""
+    try:
+        return _descriptors[model]
+    except KeyError:
+        pass
+    with _descriptors_lock:
+        descriptor = _descriptors.get(model)
+        if descriptor is None:
+            descriptor = ModelDescriptor(model)
+            _descriptors[model] = descriptor
+    return descriptor
+
+
+def clear_descriptors():
+    """Drop every cached descriptor, e.g. after models are reloaded."""
+    with _descriptors_lock:
+        _descriptors.clear()
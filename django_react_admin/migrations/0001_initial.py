@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 16:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IdSequence',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_label', models.CharField(max_length=100)),
+                ('column', models.CharField(max_length=100)),
+                ('scope', models.CharField(max_length=64)),
+                ('period', models.CharField(blank=True, default='', max_length=7)),
+                ('last_value', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('model_label', 'column', 'scope', 'period'), name='django_react_admin_idsequence_unique')],
+            },
+        ),
+    ]
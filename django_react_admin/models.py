@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class IdSequence(models.Model):
+    """
+    Last number handed out by generate_human_readable_id for one sequence.
+
+    A sequence is identified by the model, the column, a hash of the prefix
+    and conditions (scope) and the current period ("" or e.g. "2025" or
+    "2025-03" for yearly/monthly resets).
+    """
+
+    model_label = models.CharField(max_length=100)
+    column = models.CharField(max_length=100)
+    scope = models.CharField(max_length=64)
+    period = models.CharField(max_length=7, blank=True, default="")
+    last_value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["model_label", "column", "scope", "period"],
+                name="django_react_admin_idsequence_unique",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.model_label}.{self.column} [{self.period}] = {self.last_value}"
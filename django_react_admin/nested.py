@@ -0,0 +1,369 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.core.exceptions import ValidationError
+from django.db import connections, router
+from django.db.models import Field, Model
+
+from .metadata import get_descriptor
+
+# Rows per INSERT when bulk creating child tables
+NESTED_BATCH_SIZE = 500
+
+
+def split_payload(model, data: Dict[str, Any], app_label: str, drop_blobs=True):
+    """
+    Split a nested payload into the row's own values and its child tables.
+
+    List values whose key names a model in app_label with a ForeignKey to
+    model are child records. Returns (row, children) where children is a list
+    of (child_model, fk_field_name, records). With drop_blobs, values holding
+    browser-only ``blob:`` URLs are left out of the row.
+    """
+    descriptor = get_descriptor(model)
+    row: Dict[str, Any] = {}
+    children = []
+    for k, v in data.items():
+        relation = (
+            descriptor.child_relation(app_label, k) if isinstance(v, list) else None
+        )
+        if relation:
+            child_model, fk_field = relation
+            children.append((child_model, fk_field, v))
+        elif not drop_blobs or v is None or "blob:" not in str(v):
+            row[k] = v
+    return row, children
+
+
+def validate_rows(model, objs: List[Any]):
+    """
+    Field and model validation for rows about to be bulk inserted.
+
+    Relation existence and uniqueness are left to the database constraints:
+    checking them in Python costs one query per row and field.
+    """
+    descriptor = get_descriptor(model)
+    exclude = list(descriptor.relation_fields)
+    for obj in objs:
+        obj.clean_fields(exclude=exclude)
+        obj.clean()
+
+
+def clean_relation_fields(obj, names=None) -> Dict[str, List[str]]:
+    """
+    Errors of obj's ForeignKeys (all, or those in names) from their
+    blank/null checks and validators. ForeignKey.validate's lookup of the
+    related row (one query per field) is skipped: the ids of a whole request
+    are checked together (see ReferenceCheck, find_missing_references).
+    """
+    descriptor = get_descriptor(type(obj))
+    errors: Dict[str, List[str]] = {}
+    for name, field in descriptor.relation_fields.items():
+        if names is not None and name not in names:
+            continue
+        raw_value = getattr(obj, field.attname)
+        if field.blank and raw_value in field.empty_values:
+            continue
+        try:
+            value = field.to_python(raw_value)
+            # Field.validate, skipping ForeignKey.validate's database lookup
+            Field.validate(field, value, obj)
+            field.run_validators(value)
+        except ValidationError as e:
+            errors[name] = e.messages
+    return errors
+
+
+def validate_root(obj):
+    """
+    full_clean() for a row saved on its own, minus the ForeignKey existence
+    lookups; ReferenceCheck verifies the ids for the whole request, reporting
+    them like those of child rows.
+    """
+    descriptor = get_descriptor(type(obj))
+    errors = clean_relation_fields(obj)
+    try:
+        obj.full_clean(exclude=list(descriptor.relation_fields))
+    except ValidationError as e:
+        errors = e.update_error_dict(errors)
+    if errors:
+        raise ValidationError(errors)
+
+
+def clean_changed_fields(obj, changed: List[str]):
+    """
+    clean_fields() (max_length, choices, validators) for the fields an update
+    changed; the others keep what is stored. Raises ValidationError with a
+    field -> messages dict.
+    """
+    descriptor = get_descriptor(type(obj))
+    errors = clean_relation_fields(obj, changed)
+    exclude = [
+        field.name
+        for field in descriptor.fields
+        if field.name not in changed or field.is_relation
+    ]
+    try:
+        obj.clean_fields(exclude=exclude)
+    except ValidationError as e:
+        errors.update(e.message_dict)
+    if errors:
+        raise ValidationError(errors)
+
+
+def bulk_insert(
+    model, objs: List[Any], need_pks: bool, batch_size: int = NESTED_BATCH_SIZE
+):
+    """
+    Insert objs with as few statements as the backend allows.
+
+    When primary keys are needed afterwards (to attach grandchildren) and the
+    backend cannot return them from a bulk INSERT, rows without a preset pk
+    are saved one by one instead.
+    """
+    features = connections[router.db_for_write(model)].features
+    # Multi-table inheritance cannot be bulk inserted; models can also opt
+    # out (e.g. when they rely on a custom save()) with
+    # ReactAdmin.bulk_nested_create = False.
+    can_bulk = not model._meta.parents and get_descriptor(model).option(
+        "bulk_nested_create", True
+    )
+    if can_bulk and need_pks and not features.can_return_rows_from_bulk_insert:
+        can_bulk = all(obj.pk is not None for obj in objs)
+    if can_bulk:
+        model.objects.bulk_create(objs, batch_size=batch_size)
+    else:
+        for obj in objs:
+            obj.save(force_insert=True)
+
+
+def build_row(
+    model, data, app_label, prepare=None, drop_blobs=True, parent=None, fk_field=None
+):
+    """Build an unsaved instance from a payload; returns (obj, children)."""
+    row, children = split_payload(model, data, app_label, drop_blobs)
+    if prepare:
+        prepare(model, row)
+    if parent is not None:
+        row[fk_field] = parent
+    return model(**row), children
+
+
+def insert_levels(
+    level: List[Tuple[Any, list]],
+    app_label: str,
+    prepare=None,
+    drop_blobs: bool = True,
+    batch_size: int = NESTED_BATCH_SIZE,
+):
+    """
+    Insert the child records of already saved parents, breadth first.
+
+    level is a list of (parent_obj, children) as returned by split_payload.
+    Every level of the tree costs one bulk_create per child model.
+    """
+    while level:
+        groups: Dict[Any, List[Tuple[Any, list]]] = {}
+        for parent, children in level:
+            for child_model, fk_field, records in children:
+                for record in records:
+                    groups.setdefault(child_model, []).append(
+                        build_row(
+                            child_model,
+                            record,
+                            app_label,
+                            prepare,
+                            drop_blobs,
+                            parent,
+                            fk_field,
+                        )
+                    )
+        level = []
+        for child_model, entries in groups.items():
+            objs = [obj for obj, _ in entries]
+            validate_rows(child_model, objs)
+            need_pks = any(grandchildren for _, grandchildren in entries)
+            bulk_insert(child_model, objs, need_pks, batch_size)
+            level.extend(entry for entry in entries if entry[1])
+
+
+def nested_create(
+    model,
+    data: Dict[str, Any],
+    app_label: str,
+    prepare: Optional[Callable[[Any, Dict[str, Any]], None]] = None,
+    drop_blobs: bool = True,
+    batch_size: int = NESTED_BATCH_SIZE,
+):
+    """
+    Create a row and its nested child records, breadth first.
+
+    The root row is validated (see validate_root) and saved on its own. Below
+    it, each level of the payload tree is inserted with one bulk_create per
+    child model, with the parent ForeignKey taken from the level above; a
+    master/detail form with hundreds of lines costs a handful of statements
+    instead of one INSERT per line.
+
+    ``prepare(model, row)`` is called for every row before it is built, to
+    stamp audit columns or resolve relations in place.
+    """
+    root, children = build_row(model, data, app_label, prepare, drop_blobs)
+    validate_root(root)
+    root.save()
+    insert_levels([(root, children)], app_label, prepare, drop_blobs, batch_size)
+    return root
+
+
+# Columns stamped on every update; a row whose only changes are these is
+# left untouched.
+AUDIT_FIELDS = frozenset(("updated_at", "updated_by"))
+
+
+def apply_changes(obj, row: Dict[str, Any]) -> List[str]:
+    """
+    Assign row onto obj and return the names of the fields that changed.
+
+    Values are converted with the field's to_python() before comparing, so
+    "5" sent for an IntegerField holding 5 is not a change. ForeignKeys are
+    compared on their raw id and never load the related row.
+    """
+    descriptor = get_descriptor(type(obj))
+    changed = []
+    for key, value in row.items():
+        field = descriptor.get_field(key) or descriptor.get_field_by_attname(key)
+        if field is None or field.primary_key:
+            continue
+        try:
+            if field.is_relation:
+                if isinstance(value, Model):
+                    value = value.pk
+                if value is not None:
+                    value = field.target_field.to_python(value)
+            elif value is not None:
+                value = field.to_python(value)
+        except ValidationError as e:
+            raise ValidationError({field.name: e.messages})
+        if getattr(obj, field.attname) != value:
+            setattr(obj, field.attname, value)
+            changed.append(field.name)
+    return changed
+
+
+def bulk_update_changed(
+    model, changes: List[Tuple[Any, List[str]]], batch_size: int = NESTED_BATCH_SIZE
+) -> int:
+    """
+    Write (obj, changed_field_names) pairs with bulk_update.
+
+    Rows are grouped by their set of changed fields so each UPDATE only
+    touches the columns that actually differ. Returns the number of rows.
+    """
+    groups: Dict[Tuple[str, ...], List[Any]] = {}
+    for obj, fields in changes:
+        if fields:
+            groups.setdefault(tuple(sorted(fields)), []).append(obj)
+    updated = 0
+    for fields, objs in groups.items():
+        model.objects.bulk_update(objs, fields, batch_size=batch_size)
+        updated += len(objs)
+    return updated
+
+
+def sync_children(
+    level: List[Tuple[Any, list]],
+    app_label: str,
+    prepare_update=None,
+    prepare_create=None,
+    batch_size: int = NESTED_BATCH_SIZE,
+):
+    """
+    Bring the child tables of saved parents in line with a nested payload.
+
+    level is a list of (parent_obj, children) as returned by split_payload.
+    Per child model and tree level this costs one SELECT for the existing
+    rows (plus one for rows moved in from another parent, if any), one
+    DELETE for rows missing from the payload, one UPDATE per distinct set of
+    changed fields and batch, and one INSERT per batch of new rows, no matter
+    how many rows the payload holds. Records with a primary key are updated,
+    the others are created through insert_levels().
+    """
+    pending_creates: List[Tuple[Any, list]] = []
+    while level:
+        groups: Dict[Tuple[Any, str], Tuple[List[Any], List[Tuple[Any, Any]]]] = {}
+        for parent, children in level:
+            for child_model, fk_field, records in children:
+                parent_pks, entries = groups.setdefault(
+                    (child_model, fk_field), ([], [])
+                )
+                parent_pks.append(parent.pk)
+                entries.extend((parent, record) for record in records)
+
+        level = []
+        for (child_model, fk_field), (parent_pks, entries) in groups.items():
+            descriptor = get_descriptor(child_model)
+            pk_field = child_model._meta.pk
+            fk_attname = descriptor.relation_fields[fk_field].attname
+            siblings = child_model.objects.filter(**{f"{fk_attname}__in": parent_pks})
+            existing = {obj.pk: obj for obj in siblings}
+
+            def record_pk(record):
+                value = record.get(descriptor.pk_name)
+                return pk_field.to_python(value) if value else None
+
+            # Rows re-parented from elsewhere are fetched in one extra query
+            moved = {record_pk(r) for _, r in entries} - set(existing) - {None}
+            if moved:
+                existing.update(child_model.objects.in_bulk(list(moved)))
+
+            kept = []
+            changes = []
+            creates = []
+            for parent, record in entries:
+                current = existing.get(record_pk(record))
+                if current is None:
+                    creates.append(
+                        build_row(
+                            child_model,
+                            record,
+                            app_label,
+                            prepare_create,
+                            False,
+                            parent,
+                            fk_field,
+                        )
+                    )
+                    continue
+                row, grandchildren = split_payload(child_model, record, app_label)
+                if prepare_update:
+                    prepare_update(child_model, row)
+                row[fk_field] = parent
+                changed = apply_changes(current, row)
+                if set(changed) - AUDIT_FIELDS:
+                    changes.append((current, changed))
+                kept.append(current.pk)
+                if grandchildren:
+                    level.append((current, grandchildren))
+
+            # Delete removed children first: new rows are not inserted yet,
+            # so their (possibly unknown) primary keys need no exclusion.
+            siblings.exclude(pk__in=kept).delete()
+            bulk_update_changed(child_model, changes, batch_size)
+            if creates:
+                objs = [obj for obj, _ in creates]
+                validate_rows(child_model, objs)
+                need_pks = any(grandchildren for _, grandchildren in creates)
+                bulk_insert(child_model, objs, need_pks, batch_size)
+                pending_creates.extend(entry for entry in creates if entry[1])
+
+    insert_levels(pending_creates, app_label, prepare_create, False, batch_size)
+
+
+def payload_models(model, data: Dict[str, Any], app_label: str) -> set:
+    """The models a nested payload writes to: model and its child tables."""
+    models = {model}
+    _, children = split_payload(model, data, app_label, drop_blobs=False)
+    for child_model, _, records in children:
+        models.add(child_model)
+        for record in records:
+            if isinstance(record, dict):
+                models |= payload_models(child_model, record, app_label)
+    return models
@@ -0,0 +1,142 @@
+import datetime
+import decimal
+import uuid
+from typing import Any, List, Optional
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import F, Q
+
+CURSOR_SALT = "django_react_admin.pagination.cursor"
+
+
+class CursorPage:
+    """One page of rows plus the opaque cursors pointing at its neighbours."""
+
+    def __init__(self, rows: List[Any], next_cursor=None, prev_cursor=None):
+        self.rows = rows
+        self.next_cursor = next_cursor
+        self.prev_cursor = prev_cursor
+
+
+def _encode_value(value: Any) -> Any:
+    # Keep full precision: cursors are compared with equality on the tie.
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    return value
+
+
+def encode_cursor(sort_key: str, value: Any, pk: Any, direction: str) -> str:
+    payload = {
+        "s": sort_key,
+        "v": _encode_value(value),
+        "pk": _encode_value(pk),
+        "d": direction,
+    }
+    return signing.dumps(payload, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(cursor: str, sort_key: str) -> dict:
+    try:
+        payload = signing.loads(cursor, salt=CURSOR_SALT)
+    except signing.BadSignature:
+        raise ValueError("Invalid cursor.")
+    if not isinstance(payload, dict) or payload.get("s") != sort_key:
+        raise ValueError("Cursor does not match the requested sort.")
+    if payload.get("d") not in ("next", "prev"):
+        raise ValueError("Invalid cursor.")
+    return payload
+
+
+def resolve_sort_field(model, name: str):
+    """Return the concrete field a cursor can page on, or raise ValueError."""
+    if name == "pk":
+        return model._meta.pk
+    try:
+        field = model._meta.get_field(name)
+    except FieldDoesNotExist:
+        field = None
+    if field is None or not field.concrete or field.many_to_many:
+        raise ValueError(
+            f"Cursor pagination requires sorting on a concrete field, got '{name}'."
+        )
+    return field
+
+
+def _ordering(field, pk_name: str, descending: bool):
+    name = field.attname
+    if field.primary_key:
+        return [f"-{name}" if descending else name]
+    if field.null:
+        # Pin NULL placement so both directions mirror each other exactly
+        if descending:
+            column = F(name).desc(nulls_last=True)
+        else:
+            column = F(name).asc(nulls_first=True)
+    else:
+        column = f"-{name}" if descending else name
+    return [column, f"-{pk_name}" if descending else pk_name]
+
+
+def _after(field, pk_name: str, value: Any, pk: Any, descending: bool) -> Q:
+    """Rows strictly after (value, pk) in the given ordering."""
+    name = field.attname
+    cmp = "lt" if descending else "gt"
+    if field.primary_key:
+        return Q(**{f"{name}__{cmp}": pk})
+    tie = Q(**{pk_name + f"__{cmp}": pk})
+    if value is None:
+        rest = Q(**{f"{name}__isnull": True}) & tie
+        return rest if descending else rest | Q(**{f"{name}__isnull": False})
+    after = Q(**{f"{name}__{cmp}": value}) | (Q(**{name: value}) & tie)
+    if descending and field.null:
+        after |= Q(**{f"{name}__isnull": True})
+    return after
+
+
+def paginate_by_cursor(
+    queryset, sort_field: str, order: str, cursor: Optional[str], limit: int
+) -> CursorPage:
+    """
+    Keyset pagination on (sort_field, pk).
+
+    Each page is a range scan starting right after the cursor's position, so
+    its cost does not grow with how deep the client has paged. An empty or
+    missing cursor returns the first page.
+    """
+    model = queryset.model
+    field = resolve_sort_field(model, sort_field)
+    pk_name = model._meta.pk.attname
+    descending = order == "DESC"
+    sort_key = f"{field.attname}:{order}"
+
+    payload = decode_cursor(cursor, sort_key) if cursor else None
+    backwards = bool(payload and payload["d"] == "prev")
+    # Walking backwards is walking forwards in the mirrored ordering
+    scan_descending = descending != backwards
+
+    queryset = queryset.order_by(*_ordering(field, pk_name, scan_descending))
+    if payload:
+        queryset = queryset.filter(
+            _after(field, pk_name, payload["v"], payload["pk"], scan_descending)
+        )
+    rows = list(queryset[: limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if backwards:
+        rows.reverse()
+
+    def cursor_for(obj, direction):
+        return encode_cursor(sort_key, getattr(obj, field.attname), obj.pk, direction)
+
+    next_cursor = prev_cursor = None
+    if rows:
+        # The over-fetched row tells whether the scan direction has more;
+        # the opposite direction has more whenever we arrived via a cursor.
+        if has_more or backwards:
+            next_cursor = cursor_for(rows[-1], "next")
+        if has_more if backwards else payload is not None:
+            prev_cursor = cursor_for(rows[0], "prev")
+    return CursorPage(rows, next_cursor, prev_cursor)
@@ -0,0 +1,63 @@
+from typing import Any, Dict, Iterable, List, Set
+
+from django.core.exceptions import ValidationError
+
+from .metadata import get_descriptor
+
+
+def find_missing_references(model, rows: Iterable[Dict[str, Any]]) -> Dict[str, List]:
+    """
+    Check every ForeignKey value in rows against the related tables.
+
+    rows are dicts keyed by field attname (e.g. ``author_id``). One query is
+    issued per ForeignKey field that has values, however many rows there are.
+    Returns {field_name: [missing ids]} for references that do not exist.
+    """
+    descriptor = get_descriptor(model)
+    wanted: Dict[str, Set[Any]] = {}
+    for row in rows:
+        for name, field in descriptor.relation_fields.items():
+            value = row.get(field.attname)
+            if value is not None:
+                wanted.setdefault(name, set()).add(value)
+
+    missing = {}
+    for name, values in wanted.items():
+        field = descriptor.relation_fields[name]
+        target = field.target_field.attname
+        found = set(
+            field.related_model._base_manager.filter(
+                **{f"{target}__in": values}
+            ).values_list(target, flat=True)
+        )
+        # Compare in the target field's Python type, not the payload's
+        absent = [v for v in values if field.target_field.to_python(v) not in found]
+        if absent:
+            missing[name] = absent
+    return missing
+
+
+class ReferenceCheck:
+    """
+    Collects rows written during one request and verifies their ForeignKeys
+    together, with one query per model and ForeignKey field.
+    """
+
+    def __init__(self):
+        self.rows: Dict[Any, List[Dict[str, Any]]] = {}
+
+    def add(self, model, row: Dict[str, Any]):
+        self.rows.setdefault(model, []).append(row)
+
+    def check(self):
+        """Raise ValidationError listing every reference that does not exist."""
+        errors: Dict[str, List[str]] = {}
+        for model, rows in self.rows.items():
+            for name, ids in find_missing_references(model, rows).items():
+                listed = ", ".join(str(i) for i in ids)
+                errors.setdefault(name, []).append(
+                    f"Related object(s) {listed} do not exist."
+                )
+        self.rows = {}
+        if errors:
+            raise ValidationError(errors)
@@ -0,0 +1,116 @@
+import hashlib
+import json
+import threading
+from typing import Any, Dict, List, Tuple
+
+from django.apps import apps
+from django.conf import settings
+
+from .metadata import get_descriptor
+
+# Bookkeeping columns the admin UI never edits
+SCHEMA_SKIP_FIELDS = frozenset(
+    (
+        # "id",
+        "unit_id",
+        "created_at",
+        "updated_at",
+        "modified_at",
+        "created_by",
+        "updated_by",
+        "modified_by",
+    )
+)
+
+# App modules never listed by the bulk schema endpoint
+INTERNAL_APP_PREFIXES = ("django.", "rest_framework", "django_react_admin")
+
+
+def build_model_schema(model) -> Dict[str, Any]:
+    """Describe model's editable fields for the admin UI."""
+    fields = []
+    for field in get_descriptor(model).fields:
+        if field.name in SCHEMA_SKIP_FIELDS:
+            continue
+        is_fk = field.is_relation and hasattr(field, "related_model")
+        field_info = {
+            "name": field.name,
+            "type": field.get_internal_type(),
+            "is_fk": is_fk,
+            "related_model": None,
+            "related_name": None,
+            "is_required": field.blank is False and field.null is False,
+            # "is_unique": field.unique,
+            # "default": field.default if field.default is not None else None,
+            # "verbose_name": field.verbose_name,
+            # "help_text": field.help_text,
+        }
+        if is_fk:
+            related = field.related_model._meta
+            field_info["related_model"] = f"{related.app_label}/{related.model_name}"
+            field_info["related_name"] = get_descriptor(
+                field.related_model
+            ).display_field
+        fields.append(field_info)
+
+    return {
+        "app_label": model._meta.app_label,
+        "model_name": model._meta.model_name,
+        "fields": fields,
+    }
+
+
+_schemas: Dict[Any, Tuple[Dict[str, Any], str]] = {}
+_schemas_lock = threading.Lock()
+
+
+def get_model_schema_cached(model) -> Tuple[Dict[str, Any], str]:
+    """
+    Return (schema, etag) for model, built once per process.
+
+    Model classes are replaced when apps are reloaded, so a reload starts
+    from fresh entries; clear_schemas() drops them explicitly.
+    """
+    try:
+        return _schemas[model]
+    except KeyError:
+        pass
+    schema = build_model_schema(model)
+    etag = schema_etag([schema])
+    with _schemas_lock:
+        _schemas[model] = (schema, etag)
+    return schema, etag
+
+
+def clear_schemas():
+    with _schemas_lock:
+        _schemas.clear()
+
+
+def schema_etag(schemas: List[Dict[str, Any]]) -> str:
+    payload = json.dumps(schemas, sort_keys=True).encode("utf-8")
+    return '"' + hashlib.sha1(payload).hexdigest() + '"'
+
+
+def exposed_models(app_labels=None) -> List[Any]:
+    """
+    Models the bulk schema endpoint lists, optionally only from app_labels.
+
+    Limited to settings.REACT_ADMIN_SCHEMA_APPS when set, otherwise every
+    project app except Django's, DRF's and this one. Models can opt out with
+    ReactAdmin.expose_schema = False.
+    """
+    allowed = getattr(settings, "REACT_ADMIN_SCHEMA_APPS", None)
+    models = []
+    for config in apps.get_app_configs():
+        if app_labels and config.label not in app_labels:
+            continue
+        if allowed is not None:
+            if config.label not in allowed:
+                continue
+        elif config.name.startswith(INTERNAL_APP_PREFIXES):
+            continue
+        for model in config.get_models():
+            if get_descriptor(model).option("expose_schema", True):
+                models.append(model)
+    return models
@@ -0,0 +1,253 @@
+import logging
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+from django.db import connections, router
+from django.db.models import BooleanField, Q
+from django.db.models.expressions import RawSQL
+
+from .metadata import get_descriptor
+
+logger = logging.getLogger(__name__)
+
+ICONTAINS = "icontains"
+FULLTEXT = "fulltext"
+SEARCH_BACKENDS = (ICONTAINS, FULLTEXT)
+
+# Text search configuration used for the PostgreSQL index and queries
+POSTGRES_SEARCH_CONFIG = "simple"
+
+# Seconds a missing index is trusted before looking again, so an index
+# created by another process (the management command) is picked up
+SEARCH_INDEX_RECHECK_SECONDS = 60
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def search_tokens(value) -> List[str]:
+    """Words of a search string; punctuation and query syntax are dropped."""
+    return _TOKEN_RE.findall(str(value))
+
+
+def search_fields(model) -> Tuple[str, ...]:
+    """Columns searched by ``q``: ReactAdmin.search_fields, else CharFields."""
+    descriptor = get_descriptor(model)
+    return tuple(descriptor.option("search_fields", descriptor.char_fields))
+
+
+def fts_table(model) -> str:
+    return f"{model._meta.db_table}_fts"
+
+
+def gin_index_name(model) -> str:
+    return f"{model._meta.db_table}_search_gin"[:63]
+
+
+def _columns(model) -> List[str]:
+    return [model._meta.get_field(name).column for name in search_fields(model)]
+
+
+def _tsvector_sql(model, connection, table: Optional[str] = None) -> str:
+    # The query must repeat the index expression for PostgreSQL to use it
+    qn = connection.ops.quote_name
+    prefix = f"{qn(table)}." if table else ""
+    document = " || ' ' || ".join(
+        f"COALESCE({prefix}{qn(column)}::text, '')" for column in _columns(model)
+    )
+    return f"to_tsvector('{POSTGRES_SEARCH_CONFIG}'::regconfig, {document})"
+
+
+def icontains_search(model, value) -> Q:
+    """OR of icontains over the search fields: works anywhere, scans the table."""
+    search = Q()
+    for name in search_fields(model):
+        search |= Q(**{f"{name}__icontains": value})
+    return search
+
+
+class FulltextSearch:
+    """
+    ``q`` backed by a full-text index: an external-content FTS5 table kept
+    in sync by triggers on SQLite, a GIN expression index over to_tsvector()
+    on PostgreSQL. Every word must match, as a prefix of an indexed word.
+
+    Falls back to icontains_search() where the index has not been created
+    (see ensure_search_index) or the backend has none.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._ready: Dict[str, bool] = {}
+        self._recheck_at: Dict[str, float] = {}
+
+    def ready(self, using: str) -> bool:
+        """
+        Whether the index exists. A found index is remembered; a missing one
+        is looked up again after SEARCH_INDEX_RECHECK_SECONDS.
+        """
+        known = self._ready.get(using)
+        if known or (known is False and time.monotonic() < self._recheck_at[using]):
+            return known
+        ready = search_index_exists(self.model, using)
+        if not ready:
+            if known is None:
+                logger.warning(
+                    "No search index for %s on '%s', falling back to icontains. "
+                    "Run the react_admin_search_index command to create it.",
+                    self.model._meta.label,
+                    using,
+                )
+            self._recheck_at[using] = time.monotonic() + SEARCH_INDEX_RECHECK_SECONDS
+        self._ready[using] = ready
+        return ready
+
+    def q(self, value) -> Q:
+        tokens = search_tokens(value)
+        using = router.db_for_read(self.model)
+        if not tokens or not self.ready(using):
+            return icontains_search(self.model, value)
+        connection = connections[using]
+        qn = connection.ops.quote_name
+        if connection.vendor == "sqlite":
+            table = qn(fts_table(self.model))
+            match = " ".join('"{}"*'.format(t.replace('"', '""')) for t in tokens)
+            return Q(
+                pk__in=RawSQL(
+                    f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [match]
+                )
+            )
+        vector = _tsvector_sql(self.model, connection, self.model._meta.db_table)
+        return Q(
+            RawSQL(
+                f"{vector} @@ to_tsquery('{POSTGRES_SEARCH_CONFIG}'::regconfig, %s)",
+                [" & ".join(f"{t}:*" for t in tokens)],
+                output_field=BooleanField(),
+            )
+        )
+
+
+_backends: Dict[object, FulltextSearch] = {}
+
+
+def get_search(model):
+    """
+    The ``q`` implementation configured for model with
+    ReactAdmin.search_backend ("icontains", the default, or "fulltext").
+    Returns a callable value -> Q.
+    """
+    backend = get_descriptor(model).option("search_backend", ICONTAINS)
+    if backend not in SEARCH_BACKENDS:
+        raise ValueError(f"Unknown search backend '{backend}'.")
+    if backend == ICONTAINS:
+        return lambda value: icontains_search(model, value)
+    search = _backends.get(model)
+    if search is None:
+        search = _backends[model] = FulltextSearch(model)
+    return search.q
+
+
+def supports_fulltext(model, using: str = "default") -> bool:
+    vendor = connections[using].vendor
+    if vendor == "sqlite":
+        # FTS5 rowids are integers
+        return model._meta.pk.get_internal_type() in (
+            "AutoField",
+            "BigAutoField",
+            "SmallAutoField",
+            "IntegerField",
+            "BigIntegerField",
+        )
+    return vendor == "postgresql"
+
+
+def search_index_exists(model, using: str = "default") -> bool:
+    connection = connections[using]
+    if not supports_fulltext(model, using):
+        return False
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [fts_table(model)],
+            )
+        else:
+            cursor.execute(
+                "SELECT 1 FROM pg_indexes WHERE indexname = %s",
+                [gin_index_name(model)],
+            )
+        return cursor.fetchone() is not None
+
+
+def _sqlite_statements(model, connection) -> List[str]:
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    fts = qn(fts_table(model))
+    pk = qn(model._meta.pk.column)
+    columns = [qn(c) for c in _columns(model)]
+    names = ", ".join(columns)
+    new = ", ".join(f"new.{c}" for c in columns)
+    old = ", ".join(f"old.{c}" for c in columns)
+    trigger = model._meta.db_table + "_fts"
+    delete = (
+        f"INSERT INTO {fts} ({fts}, rowid, {names}) "
+        f"VALUES ('delete', old.{pk}, {old});"
+    )
+    insert = f"INSERT INTO {fts} (rowid, {names}) VALUES (new.{pk}, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{names}, content={table}, content_rowid={pk})",
+        f"CREATE TRIGGER IF NOT EXISTS {qn(trigger + '_ai')} AFTER INSERT ON {table} "
+        f"BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {qn(trigger + '_ad')} AFTER DELETE ON {table} "
+        f"BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {qn(trigger + '_au')} AFTER UPDATE ON {table} "
+        f"BEGIN {delete} {insert} END",
+        f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')",
+    ]
+
+
+def ensure_search_index(model, using: str = "default") -> bool:
+    """
+    Create (or refresh) the full-text index for model's search fields.
+
+    SQLite gets an FTS5 table with insert/update/delete triggers, so rows
+    written by bulk_create/update() stay indexed too; PostgreSQL gets a GIN
+    expression index. Returns False when the backend or model (non-integer
+    primary key on SQLite) has no full-text support.
+    """
+    connection = connections[using]
+    if not supports_fulltext(model, using):
+        return False
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            for statement in _sqlite_statements(model, connection):
+                cursor.execute(statement)
+        else:
+            qn = connection.ops.quote_name
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {qn(gin_index_name(model))} "
+                f"ON {qn(model._meta.db_table)} "
+                f"USING GIN (({_tsvector_sql(model, connection)}))"
+            )
+    search = _backends.get(model)
+    if search is not None:
+        search._ready.pop(using, None)
+    return True
+
+
+def drop_search_index(model, using: str = "default"):
+    """Remove what ensure_search_index created, e.g. before changing fields."""
+    connection = connections[using]
+    qn = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            trigger = model._meta.db_table + "_fts"
+            for suffix in ("_ai", "_ad", "_au"):
+                cursor.execute(f"DROP TRIGGER IF EXISTS {qn(trigger + suffix)}")
+            cursor.execute(f"DROP TABLE IF EXISTS {qn(fts_table(model))}")
+        elif connection.vendor == "postgresql":
+            cursor.execute(f"DROP INDEX IF EXISTS {qn(gin_index_name(model))}")
+    search = _backends.get(model)
+    if search is not None:
+        search._ready.pop(using, None)
@@ -0,0 +1,75 @@
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from django.apps import apps
+from django.db import IntegrityError, router, transaction
+from django.db.models import F
+
+
+def sequences_available() -> bool:
+    """The sequence table exists only when this app is in INSTALLED_APPS."""
+    return apps.is_installed("django_react_admin")
+
+
+def sequence_period(starts_every: str, now: Optional[datetime] = None) -> str:
+    """The period a sequence restarts on: "", "YYYY" or "YYYY-MM"."""
+    now = now or datetime.utcnow()
+    if starts_every == "year":
+        return str(now.year)
+    if starts_every == "month":
+        return f"{now.year}-{now.month:02d}"
+    return ""
+
+
+def sequence_scope(prefix: str, conditions: Optional[Dict[str, Any]]) -> str:
+    """Stable hash of the options that split a column into separate sequences."""
+    payload = json.dumps(
+        {"prefix": prefix or "", "conditions": conditions or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def allocate_ids(
+    model_cls,
+    column: str,
+    seed: Callable[[], int],
+    prefix: str = "",
+    starts_every: str = "",
+    conditions: Optional[Dict[str, Any]] = None,
+    count: int = 1,
+) -> int:
+    """
+    Reserve count consecutive numbers and return the first one.
+
+    The counter row is bumped with a single UPDATE ... SET last_value =
+    last_value + count, which locks it until the surrounding transaction
+    ends, so concurrent workers always get distinct numbers. seed() is only
+    called the first time a sequence is used, to continue from the numbers
+    already stored in the table; it returns the last number in use.
+    """
+    from .models import IdSequence
+
+    key = {
+        "model_label": model_cls._meta.label_lower,
+        "column": column,
+        "scope": sequence_scope(prefix, conditions),
+        "period": sequence_period(starts_every),
+    }
+    using = router.db_for_write(IdSequence)
+    sequences = IdSequence.objects.using(using).filter(**key)
+    with transaction.atomic(using=using):
+        if not sequences.update(last_value=F("last_value") + count):
+            try:
+                # Savepoint: another worker may create the row first
+                with transaction.atomic(using=using):
+                    IdSequence.objects.using(using).create(
+                        last_value=seed() + count, **key
+                    )
+            except IntegrityError:
+                sequences.update(last_value=F("last_value") + count)
+        last_value = sequences.values_list("last_value", flat=True).get()
+    return last_value - count + 1
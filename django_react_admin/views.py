@@ -1,27 +1,93 @@
+import asyncio
 import csv
-import io
 import json
 import logging
+import time
 from datetime import datetime
-from uuid import UUID
-from typing import Any, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+from asgiref.sync import async_to_sync
 from django.apps import apps
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Model
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
+from rest_framework.exceptions import APIException
 from rest_framework.decorators import action, api_view
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import BasePermission, IsAuthenticated
 from rest_framework.response import Response
-from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.core.exceptions import FieldDoesNotExist, FieldError, ValidationError
+from django.db import DatabaseError, IntegrityError
 
 from os import path
 from django.core.files.storage import default_storage
 
+from .batch import (
+    BATCH_HEADERS,
+    MAX_BATCH_REQUESTS,
+    batch_key,
+    batch_request,
+    parse_batch_item,
+)
+from .bulk import (
+    BULK_CHUNK_SIZE,
+    GET_MANY_CHUNK_SIZE,
+    chunk_size_for,
+    id_chunks,
+    in_request_order,
+    pk_lookups,
+    queryset_chunks,
+    unique_pks,
+)
+from .caching import (
+    bump_versions,
+    etag_for,
+    etag_matches,
+    get_cached_response,
+    response_cache_key,
+    store_response,
+)
+from .counting import COUNT_STRATEGIES, HAS_MORE, count_queryset
+from .embeds import (
+    EMBED_LIMIT,
+    apply_embeds,
+    build_embed_tree,
+    embed_fields,
+    embed_models,
+    embed_related,
+)
+from .exports import EXPORT_CHUNK_SIZE, export_rows, stream_csv
+from .filters import compile_filter_plan, parse_filter_param, parse_literal
+from .imports import IMPORT_BATCH_SIZE, import_csv
+from .instrumentation import record_queries, render_timed, server_timing
+from .metadata import get_descriptor
+from .nested import (
+    AUDIT_FIELDS,
+    NESTED_BATCH_SIZE,
+    apply_changes,
+    bulk_update_changed,
+    clean_changed_fields,
+    nested_create,
+    payload_models,
+    split_payload,
+    sync_children,
+)
+from .pagination import paginate_by_cursor, resolve_sort_field
+from .relations import ReferenceCheck, find_missing_references
+from .schemas import exposed_models, get_model_schema_cached, schema_etag
+from .sequences import allocate_ids, sequences_available
+
 logger = logging.getLogger(__name__)
 
+# Response shapes create_many can return
+CREATE_MANY_RESPONSES = ("full", "ids", "count")
+# Response shapes update_many and delete_many can return
+BULK_RESPONSES = ("ids", "count")
+# Largest block of ids generate_id reserves per call
+MAX_ID_BLOCK = 10000
+
 
 # === Utility functions translated from provided PHP logic for ID generation ===
 def _get_last_raw_year(
@@ -113,24 +179,14 @@ def _generate_unique_numeric_id(
     return new_id
 
 
-def generate_human_readable_id(
+def _next_id_by_lookup(
     model_cls,
     column: str,
-    options: Optional[Dict[str, Any]] = None,
+    options: Dict[str, Any],
     year_source_field: str = "issued_date",
-) -> Tuple[str, int]:
-    """Python equivalent of provided PHP generate_id.
-
-    Returns a tuple of (formatted_id, raw_numeric_part).
-    Options keys:
-        prefix, pad_length, pad_string, pad_type ('right' for right padding else left),
-        starts_every ('year'|'month'|''), conditions (dict), source (any truthy triggers reset logic)
-    """
-    options = options or {}
+) -> int:
+    """Next number derived from the rows already stored (the PHP approach)."""
     prefix = options.get("prefix", "")
-    pad_length = options.get("pad_length", 4)
-    pad_string = options.get("pad_string", "0")
-    pad_type = options.get("pad_type", "")  # 'right' else left
     starts_every = options.get("starts_every", "")
     conditions = options.get("conditions", {}) or {}
 
@@ -164,33 +220,86 @@ def generate_human_readable_id(
         # If year changed vs last row's year source, reset to 1
         last_year = _get_last_raw_year(last_row, year_source_field)
         if last_year is not None and last_year != now.year:
-            uniq_id = 1
-        else:
-            uniq_id = _generate_unique_numeric_id(
-                model_cls,
-                column,
-                last_id,
-                prefix,
-                starts_every,
-                conditions,
-                year_source_field,
-            )
-    else:
-        uniq_id = _generate_unique_numeric_id(
+            return 1
+    return _generate_unique_numeric_id(
+        model_cls,
+        column,
+        last_id,
+        prefix,
+        starts_every,
+        conditions,
+        year_source_field,
+    )
+
+
+def _format_id(uniq_id: int, options: Dict[str, Any]) -> str:
+    prefix = options.get("prefix", "")
+    pad_length = options.get("pad_length", 4)
+    pad_string = options.get("pad_string", "0")
+    pad_type = options.get("pad_type", "")  # 'right' else left
+    if pad_type == "right":
+        return f"{prefix}{str(uniq_id).ljust(pad_length, pad_string)}"
+    return f"{prefix}{str(uniq_id).rjust(pad_length, pad_string)}"
+
+
+def reserve_human_readable_ids(
+    model_cls,
+    column: str,
+    count: int,
+    options: Optional[Dict[str, Any]] = None,
+    year_source_field: str = "issued_date",
+) -> List[Tuple[str, int]]:
+    """Reserve count consecutive ids at once; see generate_human_readable_id.
+
+    Returns a list of (formatted_id, raw_numeric_part). With the sequence
+    table the whole block is taken in one UPDATE, so no other caller can
+    receive any of its numbers; the lookup-based path (sequence=False) only
+    numbers the block on from the latest stored row.
+    """
+    if count < 1:
+        raise ValueError("count must be a positive integer")
+    options = options or {}
+    starts_every = options.get("starts_every", "")
+
+    if options.get("sequence", True) and sequences_available():
+        first = allocate_ids(
             model_cls,
             column,
-            last_id,
-            prefix,
-            starts_every,
-            conditions,
-            year_source_field,
+            lambda: _next_id_by_lookup(model_cls, column, options, year_source_field)
+            - 1,
+            prefix=options.get("prefix", ""),
+            # 'source' resets the numbering when the year changes
+            starts_every=starts_every or ("year" if options.get("source") else ""),
+            conditions=options.get("conditions", {}) or {},
+            count=count,
         )
-
-    # Pad
-    if pad_type == "right":
-        formatted = f"{prefix}{str(uniq_id).ljust(pad_length, pad_string)}"
     else:
-        formatted = f"{prefix}{str(uniq_id).rjust(pad_length, pad_string)}"
+        first = _next_id_by_lookup(model_cls, column, options, year_source_field)
+    return [(_format_id(n, options), n) for n in range(first, first + count)]
+
+
+def generate_human_readable_id(
+    model_cls,
+    column: str,
+    options: Optional[Dict[str, Any]] = None,
+    year_source_field: str = "issued_date",
+) -> Tuple[str, int]:
+    """Python equivalent of provided PHP generate_id.
+
+    Returns a tuple of (formatted_id, raw_numeric_part).
+    Options keys:
+        prefix, pad_length, pad_string, pad_type ('right' for right padding else left),
+        starts_every ('year'|'month'|''), conditions (dict), source (any truthy triggers reset logic),
+        sequence (default True; False derives the number from existing rows only)
+
+    Numbers come from a counter row in the IdSequence table (see
+    sequences.py), which hands them out atomically in two queries. The
+    counter is seeded from the existing rows the first time it is used;
+    without the app installed the number is always derived from them.
+    """
+    (formatted, uniq_id), = reserve_human_readable_ids(
+        model_cls, column, 1, options, year_source_field
+    )
     return formatted, uniq_id
 
 
@@ -284,59 +393,73 @@ class IsAdminOrReadOnly(IsAuthenticated):
         return True
 
 
-def model_to_dict(instance, exclude_password=True, embed=None):
+def model_to_dict(instance, exclude_password=True, embed=None, fields=None):
     data = {}
-    embed = embed or []
 
-    for field in instance._meta.fields:
+    for field in get_descriptor(type(instance)).fields:
         # print("field:", field)
-        value = getattr(instance, field.name)
         if exclude_password and field.name == "password":
             continue
+        if fields is not None and field.name not in fields:
+            continue
         if field.is_relation:
-            # If ForeignKey field, store the related object's ID only
-            if value is not None:
-                data[field.name] = value.pk
-
-                # Check if this field should be embedded
-                if field.name in embed:
-                    # Use the field name without '_id' suffix for the embedded object
-                    embed_key = (
-                        field.name.replace("_id", "")
-                        if field.name.endswith("_id")
-                        else field.name
-                    )
-                    data[embed_key] = model_to_dict(value, exclude_password)
-            else:
-                data[field.name] = None
+            # Read the raw id so the related row is only loaded when embedded
+            data[field.name] = getattr(instance, field.attname)
         else:
-            data[field.name] = value
+            data[field.name] = getattr(instance, field.name)
+    if embed:
+        # Embedded objects go under the field name without its '_id' suffix
+        embed_related(
+            data,
+            instance,
+            embed,
+            lambda obj, embed: model_to_dict(obj, exclude_password, embed),
+        )
     return data
 
 
 def update_relation(instance, data):
-    for field in instance._meta.fields:
-        if field.is_relation:
-            # import pdb; pdb.set_trace()
-            # If ForeignKey field, store the related object's ID only
-            value = None
-            if (
-                data.get(field.name)
-                and field.foreign_related_fields[0].get_internal_type() == "UUIDField"
-            ):
-                # print("UUID value:", data.get(field.name))
-                # import pdb; pdb.set_trace()
-                if isinstance(data.get(field.name), str):
-                    value = UUID(data.get(field.name))
-                else:
-                    value = UUID(data.get(field.name).id)
-            elif data.get(field.name):
-                value = data[field.name]
-            # import pdb; pdb.set_trace()
-            if value is not None:
-                data[field.name] = field.related_model.objects.get(pk=value)
-            # else:
-            #     data[field.name] = None
+    """
+    Turn ForeignKey values in data into raw ids assigned by attname.
+
+    ``{"author_id": 5}`` becomes ``{"author_id_id": 5}``, which the model
+    accepts without loading the related row; model instances are left as
+    they are. Existence is checked separately (see ReferenceCheck), in one
+    query per field for the whole request.
+    """
+    descriptor = get_descriptor(
+        instance if isinstance(instance, type) else type(instance)
+    )
+    for field in descriptor.relation_fields.values():
+        value = data.get(field.name)
+        if not value or isinstance(value, Model):
+            continue
+        if field.name in descriptor.uuid_fk_fields and not isinstance(value, str):
+            value = getattr(value, "id", value)
+        try:
+            value = field.target_field.to_python(value)
+        except ValidationError as e:
+            raise ValidationError({field.name: e.messages})
+        del data[field.name]
+        data[field.attname] = value
+    return data
+
+
+# Set by the server on create; client payloads may not set or rewrite them
+CREATION_AUDIT_FIELDS = ("created_at", "created_by")
+
+
+def drop_creation_audit_fields(model, data):
+    """
+    Remove created_at/created_by from a client payload, under the field name
+    and the attname (``created_by_id`` for a ForeignKey).
+    """
+    descriptor = get_descriptor(model)
+    for name in CREATION_AUDIT_FIELDS:
+        data.pop(name, None)
+        field = descriptor.get_field(name)
+        if field is not None:
+            data.pop(field.attname, None)
     return data
 
 
@@ -366,6 +489,14 @@ def model_to_dict_nested(instance, exclude_password=True):
     return data
 
 
+@lru_cache(maxsize=None)
+def any_model_cached() -> bool:
+    """Whether an installed model sets ReactAdmin.cache_timeout."""
+    return any(
+        get_descriptor(model).option("cache_timeout") for model in apps.get_models()
+    )
+
+
 def get_model(app_label, model_name):
     try:
         return apps.get_model(app_label, model_name)
@@ -374,152 +505,257 @@ def get_model(app_label, model_name):
 
 
 def parse_filters(filters, Model):
-    q = Q()
-    for key, value in filters.items():
-        if isinstance(value, str) and value.startswith("[") and value.endswith("]"):
-            # Convert string representation of a list to an actual list
-            try:
-                value = eval(value)
-            except Exception:
-                pass
-
-        # if isinstance(value, list):
-        #     # If the value is a single-item list, extract the item
-        #     value = value[0]
+    """
+    Build a Q object for a react-admin filter dict.
 
-        # Check if the field is a UUIDField
-        field = next(
-            (f for f in Model._meta.fields if f.name == key.split("|")[0]), None
-        )
-        if field and field.get_internal_type() == "UUIDField":
-            try:
-                # print("UUID value:", value)
-                if isinstance(value, list):
-                    value = [UUID(v) for v in value]
-                else:
-                    value = UUID(value)  # Validate and convert to UUID
-            except (ValueError, TypeError):
-                raise ValueError(f"'{value}' is not a valid UUID.")
-
-        if "|op=" in key:
-            field, op = key.split("|op=")
-            if op in ("like", "ilike"):
-                if isinstance(value, str) and "%" in value:
-                    # Convert SQL-like % wildcards to Django's icontains/startswith/endswith
-                    if value.startswith("%") and value.endswith("%"):
-                        # %value% -> icontains
-                        clean_value = value.strip("%")
-                        q &= Q(**{f"{field}__icontains": clean_value})
-                    elif value.endswith("%"):
-                        # value% -> startswith
-                        clean_value = value.rstrip("%")
-                        q &= Q(**{f"{field}__startswith": clean_value})
-                    elif value.startswith("%"):
-                        # %value -> endswith
-                        clean_value = value.lstrip("%")
-                        q &= Q(**{f"{field}__endswith": clean_value})
-                    else:
-                        # Contains % but not at start/end, treat as literal
-                        q &= Q(**{f"{field}__icontains": value})
-                else:
-                    # No % wildcards, default behavior
-                    q &= Q(**{f"{field}__icontains": value})
-            elif op == "gt":
-                q &= Q(**{f"{field}__gt": value})
-            elif op == "lt":
-                q &= Q(**{f"{field}__lt": value})
-            elif op == "not_eq":
-                q &= ~Q(**{field: value})
-            elif op == "in":
-                # import pdb; pdb.set_trace()
-                if isinstance(value, list):
-                    q &= Q(**{f"{field}__in": value})
-                else:
-                    raise ValueError("Value for 'in' operation must be a list.")
-            elif op == "not_in":
-                if isinstance(value, list):
-                    q &= ~Q(**{f"{field}__in": value})
-                else:
-                    raise ValueError("Value for 'not_in' operation must be a list.")
-            elif op == "isnull":
-                if value:
-                    q &= Q(**{f"{field}__isnull": True})
-                else:
-                    q &= Q(**{f"{field}__isnull": False})
-            else:
-                raise ValueError(f"Unsupported operation '{op}' for field '{field}'.")
-
-        elif key == "q":
-            search = Q()
-            for field in Model._meta.fields:
-                if field.get_internal_type() == "CharField":
-                    search |= Q(**{f"{field.name}__icontains": value})
-            q &= search
-        else:
-            q &= Q(**{key: value})
-    return q
+    The filter's shape is compiled once per model into a cached FilterPlan
+    (see filters.py); only the values are bound here.
+    """
+    return compile_filter_plan(Model, filters.keys()).bind(filters)
 
 
 def get_foreign_key_field(child_model, parent_model):
     """
     Return the name of the ForeignKey field in child_model that points to parent_model.
     """
-    for field in child_model._meta.fields:
-        if field.is_relation and field.related_model == parent_model:
-            return field.name
-    return None
+    return get_descriptor(child_model).foreign_key_to(parent_model)
 
 
-def parse_meta_embed(meta_str):
+def parse_meta(meta_str):
     """
-    Parse meta parameter to extract embed information.
-    Expected format: {"embed": ["author", "category"]} or {"embed": "author"}
+    Parse the react-admin meta parameter into a dict, e.g.
+    {"embed": ["author"], "count": "estimate"}. Returns {} when unusable.
     """
     if not meta_str:
-        return []
-
+        return {}
     try:
         meta = json.loads(meta_str)
-        embed = meta.get("embed", [])
-
-        # Handle both string and list formats
-        if isinstance(embed, str):
-            return [embed]
-        elif isinstance(embed, list):
-            return embed
-        else:
-            return []
     except (json.JSONDecodeError, TypeError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def parse_meta_embed(meta_str):
+    """
+    Parse meta parameter to extract embed information.
+    Expected format: {"embed": ["author", "category"]} or {"embed": "author"}
+    """
+    embed = parse_meta(meta_str).get("embed", [])
+
+    # Handle both string and list formats
+    if isinstance(embed, str):
+        return [embed]
+    elif isinstance(embed, list):
+        return embed
+    else:
         return []
 
 
 def get_embed_fields(Model, embed_list):
     """
-    Validate and return valid embed fields for the model.
-    Only return fields that are actual ForeignKey fields in the model.
+    Validate the requested embeds and return them as a tree (see embeds.py).
+
+    Accepts ForeignKeys ("author" or "author_id"), paths through them
+    ("author.company") and reverse one-to-many relations by related_name or
+    model name ("lines", "orderline"). Unknown names are ignored.
+    """
+    return build_embed_tree(Model, embed_list)
+
+
+def parse_meta_embed_limit(meta_str):
+    """meta.embed_limit: an int for every reverse embed, or {path: int}."""
+    return parse_meta(meta_str).get("embed_limit")
+
+
+def parse_meta_fields(meta_str, fields_param=None):
+    """
+    Columns requested with meta.fields (["id", "title"]) or a ``fields``
+    query parameter ("id,title"). Returns None when every column is wanted.
+    """
+    fields = parse_meta(meta_str).get("fields")
+    if fields is None:
+        fields = fields_param
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    if not isinstance(fields, list):
+        return None
+    fields = [str(f).strip() for f in fields if str(f).strip()]
+    return fields or None
+
+
+def get_sparse_fields(Model, names):
+    """
+    Validate requested columns and return their field names, primary key
+    first. Attnames are accepted too. Raises ValueError for unknown names.
+    """
+    if not names:
+        return None
+    descriptor = get_descriptor(Model)
+    fields = [descriptor.pk_name]
+    for name in names:
+        field = descriptor.get_field(name) or descriptor.get_field_by_attname(name)
+        if field is None:
+            raise ValueError(f"Unknown field '{name}'")
+        if field.name != "password" and field.name not in fields:
+            fields.append(field.name)
+    return fields
+
+
+def project_queryset(queryset, fields, embed=None, instances=False, extra=()):
+    """
+    Push a sparse fieldset down to the database.
+
+    Returns (queryset, serialize). Without embeds the rows are read with
+    values() and sent as they come, skipping model instantiation; embeds (or
+    instances=True, for callers that need model objects) use only() so just
+    the requested columns are loaded. extra names columns to load without
+    returning them.
     """
-    valid_embeds = []
-    model_fields = {f.name: f for f in Model._meta.fields}
+    if not fields:
+        return queryset, lambda obj: model_to_dict(obj, embed=embed)
+    if embed or instances:
+        shown = fields + [
+            name for name in embed_fields(embed or {}) if name not in fields
+        ]
+        queryset = queryset.only(*shown, *extra)
+        return queryset, lambda obj: model_to_dict(obj, embed=embed, fields=shown)
+    return queryset.values(*fields), dict
 
-    for embed_field in embed_list:
-        # Handle both 'author' and 'author_id' formats
-        field_name = embed_field
-        if not field_name.endswith("_id"):
-            field_name = f"{embed_field}_id"
 
-        field = model_fields.get(field_name)
-        if field and field.is_relation:
-            valid_embeds.append(field_name)
+class ListQuery:
+    """
+    A validated list request: the filtered queryset plus how to page,
+    project and count it. Shared by the sync and async viewsets, which only
+    differ in how they run the queries.
+    """
 
-    return valid_embeds
+    def __init__(
+        self, queryset, sort, range_, cursor, by_cursor, embeds, count_strategy, fields
+    ):
+        self.queryset = queryset
+        self.sort = sort
+        self.range = range_
+        self.cursor = cursor
+        self.by_cursor = by_cursor
+        self.embeds = embeds
+        self.count_strategy = count_strategy
+        self.fields = fields
+
+    @property
+    def counts(self) -> bool:
+        # has_more is answered by the page fetch itself
+        return self.count_strategy != HAS_MORE
+
+    def offset_page(self):
+        """(sliced queryset, serialize) for offset pagination."""
+        field, order = self.sort
+        if order == "DESC":
+            field = f"-{field}"
+        page, serialize = project_queryset(
+            self.queryset.order_by(field), self.fields, self.embeds
+        )
+        start, stop = self.range
+        # Without a count, fetch one row past the page; its presence stands
+        # in for the total
+        return page[start : stop + (1 if self.counts else 2)], serialize
+
+    def cursor_page(self):
+        """Fetch the keyset page; returns (CursorPage, serialize)."""
+        field, order = self.sort
+        limit = max(self.range[1] - self.range[0] + 1, 1)
+        # Cursors are built from model instances, so keep the sort column
+        projected, serialize = project_queryset(
+            self.queryset,
+            self.fields,
+            self.embeds,
+            instances=True,
+            extra=(resolve_sort_field(self.queryset.model, field).name,),
+        )
+        page = paginate_by_cursor(projected, field, order, self.cursor, limit)
+        return page, serialize
+
+    def response(self, rows, serialize, total_count=None, page=None):
+        """Build the list Response from fetched rows (or a CursorPage)."""
+        start, stop = self.range
+        if page is not None:
+            rows = page.rows
+            if total_count is None:
+                total_count = start + len(rows) + (1 if page.next_cursor else 0)
+        elif total_count is None:
+            rows = list(rows)
+            total_count = start + len(rows)
+            rows = rows[: stop - start + 1]
+        response = Response([serialize(row) for row in rows])
+        response["Content-Range"] = f"{start}-{stop}/{total_count}"
+        if page is not None:
+            if page.next_cursor:
+                response["X-Next-Cursor"] = page.next_cursor
+            if page.prev_cursor:
+                response["X-Prev-Cursor"] = page.prev_cursor
+        return response
 
 
 class DynamicModelViewSet(viewsets.ViewSet):
     # permission_classes = [IsAdminOrReadOnly]
     permission_classes = [RoleBasedPermission]
     parser_classes = [JSONParser, MultiPartParser, FormParser]
+    # "offset" pages with range slices; "cursor" always uses keyset pages.
+    # Clients can opt into cursor mode per request by sending a ``cursor`` param.
+    pagination_mode = "offset"
+    # How list computes the Content-Range total: "exact", "cached" (exact,
+    # cached for count_cache_timeout seconds per filter), "estimate" (planner
+    # estimate on PostgreSQL) or "has_more" (no count, fetch one extra row).
+    # Overridable per model (ReactAdmin.count_strategy) and per request
+    # (meta.count).
+    count_strategy = "exact"
+    count_cache_timeout = 60
+    export_chunk_size = EXPORT_CHUNK_SIZE
+    import_batch_size = IMPORT_BATCH_SIZE
+    nested_batch_size = NESTED_BATCH_SIZE
+    # Rows per INSERT for create_many; None lets the backend pick
+    create_many_batch_size = None
+    # Rows per UPDATE for update_many with per-row payloads
+    update_many_batch_size = NESTED_BATCH_SIZE
+    # Rows per statement and transaction for update_many (shared changes) and
+    # delete_many; capped by the backend's bind parameter limit
+    bulk_chunk_size = BULK_CHUNK_SIZE
+    # Ids per query for get_many where the backend limits bind parameters
+    # (PostgreSQL sends any number of ids as one array parameter)
+    get_many_chunk_size = GET_MANY_CHUNK_SIZE
+    # Rows embedded per parent for reverse embeds unless meta.embed_limit says
+    # otherwise
+    embed_limit = EMBED_LIMIT
+    # Seconds list/retrieve/get_many responses are cached (None disables the
+    # cache; ReactAdmin.cache_timeout overrides it per model). Writes through
+    # this viewset invalidate them by bumping a per-model version.
+    cache_timeout = None
+    cache_alias = "default"
+    # Time every query of a request, add a Server-Timing header (db time and
+    # query count, render time, total) and log likely N+1 query patterns
+    instrument = False
+    # Verify ForeignKey ids sent by create/update/create_many with one query
+    # per field before committing, and report the missing ones as a 400.
+    # Without it a bad id is only caught by the database constraint.
+    check_relations = True
     # app_label = "clothingapp"
 
+    def dispatch(self, request, *args, **kwargs):
+        if not self.instrument:
+            return super().dispatch(request, *args, **kwargs)
+        start = time.perf_counter()
+        with record_queries() as recorder:
+            response = super().dispatch(request, *args, **kwargs)
+            # Render here so serialization (and lazy queries) is measured
+            render = render_timed(response)
+        total = time.perf_counter() - start
+        if getattr(response, "streaming", False):
+            # Streamed rows are read after dispatch returns; the figures
+            # would only cover the setup queries
+            return response
+        response["Server-Timing"] = server_timing(recorder, total, render)
+        recorder.report_n_plus_one(f"{request.method} {request.path}")
+        return response
+
     def get_model(self, app_label, model_name):
         model = get_model(app_label, model_name)
         # print("model:", app_label, model_name)
@@ -535,21 +771,69 @@ class DynamicModelViewSet(viewsets.ViewSet):
 
     def list(self, request, app_label=None, model_name=None):
         Model = self.get_model(app_label, model_name)
-        filter_str = request.GET.dict().get("filter", "{}")
-        try:
-            filters = json.loads(filter_str)
-        except Exception:
-            filters = {}
+        return self._cached(request, Model, lambda: self._list(request, Model))
+
+    def _list(self, request, Model):
+        query = self._list_query(request, Model)
+        if isinstance(query, Response):
+            return query
+        if query.by_cursor:
+            return self._list_by_cursor(query)
+        rows, serialize = query.offset_page()
+        total_count = None
+        if query.counts:
+            total_count = self._count(query.queryset, query.count_strategy)
+        return query.response(rows, serialize, total_count)
+
+    def _scope(self, request, Model, queryset, filters):
+        """Hide soft-deleted and inactive rows, and rows of other units."""
+        descriptor = get_descriptor(Model)
+        if descriptor.is_soft_delete:
+            queryset = queryset.filter(is_deleted=False)
+        if descriptor.has_is_active:
+            queryset = queryset.filter(is_active=True)
+        if (
+            descriptor.has_unit_id
+            and "unit_id" not in filters
+            and request.headers.get("Unit-ID")
+        ):
+            queryset = queryset.filter(unit_id=request.headers.get("Unit-ID"))
+        return queryset
+
+    def _list_query(self, request, Model):
+        """Validate the list parameters; returns a ListQuery or a 400 Response."""
+        descriptor = get_descriptor(Model)
+        filters = parse_filter_param(request.GET.get("filter"))
 
         # Parse meta parameter for embed functionality
         meta_str = request.GET.dict().get("meta", "{}")
         embed_list = parse_meta_embed(meta_str)
         valid_embeds = get_embed_fields(Model, embed_list)
+        try:
+            fields = get_sparse_fields(
+                Model, parse_meta_fields(meta_str, request.GET.get("fields"))
+            )
+        except ValueError as e:
+            return Response(
+                {"error": f"Invalid fields parameter: {e}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        count_strategy = (
+            parse_meta(meta_str).get("count")
+            or descriptor.option("count_strategy")
+            or self.count_strategy
+        )
+        if count_strategy not in COUNT_STRATEGIES:
+            return Response(
+                {"error": f"Invalid count strategy '{count_strategy}'"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
         sort_param = request.GET.get("sort")
         if sort_param:
             try:
-                sort = eval(sort_param)
+                sort = parse_literal(sort_param)
                 if not isinstance(sort, list) or len(sort) != 2:
                     raise ValueError("Sort parameter must be a list with two elements.")
             except Exception as e:
@@ -558,74 +842,179 @@ class DynamicModelViewSet(viewsets.ViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
         else:
-            sort = [Model._meta.pk.name or Model._meta.fields[0].name, "ASC"]
+            sort = [descriptor.pk_name or descriptor.fields[0].name, "ASC"]
 
         if not isinstance(sort, list) or len(sort) != 2:
             return Response(
                 {"error": "Invalid sort parameter"}, status=status.HTTP_400_BAD_REQUEST
             )
-        range_ = eval(request.GET.dict().get("range", "[0, 9]"))
+        range_ = parse_literal(request.GET.get("range", "[0, 9]"))
+        if not (
+            isinstance(range_, list)
+            and len(range_) == 2
+            and all(isinstance(i, int) for i in range_)
+        ):
+            return Response(
+                {"error": "Invalid range parameter"}, status=status.HTTP_400_BAD_REQUEST
+            )
 
         queryset = Model.objects.all()
 
-        # Add select_related for embedded fields to optimize queries
-        if valid_embeds:
-            select_related_fields = []
-            for embed_field in valid_embeds:
-                # Remove '_id' suffix to get the relation name
-                # relation_name = embed_field.replace("_id", "")
-                select_related_fields.append(embed_field)
-            queryset = queryset.select_related(*select_related_fields)
+        # Load embedded relations in a fixed number of queries
+        try:
+            queryset = self._apply_embeds(queryset, valid_embeds, meta_str)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         if filters:
-            queryset = queryset.filter(parse_filters(filters, Model))
-        if hasattr(Model, "is_deleted"):
-            queryset = queryset.filter(is_deleted=False)
-        if hasattr(Model, "is_active"):
-            queryset = queryset.filter(is_active=True)
-        if (
-            hasattr(Model, "unit_id")
-            and "unit_id" not in filters
-            and request.headers.get("Unit-ID")
-        ):
-            queryset = queryset.filter(unit_id=request.headers.get("Unit-ID"))
+            try:
+                queryset = queryset.filter(parse_filters(filters, Model))
+            except ValueError as e:
+                return Response(
+                    {"error": f"Invalid filter parameter: {str(e)}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        queryset = self._scope(request, Model, queryset, filters)
+
+        cursor = request.GET.get("cursor")
+        return ListQuery(
+            queryset,
+            sort,
+            range_,
+            cursor,
+            cursor is not None or self.pagination_mode == "cursor",
+            valid_embeds,
+            count_strategy,
+            fields,
+        )
 
-        if sort:
-            field, order = sort
-            if order == "DESC":
-                field = f"-{field}"
-            queryset = queryset.order_by(field)
-
-        total_count = queryset.count()
-        queryset = queryset[range_[0] : range_[1] + 1]
-        response = Response([
-            model_to_dict(obj, embed=valid_embeds) for obj in queryset
-        ])
-        response["Content-Range"] = f"{range_[0]}-{range_[1]}/{total_count}"
+    def _cached(self, request, Model, compute):
+        """
+        Serve a read through the response cache when it is enabled for Model
+        (cache_timeout on the viewset or ReactAdmin.cache_timeout).
+
+        Responses carry an ETag derived from the cache key; a matching
+        If-None-Match is answered with 304 without touching the database.
+        """
+        timeout = self._cache_timeout(Model)
+        if not timeout:
+            return compute()
+        embeds = get_embed_fields(Model, parse_meta_embed(request.GET.get("meta")))
+        key = response_cache_key(
+            request, [Model, *embed_models(embeds)], self.cache_alias
+        )
+        etag = etag_for(key)
+        if etag_matches(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            cached = get_cached_response(key, self.cache_alias)
+            if cached is not None:
+                data, headers = cached
+                response = Response(data, headers=headers)
+            else:
+                response = compute()
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                store_response(response, key, timeout, self.cache_alias)
+        response["ETag"] = etag
+        # Let browsers keep the body but revalidate it on every use
+        response["Cache-Control"] = "private, no-cache"
         return response
 
+    def _cache_timeout(self, Model):
+        return get_descriptor(Model).option("cache_timeout", self.cache_timeout)
+
+    def _invalidate(self, models, cascade=False):
+        """
+        Drop cached reads of models after a write. With cascade, models
+        whose rows point at them (deleted along with them) are included.
+        Nothing is done unless response caching is enabled, on this viewset
+        or on some model.
+        """
+        if not (self.cache_timeout or any_model_cached()):
+            return
+        models = set(models)
+        if cascade:
+            for model in list(models):
+                models.update(
+                    rel.related_model
+                    for rel in get_descriptor(model).reverse_relations.values()
+                )
+        bump_versions(models, self.cache_alias)
+
+    def _apply_embeds(self, queryset, valid_embeds, meta_str):
+        return apply_embeds(
+            queryset,
+            valid_embeds,
+            parse_meta_embed_limit(meta_str),
+            self.embed_limit,
+        )
+
+    def _count(self, queryset, count_strategy):
+        return count_queryset(
+            queryset, count_strategy, self.count_cache_timeout, self.cache_alias
+        )
+
+    def _list_by_cursor(self, query):
+        """
+        Keyset-paginated list: pages on the sort column with the primary key
+        as tie-breaker, so deep pages cost the same as the first one.
+        """
+        try:
+            page, serialize = query.cursor_page()
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        total_count = None
+        if query.counts:
+            total_count = self._count(query.queryset, query.count_strategy)
+        return query.response(None, serialize, total_count, page=page)
+
     def retrieve(self, request, pk=None, app_label=None, model_name=None):
         Model = self.get_model(app_label, model_name)
+        return self._cached(
+            request, Model, lambda: self._retrieve(request, Model, pk)
+        )
+
+    def _retrieve(self, request, Model, pk):
+        query = self._detail_query(request, Model)
+        if isinstance(query, Response):
+            return query
+        queryset, serialize = query
+        try:
+            obj = queryset.get(pk=pk)
+        except Model.DoesNotExist:
+            return Response({"error": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(serialize(obj))
 
+    def _detail_query(self, request, Model, queryset=None):
+        """
+        Apply the embed and fields meta parameters to queryset (all rows of
+        Model by default). Returns (queryset, serialize) or a 400 Response.
+        """
         # Parse meta parameter for embed functionality
         meta_str = request.GET.dict().get("meta", "{}")
         embed_list = parse_meta_embed(meta_str)
         valid_embeds = get_embed_fields(Model, embed_list)
-
         try:
-            queryset = Model.objects.all()
-
-            # Add select_related for embedded fields to optimize queries
-            if valid_embeds:
-                select_related_fields = []
-                for embed_field in valid_embeds:
-                    select_related_fields.append(embed_field)
-                queryset = queryset.select_related(*select_related_fields)
+            fields = get_sparse_fields(
+                Model, parse_meta_fields(meta_str, request.GET.get("fields"))
+            )
+        except ValueError as e:
+            return Response(
+                {"error": f"Invalid fields parameter: {e}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-            obj = queryset.get(pk=pk)
-            return Response(model_to_dict(obj, embed=valid_embeds))
-        except Model.DoesNotExist:
-            return Response({"error": "Not found"}, status=status.HTTP_404_NOT_FOUND)
+        if queryset is None:
+            queryset = Model.objects.all()
+        # Load embedded relations in a fixed number of queries
+        try:
+            queryset = self._apply_embeds(queryset, valid_embeds, meta_str)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        return project_queryset(queryset, fields, valid_embeds)
 
     @transaction.atomic
     def create(self, request, app_label=None, model_name=None):
@@ -633,84 +1022,47 @@ class DynamicModelViewSet(viewsets.ViewSet):
         data = dict(request.POST.dict()) if request.POST else dict(request.data)
         files = request.FILES.dict() if request.FILES else {}
 
-        def recursive_create(model, data, parent_obj=None, parent_model=None):
+        file_urls = {}
+        references = ReferenceCheck()
+
+        def prepare(model, row):
+            descriptor = get_descriptor(model)
+            drop_creation_audit_fields(model, row)
             # Set created_by if exists
-            if "created_by" in [f.name for f in model._meta.fields]:
-                data["created_by"] = request.user.id
+            if descriptor.has_field("created_by"):
+                row["created_by"] = request.user.id
 
             # Set created_at if exists
-            if "created_at" in [f.name for f in model._meta.fields]:
-                data["created_at"] = datetime.utcnow()
+            if descriptor.has_field("created_at"):
+                row["created_at"] = datetime.utcnow()
 
-            if hasattr(model, "unit_id") and request.headers.get("Unit-ID"):
-                data["unit_id"] = request.headers.get("Unit-ID")
+            if descriptor.has_unit_id and request.headers.get("Unit-ID"):
+                row["unit_id"] = request.headers.get("Unit-ID")
 
             # Update relation fields
-            update_relation(model, data)
-
-            # Detect child tables (list-type fields)
-            # Only include children where the child model has FK to the parent model
-            children = {}
-            parent_data = {}
-            for k, v in data.items():
-                if isinstance(v, list):
-                    try:
-                        child_model = self.get_model(app_label, k)
-                        fk_field = get_foreign_key_field(child_model, model)
-                        if fk_field:
-                            children[k] = v
-                        else:
-                            if v is None or "blob:" not in str(v):
-                                parent_data[k] = v
-
-                    except Exception:
-                        parent_data[k] = v
-                        continue
-
-                elif not isinstance(v, list):
-                    if v is None or "blob:" not in str(v):
-                        parent_data[k] = v
-
-            # Assign file fields if present
-            for field in model._meta.fields:
-                if files and field.name in files:
-                    file_url = self.save_file_and_get_url(files[field.name])
-                    if field.get_internal_type() == "JSONField":
-                        file_url = {"src": file_url, "title": files[field.name]}
-
-                    data[field.name] = file_url
-
-            # If this is a child, set the foreign key to parent_obj
-            if parent_obj and parent_model:
-                fk_field = get_foreign_key_field(model, parent_model)
-                if fk_field:
-                    parent_data[fk_field] = parent_obj
-
-            # Create parent
-            try:
-                obj = model(**parent_data)
-                obj.full_clean()  # Validate model before creating
-                obj.save()
-                # obj = model.objects.create(**parent_data)
-            except Exception as e:
-                raise e
+            update_relation(model, row)
+            references.add(model, row)
+
+            # Assign file fields if present, storing each upload once
+            for field_name in descriptor.field_names.intersection(files):
+                if field_name not in file_urls:
+                    file_urls[field_name] = self.save_file_and_get_url(
+                        files[field_name]
+                    )
+                file_url = file_urls[field_name]
+                if field_name in descriptor.json_fields:
+                    file_url = {"src": file_url, "title": files[field_name].name}
 
-            # Handle children recursively
-            for child_key, records in children.items():
-                try:
-                    child_model = self.get_model(app_label, child_key)
-                except Exception:
-                    continue
-                # Only process if child_model has FK to current model
-                fk_field = get_foreign_key_field(child_model, model)
-                if not fk_field:
-                    continue
-                for record in records:
-                    recursive_create(child_model, record, obj, model)
-            return obj
+                row[field_name] = file_url
 
         try:
-            parent_obj = recursive_create(Model, data)
+            # Savepoint: a rejected child row must not leave its parent behind
+            with transaction.atomic():
+                parent_obj = nested_create(
+                    Model, data, app_label, prepare, batch_size=self.nested_batch_size
+                )
+                if self.check_relations:
+                    references.check()
         except ValidationError as e:
             return Response(e.error_dict, status=status.HTTP_400_BAD_REQUEST)
         except IntegrityError as e:
@@ -719,6 +1071,7 @@ class DynamicModelViewSet(viewsets.ViewSet):
                 {"non_field_errors": [str(e)]}, status=status.HTTP_400_BAD_REQUEST
             )
 
+        self._invalidate(payload_models(Model, data, app_label))
         return Response(model_to_dict(parent_obj), status=status.HTTP_201_CREATED)
 
     @transaction.atomic
@@ -726,58 +1079,53 @@ class DynamicModelViewSet(viewsets.ViewSet):
         Model = self.get_model(app_label, model_name)
         data = dict(request.POST.dict()) if request.POST else dict(request.data)
         files = request.FILES.dict() if request.FILES else {}
-        print("Update data:", files.get("photo"))
-
-        def recursive_update(model, obj, data, parent_obj=None, parent_model=None):
-            update_relation(model, data)
-            # Only include children where the child model has FK to the parent model
-            children = {}
-            parent_data = {}
-            for k, v in data.items():
-                if isinstance(v, list):
-                    try:
-                        child_model = self.get_model(app_label, k)
-                        fk_field = get_foreign_key_field(child_model, model)
-                        if fk_field:
-                            children[k] = v
-                        else:
-                            if v is None or "blob:" not in str(v):
-                                parent_data[k] = v
-
-                    except Exception:
-                        parent_data[k] = v
-                        continue
-
-                elif not isinstance(v, list):
-                    parent_data[k] = v
-
-            # Remove created_at if present
-            if "created_at" in parent_data:
-                del parent_data["created_at"]
-            if "created_by" in parent_data:
-                del parent_data["created_by"]
+        references = ReferenceCheck()
+
+        def prepare_update(model, row):
+            # Before update_relation, which would rename created_by to its
+            # attname
+            drop_creation_audit_fields(model, row)
+            update_relation(model, row)
+            references.add(model, row)
             # Update updated_at if exists
-            if "updated_at" in [f.name for f in model._meta.fields]:
-                parent_data["updated_at"] = datetime.utcnow()
+            if get_descriptor(model).has_field("updated_at"):
+                row["updated_at"] = datetime.utcnow()
+
+        def prepare_child_update(model, row):
+            prepare_update(model, row)
+            if get_descriptor(model).has_field("updated_by"):
+                row["updated_by"] = request.user.id
+
+        def prepare_child_create(model, row):
+            descriptor = get_descriptor(model)
+            drop_creation_audit_fields(model, row)
+            # Set created_by if exists
+            if descriptor.has_field("created_by"):
+                row["created_by"] = request.user.id
 
-            # If this is a child, set the foreign key to parent_obj
-            if parent_obj and parent_model:
-                fk_field = get_foreign_key_field(model, parent_model)
-                if fk_field:
-                    parent_data[fk_field] = parent_obj
+            # Set created_at if exists
+            if descriptor.has_field("created_at"):
+                row["created_at"] = datetime.utcnow()
+
+            if descriptor.has_field("updated_by"):
+                row["updated_by"] = request.user.id
+            update_relation(model, row)
+            references.add(model, row)
+
+        def update_root(model, obj, data):
+            descriptor = get_descriptor(model)
+            parent_data, children = split_payload(model, data, app_label)
+            prepare_update(model, parent_data)
 
             # Update parent object
             for k, v in parent_data.items():
-                if files and k in files:
-                    file_url = self.save_file_and_get_url(files[k])
-                    field = next((f for f in model._meta.fields if f.name == k), None)
-                    if field and field.get_internal_type() == "JSONField":
-                        file_url = {"src": file_url, "title": files[k].name}
+                setattr(obj, k, v)
+            for k in descriptor.field_names.intersection(files):
+                file_url = self.save_file_and_get_url(files[k])
+                if k in descriptor.json_fields:
+                    file_url = {"src": file_url, "title": files[k].name}
 
-                    setattr(obj, field.name, file_url)
-
-                elif v is None or "blob:" not in str(v):
-                    setattr(obj, k, v)
+                setattr(obj, k, file_url)
 
             # try:
             #     obj.full_clean()  # Validate model before saving
@@ -833,101 +1181,23 @@ class DynamicModelViewSet(viewsets.ViewSet):
                 # Skip non-database validation errors
                 pass
 
-            # Handle children recursively
-            for child_key, records in children.items():
-                child_model = self.get_model(app_label, child_key)
-                fk_field = get_foreign_key_field(child_model, model)
-                if not fk_field:
-                    continue
-
-                existing_ids = []
-                child_fields = [f.name for f in child_model._meta.fields]
-                for item in records:
-                    item[fk_field] = obj
-                    if "updated_by" in child_fields:
-                        item["updated_by"] = request.user.id
-
-                    if "id" in item and item["id"]:
-                        try:
-                            child_obj = child_model.objects.get(id=item["id"])
-                            recursive_update(child_model, child_obj, item, obj, model)
-                            existing_ids.append(child_obj.id)
-                        except child_model.DoesNotExist:
-                            # If not found, create new
-                            new_child = recursive_create(child_model, item, obj, model)
-                            existing_ids.append(new_child.id)
-                    else:
-                        new_child = recursive_create(child_model, item, obj, model)
-                        existing_ids.append(new_child.id)
-
-                # Delete removed children
-                child_model.objects.filter(**{fk_field: obj.id}).exclude(
-                    id__in=existing_ids
-                ).delete()
-
-        def recursive_create(model, data, parent_obj=None, parent_model=None):
-            # Set created_by if exists
-            if "created_by" in [f.name for f in model._meta.fields]:
-                data["created_by"] = request.user.id
-
-            # Set created_at if exists
-            if "created_at" in [f.name for f in model._meta.fields]:
-                data["created_at"] = datetime.utcnow()
-
-            update_relation(model, data)
-
-            # Only include children where the child model has FK to the parent model
-            children = {}
-            parent_data = {}
-            for k, v in data.items():
-                if isinstance(v, list):
-                    try:
-                        child_model = self.get_model(app_label, k)
-                        fk_field = get_foreign_key_field(child_model, model)
-                        if fk_field:
-                            children[k] = v
-                        else:
-                            parent_data[k] = v
-                    except Exception:
-                        parent_data[k] = v
-                        continue
-
-                elif not isinstance(v, list):
-                    parent_data[k] = v
-
-            if parent_obj and parent_model:
-                fk_field = get_foreign_key_field(model, parent_model)
-                if fk_field:
-                    parent_data[fk_field] = parent_obj
-
-            try:
-                obj = model(**parent_data)
-                obj.full_clean()  # Validate model before creating
-                obj.save()  # Validate model before creating
-                # obj = model.objects.create(**parent_data)
-            except ValidationError as e:
-                return Response(e.error_list, status=status.HTTP_400_BAD_REQUEST)
-            except IntegrityError as e:
-                # Example for unique constraint violation
-                return Response(
-                    {"non_field_errors": [str(e)]}, status=status.HTTP_400_BAD_REQUEST
-                )
-
-            for child_key, records in children.items():
-                try:
-                    child_model = self.get_model(app_label, child_key)
-                except Exception:
-                    continue
-                fk_field = get_foreign_key_field(child_model, model)
-                if not fk_field:
-                    continue
-                for record in records:
-                    recursive_create(child_model, record, obj, model)
-            return obj
+            # Children are diffed against the database set by set
+            sync_children(
+                [(obj, children)],
+                app_label,
+                prepare_update=prepare_child_update,
+                prepare_create=prepare_child_create,
+                batch_size=self.nested_batch_size,
+            )
 
         try:
             obj = Model.objects.get(pk=pk)
-            recursive_update(Model, obj, data)
+            # Savepoint: a rejected child row must not leave a partial update
+            with transaction.atomic():
+                update_root(Model, obj, data)
+                if self.check_relations:
+                    references.check()
+            self._invalidate(payload_models(Model, data, app_label), cascade=True)
             return Response(model_to_dict(obj))
         except ValidationError as e:
             return Response(e.error_dict, status=status.HTTP_400_BAD_REQUEST)
@@ -943,11 +1213,13 @@ class DynamicModelViewSet(viewsets.ViewSet):
         Model = self.get_model(app_label, model_name)
         try:
             obj = Model.objects.get(pk=pk)
-            if hasattr(obj, "is_deleted"):
+            if get_descriptor(Model).is_soft_delete:
                 obj.is_deleted = True
                 obj.save()
+                self._invalidate([Model])
             else:
                 obj.delete()
+                self._invalidate([Model], cascade=True)
             return Response(model_to_dict(obj))
         except Model.DoesNotExist:
             return Response({"error": "Not found"}, status=status.HTTP_404_NOT_FOUND)
@@ -958,6 +1230,17 @@ class DynamicModelViewSet(viewsets.ViewSet):
         """
         Bulk create items for a model. Does not handle child table data.
         Expects a list of dicts in request.data["items"].
+
+        Optional body keys:
+            response (str) - "full" (default) returns the created rows as
+                serialized in memory, "ids" only their primary keys and
+                "count" only the number of rows sent
+            batch_size (int) - rows per INSERT, default create_many_batch_size
+            ignore_conflicts (bool) - skip rows violating a unique constraint;
+                their primary keys are not known, so use "count"
+            generate_id (dict) - {"column": ..., "options": {...}} stamps
+                items without a value in column with a block of ids reserved
+                at once (see reserve_human_readable_ids)
         """
         Model = self.get_model(app_label, model_name)
         items = request.data.get("items", [])
@@ -965,9 +1248,33 @@ class DynamicModelViewSet(viewsets.ViewSet):
             return Response(
                 {"error": "No items provided"}, status=status.HTTP_400_BAD_REQUEST
             )
+        response_mode = request.data.get("response") or "full"
+        if response_mode not in CREATE_MANY_RESPONSES:
+            return Response(
+                {
+                    "error": "'response' must be one of "
+                    + ", ".join(CREATE_MANY_RESPONSES)
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        batch_size = request.data.get("batch_size")
+        if batch_size in (None, ""):
+            batch_size = self.create_many_batch_size
+        try:
+            if batch_size is not None:
+                batch_size = int(batch_size)
+                if batch_size < 1:
+                    raise ValueError
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "'batch_size' must be a positive integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        ignore_conflicts = bool(request.data.get("ignore_conflicts", False))
 
         # Remove child table keys from each item
-        model_fields = set(f.name for f in Model._meta.fields)
+        descriptor = get_descriptor(Model)
+        model_fields = descriptor.field_names
         cleaned_items = [
             {k: v for k, v in item.items() if k in model_fields} for item in items
         ]
@@ -978,100 +1285,404 @@ class DynamicModelViewSet(viewsets.ViewSet):
                 item["created_by"] = request.user.id
             if "created_at" in model_fields:
                 item["created_at"] = datetime.utcnow()
-            if hasattr(Model, "unit_id") and request.headers.get("Unit-ID"):
+            if descriptor.has_unit_id and request.headers.get("Unit-ID"):
                 item["unit_id"] = request.headers.get("Unit-ID")
-            update_relation(Model, item)
+
+        id_spec = request.data.get("generate_id")
+        if id_spec:
+            column = id_spec.get("column") if isinstance(id_spec, dict) else None
+            if not column or not descriptor.has_field(column):
+                return Response(
+                    {"error": "'generate_id' needs a 'column' of the model"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            unstamped = [item for item in cleaned_items if not item.get(column)]
+            if unstamped:
+                # Reserved inside this transaction, which the error returns
+                # below roll back, so a failed request hands them back
+                block = reserve_human_readable_ids(
+                    Model,
+                    column,
+                    len(unstamped),
+                    id_spec.get("options") or {},
+                    id_spec.get("year_source_field", "issued_date"),
+                )
+                for item, (formatted, _) in zip(unstamped, block):
+                    item[column] = formatted
+
+        try:
+            references = ReferenceCheck()
+            for item in cleaned_items:
+                update_relation(Model, item)
+                references.add(Model, item)
+            if self.check_relations:
+                references.check()
+        except ValidationError as e:
+            transaction.set_rollback(True)
+            return Response(e.error_dict, status=status.HTTP_400_BAD_REQUEST)
 
         objects = [Model(**item) for item in cleaned_items]
 
         try:
             # Model.objects.full_clean()  # Validate model before creating
-            Model.objects.bulk_create(objects)
+            Model.objects.bulk_create(
+                objects, batch_size=batch_size, ignore_conflicts=ignore_conflicts
+            )
         except ValidationError as e:
+            transaction.set_rollback(True)
             return Response(e.error_list, status=status.HTTP_400_BAD_REQUEST)
         except IntegrityError as e:
+            transaction.set_rollback(True)
             # Example for unique constraint violation
             return Response(
                 {"non_field_errors": [str(e)]}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Fetch the created objects from DB to get proper related object instances
-        created_ids = [obj.pk for obj in objects]
-        created_objects = Model.objects.filter(pk__in=created_ids)
-
-        # Return created objects as list of dicts
+        self._invalidate([Model])
+        if response_mode == "count":
+            return Response({"count": len(objects)}, status=status.HTTP_201_CREATED)
+        if response_mode == "ids":
+            return Response(
+                {"ids": [obj.pk for obj in objects]}, status=status.HTTP_201_CREATED
+            )
+        # The objects already hold what was inserted; no need to read them back.
+        # Primary keys are None where the backend cannot return them.
         return Response(
-            [model_to_dict(obj) for obj in created_objects],
+            [model_to_dict(obj) for obj in objects],
             status=status.HTTP_201_CREATED,
         )
 
     @action(detail=False, methods=["post", "get"])
     def get_many(self, request, app_label=None, model_name=None):
         Model = self.get_model(app_label, model_name)
+        return self._cached(request, Model, lambda: self._get_many(request, Model))
 
-        # Parse meta parameter for embed functionality
-        meta_str = request.GET.dict().get("meta", "{}")
-        embed_list = parse_meta_embed(meta_str)
-        valid_embeds = get_embed_fields(Model, embed_list)
+    def _get_many(self, request, Model):
+        query = self._get_many_query(request, Model)
+        if isinstance(query, Response):
+            return query
+        querysets, serialize, pks = query
+        rows = [serialize(obj) for queryset in querysets for obj in queryset]
+        return Response(in_request_order(rows, pks, get_descriptor(Model).pk_name))
 
+    def _get_many_query(self, request, Model):
+        """
+        Rows requested by get_many as (querysets, serialize, pks), or a 400
+        Response.
+
+        Ids are matched against the model's primary key, whatever its name,
+        and deduplicated; pks keeps the request's order for the response.
+        Long id lists are split into several querysets (see pk_lookups).
+        """
+        descriptor = get_descriptor(Model)
         if request.method == "GET":
-            filters = eval(request.GET.dict().get("filter", "{}"))
-            ids = filters.get("id", [])
+            filters = parse_filter_param(request.GET.get("filter"))
+            ids = filters.get("id", filters.get(descriptor.pk_name, []))
         else:
             ids = request.data.get("ids", [])
+        if not isinstance(ids, list):
+            ids = [ids]
+        try:
+            pks = unique_pks(Model, ids)
+        except ValidationError as e:
+            return Response(
+                {"error": f"Invalid ids: {' '.join(e.messages)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        queryset = Model.objects.filter(id__in=ids)
-
-        # Add select_related for embedded fields to optimize queries
-        if valid_embeds:
-            select_related_fields = []
-            for embed_field in valid_embeds:
-                # Remove '_id' suffix to get the relation name
-                relation_name = embed_field.replace("_id", "")
-                select_related_fields.append(relation_name)
-            queryset = queryset.select_related(*select_related_fields)
-
-        if hasattr(Model, "is_deleted"):
+        queryset = Model.objects.all()
+        if descriptor.is_soft_delete:
             queryset = queryset.filter(is_deleted=False)
-        data = [model_to_dict(obj, embed=valid_embeds) for obj in queryset]
-        return Response(data)
+        query = self._detail_query(request, Model, queryset)
+        if isinstance(query, Response):
+            return query
+        queryset, serialize = query
+        querysets = pk_lookups(queryset, pks, self.get_many_chunk_size)
+        return querysets, serialize, pks
 
     @action(detail=False, methods=["put"])
     def update_many(self, request, app_label=None, model_name=None):
+        """
+        Update several rows.
+
+        {"ids": [...], "data": {...}} applies the same changes to every id,
+        or to every row matching {"filter": {...}}, in chunks (see
+        _bulk_target). {"data": [{"id": 1, ...changes}, ...]} applies per-row
+        changes (see _update_rows) and answers with a result per id.
+        """
         Model = self.get_model(app_label, model_name)
-        ids = request.data.get("ids", [])
-        # filters = eval(request.GET.dict().get("filter", "{}"))
-        # ids = request.data.get("filter", {}).get("id", [])
-        # ids = filters.get("id", [])
+        if isinstance(request.data.get("data"), list):
+            return self._update_rows(request, Model, request.data["data"])
+        target = self._bulk_target(request, Model)
+        if isinstance(target, Response):
+            return target
         update_data = request.data.get("data", {})
-        Model.objects.filter(id__in=ids).update(**update_data)
-        return Response(ids)
+        return self._bulk_run(
+            Model, target, "updated", lambda rows: rows.update(**update_data)
+        )
+
+    def _update_rows(self, request, Model, rows):
+        """
+        Apply a list of {"id": ..., ...changes} rows.
+
+        The rows are read in one query and only the columns that differ are
+        written, with one bulk UPDATE per distinct set of changed columns
+        and batch, all in one transaction. Changed fields are validated with
+        clean_fields(). Rows that fail validation (unknown fields, bad values,
+        missing related objects) or do not exist are reported and skipped;
+        the others are applied. Returns {"updated": n, "results":
+        [{"id", "status", "changed" | "errors"}, ...]} in payload order.
+        """
+        descriptor = get_descriptor(Model)
+        pk_field = Model._meta.pk
+        results = []
+        entries = []
+        for row in rows:
+            if not isinstance(row, dict) or row.get("id") in (None, ""):
+                results.append(
+                    {"id": None, "status": 400, "errors": {"id": ["Required."]}}
+                )
+                continue
+            try:
+                pk = pk_field.to_python(row["id"])
+            except ValidationError as e:
+                results.append(
+                    {"id": row["id"], "status": 400, "errors": {"id": e.messages}}
+                )
+                continue
+            result = {"id": pk, "status": 200}
+            results.append(result)
+            entries.append((result, pk, row))
+
+        queryset = Model.objects.all()
+        if descriptor.is_soft_delete:
+            queryset = queryset.filter(is_deleted=False)
+        existing = queryset.in_bulk([pk for _, pk, _ in entries])
+
+        prepared = []
+        for result, pk, row in entries:
+            obj = existing.get(pk)
+            if obj is None:
+                result.update(status=404, errors={"id": ["Not found."]})
+                continue
+            row = {k: v for k, v in row.items() if k != "id"}
+            drop_creation_audit_fields(Model, row)
+            unknown = [
+                key
+                for key in row
+                if descriptor.get_field(key) is None
+                and descriptor.get_field_by_attname(key) is None
+            ]
+            if unknown:
+                result.update(
+                    status=400, errors={key: ["Unknown field."] for key in unknown}
+                )
+                continue
+            if descriptor.has_field("updated_at"):
+                row["updated_at"] = datetime.utcnow()
+            try:
+                update_relation(Model, row)
+            except ValidationError as e:
+                result.update(status=400, errors=e.message_dict)
+                continue
+            prepared.append((result, obj, row))
+
+        # One query per ForeignKey field for all rows; rows pointing at
+        # missing objects are rejected individually
+        missing = {}
+        if self.check_relations:
+            for name, ids in find_missing_references(
+                Model, [row for _, _, row in prepared]
+            ).items():
+                field = descriptor.relation_fields[name]
+                missing[field.attname] = (name, {str(i) for i in ids})
+
+        changes = []
+        for result, obj, row in prepared:
+            errors = {
+                name: [f"Related object '{row[attname]}' does not exist."]
+                for attname, (name, ids) in missing.items()
+                if row.get(attname) is not None and str(row[attname]) in ids
+            }
+            if not errors:
+                try:
+                    changed = apply_changes(obj, row)
+                    clean_changed_fields(obj, changed)
+                except ValidationError as e:
+                    errors = e.message_dict
+            if errors:
+                result.update(status=400, errors=errors)
+                continue
+            changed = [name for name in changed if name not in AUDIT_FIELDS]
+            result["changed"] = changed
+            if changed:
+                changes.append((obj, changed + sorted(AUDIT_FIELDS & set(row))))
+
+        try:
+            with transaction.atomic():
+                updated = bulk_update_changed(
+                    Model, changes, self.update_many_batch_size
+                )
+        except DatabaseError as e:
+            # IntegrityError, or DataError for values the column rejects
+            return Response(
+                {"non_field_errors": [str(e)]}, status=status.HTTP_400_BAD_REQUEST
+            )
+        if updated:
+            self._invalidate([Model])
+        return Response({"updated": updated, "results": results})
 
     @action(detail=False, methods=["delete"])
     def delete_many(self, request, app_label=None, model_name=None):
+        """
+        Delete the rows in "ids", or every row matching "filter", in chunks
+        (see _bulk_target). Soft-deletable models are flagged is_deleted.
+        """
         Model = self.get_model(app_label, model_name)
-        ids = request.data.get("ids", [])
-        # ids = request.data.get("filter", {}).get("id", [])
-        # ids = filters.get("id", [])
-        if hasattr(Model, "is_deleted"):
-            Model.objects.filter(id__in=ids).update(is_deleted=True)
+        target = self._bulk_target(request, Model)
+        if isinstance(target, Response):
+            return target
+        if get_descriptor(Model).is_soft_delete:
+            return self._bulk_run(
+                Model,
+                target,
+                "deleted",
+                lambda rows: rows.filter(is_deleted=False).update(is_deleted=True),
+            )
+        # delete() only loads rows when cascades or signals need them, and
+        # then one chunk at a time
+        return self._bulk_run(
+            Model,
+            target,
+            "deleted",
+            lambda rows: rows.delete()[1].get(Model._meta.label, 0),
+            cascade=True,
+        )
+
+    def _bulk_target(self, request, Model):
+        """
+        Rows selected by update_many/delete_many, as (queryset, chunks,
+        response_mode) or a 400 Response.
+
+        "ids" selects rows by primary key (deduplicated); "filter" selects the
+        rows list would show for that filter, read in primary key order one
+        chunk at a time. chunks yields lists of at most "chunk_size" (default
+        bulk_chunk_size) primary keys. response_mode is "ids" (default with
+        ids) or "count" (default with filter).
+        """
+        data = request.data
+        chunk_size = data.get("chunk_size")
+        if chunk_size is not None and (
+            not isinstance(chunk_size, int)
+            or isinstance(chunk_size, bool)
+            or chunk_size < 1
+        ):
+            return Response(
+                {"error": "'chunk_size' must be a positive integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        queryset = Model.objects.all()
+        size = chunk_size_for(queryset, chunk_size or self.bulk_chunk_size)
+
+        filters = data.get("filter")
+        if filters is not None:
+            # An empty filter would select the whole table
+            if not isinstance(filters, dict) or not filters:
+                return Response(
+                    {"error": "'filter' must be a non-empty object"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            try:
+                queryset = queryset.filter(parse_filters(filters, Model))
+            except ValueError as e:
+                return Response(
+                    {"error": f"Invalid filter parameter: {str(e)}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            queryset = self._scope(request, Model, queryset, filters)
+            chunks = queryset_chunks(queryset, size)
+            default_mode = "count"
         else:
-            Model.objects.filter(id__in=ids).delete()
-        return Response(ids)
+            ids = data.get("ids", [])
+            if not isinstance(ids, list):
+                return Response(
+                    {"error": "'ids' must be a list"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            try:
+                pks = unique_pks(Model, ids)
+            except ValidationError as e:
+                return Response(
+                    {"error": f"Invalid ids: {' '.join(e.messages)}"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            chunks = id_chunks(pks, size)
+            default_mode = "ids"
+
+        response_mode = data.get("response", default_mode)
+        if response_mode not in BULK_RESPONSES:
+            return Response(
+                {"error": f"'response' must be one of {', '.join(BULK_RESPONSES)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return queryset, chunks, response_mode
+
+    def _bulk_run(self, Model, target, key, run, cascade=False):
+        """
+        Call run(rows) for each chunk of a _bulk_target, each in a short
+        transaction of its own so locks are released between chunks. run
+        returns the number of rows it changed.
+        """
+        queryset, chunks, response_mode = target
+        pks = []
+        affected = 0
+        try:
+            for chunk in chunks:
+                with transaction.atomic(using=queryset.db):
+                    affected += run(queryset.filter(pk__in=chunk))
+                pks.extend(chunk)
+        # Earlier chunks stay committed; report how far the call got
+        except IntegrityError as e:
+            return Response(
+                {"non_field_errors": [str(e)], key: affected},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except ValidationError as e:
+            return Response(
+                {"error": " ".join(e.messages), key: affected},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        except (FieldDoesNotExist, FieldError, TypeError, ValueError) as e:
+            return Response(
+                {"error": str(e), key: affected}, status=status.HTTP_400_BAD_REQUEST
+            )
+        finally:
+            if affected:
+                self._invalidate([Model], cascade=cascade)
+        if response_mode == "count":
+            return Response({key: affected})
+        return Response(pks)
 
     @action(detail=False, methods=["get"])
     def export_data(self, request, app_label=None, model_name=None):
-        Model = self.get_model(app_label, model_name)
-        queryset = Model.objects.all()
-        fields = [field.name for field in Model._meta.fields]
+        """
+        Stream the model as CSV.
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(fields)
-        for obj in queryset:
-            writer.writerow([getattr(obj, field) for field in fields])
+        Rows are read in chunks through values_list() and written out as they
+        arrive, so memory stays flat regardless of table size. ForeignKeys are
+        exported as raw ids, or as the related display column with ?fk=display.
+        """
+        Model = self.get_model(app_label, model_name)
+        fk_mode = request.GET.get("fk", "id")
+        if fk_mode not in ("id", "display"):
+            return Response(
+                {"error": "'fk' must be 'id' or 'display'"}, status=400
+            )
+        rows = export_rows(
+            Model.objects.all(), fk_mode=fk_mode, chunk_size=self.export_chunk_size
+        )
 
-        response = Response(output.getvalue(), content_type="text/csv")
+        response = StreamingHttpResponse(stream_csv(rows), content_type="text/csv")
         response["Content-Disposition"] = f"attachment; filename={model_name}.csv"
         return response
 
@@ -1082,12 +1693,27 @@ class DynamicModelViewSet(viewsets.ViewSet):
         if not file:
             return Response({"error": "No file uploaded"}, status=400)
 
-        decoded_file = file.read().decode("utf-8").splitlines()
-        reader = csv.DictReader(decoded_file)
-        objects = [Model(**row) for row in reader]
-        Model.objects.bulk_create(objects)
+        try:
+            batch_size = int(request.data.get("batch_size") or self.import_batch_size)
+            if batch_size < 1:
+                raise ValueError
+        except (TypeError, ValueError):
+            return Response(
+                {"error": "'batch_size' must be a positive integer"}, status=400
+            )
+        encoding = request.data.get("encoding") or "utf-8-sig"
+
+        try:
+            result = import_csv(Model, file, batch_size=batch_size, encoding=encoding)
+        except LookupError:
+            return Response({"error": f"Unknown encoding '{encoding}'"}, status=400)
+        except (ValueError, csv.Error) as e:
+            # Includes UnicodeDecodeError; nothing is kept from a broken file
+            return Response({"error": f"Could not import file: {e}"}, status=400)
 
-        return Response({"message": "Imported successfully"})
+        if result.imported:
+            self._invalidate([Model])
+        return Response(result.as_dict())
 
     @action(detail=False, methods=["get", "post"], url_path="generate_id")
     def generate_id_action(self, request, app_label=None, model_name=None):
@@ -1097,6 +1723,8 @@ class DynamicModelViewSet(viewsets.ViewSet):
             column (str, required) - model field to store numeric/string id
             options (json string or object) - options dict
             year_source_field (str) - optional field name for year change detection
+            count (int) - reserve a block of consecutive ids; the response is
+                then {"ids": [...], "raw": [...]}
         """
         Model = self.get_model(app_label, model_name)
         # Gather data from request
@@ -1110,8 +1738,7 @@ class DynamicModelViewSet(viewsets.ViewSet):
         if not column:
             return Response({"error": "'column' parameter required"}, status=400)
         # Validate column exists
-        field_names = [f.name for f in Model._meta.fields]
-        if column not in field_names:
+        if not get_descriptor(Model).has_field(column):
             return Response(
                 {"error": f"Column '{column}' not found on model"}, status=400
             )
@@ -1125,6 +1752,27 @@ class DynamicModelViewSet(viewsets.ViewSet):
         if raw_options is None:
             raw_options = {}
         year_source_field = data.get("year_source_field", "issued_date")
+        count = data.get("count")
+        if count not in (None, ""):
+            try:
+                count = int(count)
+                if not 1 <= count <= MAX_ID_BLOCK:
+                    raise ValueError
+            except (TypeError, ValueError):
+                return Response(
+                    {"error": f"'count' must be between 1 and {MAX_ID_BLOCK}"},
+                    status=400,
+                )
+            try:
+                block = reserve_human_readable_ids(
+                    Model, column, count, raw_options, year_source_field
+                )
+            except Exception as e:
+                logger.exception("Failed generating ids")
+                return Response({"error": str(e)}, status=400)
+            return Response(
+                {"ids": [f for f, _ in block], "raw": [n for _, n in block]}
+            )
         try:
             formatted, raw_numeric = generate_human_readable_id(
                 Model, column, raw_options, year_source_field=year_source_field
@@ -1134,6 +1782,89 @@ class DynamicModelViewSet(viewsets.ViewSet):
             return Response({"error": str(e)}, status=400)
         return Response({"id": formatted, "raw": raw_numeric})
 
+    def batch(self, request):
+        """
+        Run several read calls (list, retrieve, get_many) in one round trip.
+
+        Body: {"requests": [{"resource": "app_label/model_name", "action":
+        "list", "params": {...}}, ...]}. params are the action's query
+        parameters as JSON values (filter, sort, range, meta, fields,
+        cursor), plus "id" for retrieve and "ids" for get_many. Identical
+        sub-requests run once. The response has one {"status", "data",
+        "headers"} entry per sub-request, in order; a failing sub-request
+        does not fail the others.
+        """
+        items = request.data.get("requests") if isinstance(request.data, dict) else None
+        if not isinstance(items, list):
+            return Response(
+                {"error": "'requests' must be a list"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(items) > MAX_BATCH_REQUESTS:
+            return Response(
+                {"error": f"At most {MAX_BATCH_REQUESTS} requests per batch"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        results = {}
+        responses = []
+        for item in items:
+            try:
+                app_label, model_name, action_name, params = parse_batch_item(item)
+            except ValueError as e:
+                responses.append(
+                    {"status": 400, "data": {"error": str(e)}, "headers": {}}
+                )
+                continue
+            key = batch_key(app_label, model_name, action_name, params)
+            if key not in results:
+                results[key] = self._batch_call(
+                    request, app_label, model_name, action_name, params
+                )
+            responses.append(results[key])
+        return Response({"responses": responses})
+
+    @staticmethod
+    async def _awaited(awaitable):
+        return await awaitable
+
+    def _batch_call(self, request, app_label, model_name, action_name, params):
+        """Run one batch sub-request through its action on a fresh view."""
+        if get_model(app_label, model_name) is None:
+            return {"status": 404, "data": {"error": "Invalid model"}, "headers": {}}
+        sub_request = batch_request(request, params)
+        kwargs = {"app_label": app_label, "model_name": model_name}
+        if action_name == "retrieve":
+            kwargs["pk"] = str(params["id"])
+
+        view = type(self)()
+        view.action = action_name
+        view.args = ()
+        view.kwargs = kwargs
+        view.request = sub_request
+        view.format_kwarg = None
+        view.headers = {}
+        try:
+            # Per model and action, as if the call had been made on its own
+            view.check_permissions(sub_request)
+            response = getattr(view, action_name)(sub_request, **kwargs)
+            if asyncio.iscoroutine(response):
+                # Actions of AsyncDynamicModelViewSet
+                response = async_to_sync(self._awaited)(response)
+        except APIException as exc:
+            response = view.handle_exception(exc)
+        except Exception:
+            logger.exception(
+                "Batch %s on %s/%s failed", action_name, app_label, model_name
+            )
+            return {"status": 500, "data": {"error": "Internal error"}, "headers": {}}
+        return {
+            "status": response.status_code,
+            "data": response.data,
+            "headers": {
+                name: response[name] for name in BATCH_HEADERS if name in response
+            },
+        }
+
 
 @api_view(["GET"])
 def get_model_schema(request, app_label, model_name):
@@ -1141,52 +1872,49 @@ def get_model_schema(request, app_label, model_name):
     if not Model:
         return Response({"error": "Invalid model"}, status=400)
 
-    fields = []
-    for field in Model._meta.fields:
-        if field.name in [
-            # "id",
-            "unit_id",
-            "created_at",
-            "updated_at",
-            "modified_at",
-            "created_by",
-            "updated_by",
-            "modified_by",
-        ]:
-            continue
-        field_type = field.get_internal_type()
-        is_fk = field.is_relation and hasattr(field, "related_model")
-        field_info = {
-            "name": field.name,
-            "type": field_type,
-            "is_fk": is_fk,
-            "related_model": None,
-            "related_name": None,
-            "is_required": field.blank is False and field.null is False,
-            # "is_unique": field.unique,
-            # "default": field.default if field.default is not None else None,
-            # "verbose_name": field.verbose_name,
-            # "help_text": field.help_text,
-        }
-        if is_fk:
-            field_info["related_model"] = (
-                f"{field.related_model._meta.app_label}/{field.related_model._meta.model_name}"
-            )
-            field_info["related_name"] = getattr(
-                field.related_model._meta,
-                "verbose_name_field",
-                (
-                    "name"
-                    if "name"
-                    in [f.name for f in field.related_model._meta.get_fields()]
-                    else field.related_model._meta.fields[0].name
-                ),
+    schema, etag = get_model_schema_cached(Model)
+    return _schema_response(request, schema, etag)
+
+
+@api_view(["GET"])
+def get_model_schemas(request):
+    """
+    Schemas of several models in one response.
+
+    ?models=app/model,app/model picks models explicitly; otherwise every
+    exposed model is returned, optionally narrowed with ?app_label=a,b.
+    """
+    requested = request.GET.get("models")
+    if requested:
+        models = []
+        unknown = []
+        for name in requested.split(","):
+            app_label, _, model_name = name.strip().replace(".", "/").partition("/")
+            Model = get_model(app_label, model_name) if model_name else None
+            if Model is None:
+                unknown.append(name.strip())
+            else:
+                models.append(Model)
+        if unknown:
+            return Response(
+                {"error": f"Invalid models: {', '.join(unknown)}"}, status=400
             )
+    else:
+        app_labels = request.GET.get("app_label")
+        models = exposed_models(app_labels.split(",") if app_labels else None)
 
-        fields.append(field_info)
+    cached = [get_model_schema_cached(Model) for Model in models]
+    schemas = [schema for schema, _ in cached]
+    etag = schema_etag([tag for _, tag in cached])
+    return _schema_response(request, schemas, etag)
 
-    return Response({
-        "app_label": app_label,
-        "model_name": model_name,
-        "fields": fields,
-    })
+
+def _schema_response(request, data, etag):
+    # Schemas only change with a deploy, so clients revalidate cheaply
+    if etag_matches(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data)
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    return response
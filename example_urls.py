@@ -6,13 +6,31 @@ Add this to your main urls.py or create a separate urls file for the API.
 
 from django.urls import path
 from rest_framework.routers import DefaultRouter
-from django_react_admin.views import DynamicModelViewSet, get_model_schema
+from django_react_admin.views import (
+    DynamicModelViewSet,
+    get_model_schema,
+    get_model_schemas,
+)
 
 # Create a router and register the dynamic viewset
 router = DefaultRouter()
 
 # URL patterns
 urlpatterns = [
+    # Model schema endpoints (before the CRUD routes, which would match them)
+    path('api/schema/', 
+         get_model_schemas, 
+         name='model-schemas'),
+    
+    path('api/schema/<str:app_label>/<str:model_name>/', 
+         get_model_schema, 
+         name='model-schema'),
+    
+    # Several read calls in one round trip
+    path('api/batch/', 
+         DynamicModelViewSet.as_view({'post': 'batch'}), 
+         name='model-batch'),
+    
     # Dynamic model CRUD endpoints
     path('api/<str:app_label>/<str:model_name>/', 
          DynamicModelViewSet.as_view({
@@ -54,11 +72,7 @@ urlpatterns = [
     path('api/<str:app_label>/<str:model_name>/import_data/', 
          DynamicModelViewSet.as_view({'post': 'import_data'}), 
          name='model-import'),
-    
-    # Model schema endpoint
-    path('api/schema/<str:app_label>/<str:model_name>/', 
-         get_model_schema, 
-         name='model-schema'),
+
 ]
 
 # Example usage with embed functionality:
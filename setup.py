@@ -3,12 +3,15 @@ from setuptools import find_packages, setup
 setup(
     name="django-react-admin",
     version="0.5.3",
-    packages=find_packages(),
+    packages=find_packages(exclude=("benchmarks", "benchmarks.*", "tests", "tests.*")),
     include_package_data=True,
     install_requires=[
-        "Django>=3.3",
+        "Django>=4.2",
         "djangorestframework",
     ],
+    extras_require={
+        "fast": ["orjson"],
+    },
     description="Dynamic Django DRF backend for React-Admin",
     author="ASM Saiful Islam Chowdhury",
     author_email="asmsaifs@yahoo.com",
@@ -19,5 +22,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires='>=3.6',
+    python_requires='>=3.8',
 )
\ No newline at end of file
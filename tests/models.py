@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.db import models
+
+
+class Company(models.Model):
+    name = models.CharField(max_length=100)
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=100)
+    company_id = models.ForeignKey(
+        Company, null=True, blank=True, on_delete=models.SET_NULL
+    )
+
+
+class Order(models.Model):
+    title = models.CharField(max_length=100)
+    status = models.CharField(
+        max_length=10,
+        default="open",
+        choices=[("open", "Open"), ("paid", "Paid")],
+    )
+    author_id = models.ForeignKey(
+        Author, null=True, blank=True, on_delete=models.CASCADE
+    )
+    total = models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL
+    )
+
+
+class OrderLine(models.Model):
+    order_id = models.ForeignKey(Order, on_delete=models.CASCADE, related_name="lines")
+    product = models.CharField(max_length=100)
+    qty = models.IntegerField(default=1)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL
+    )
+
+
+class LineNote(models.Model):
+    orderline_id = models.ForeignKey(OrderLine, on_delete=models.CASCADE)
+    text = models.CharField(max_length=100)
+
+
+class Invoice(models.Model):
+    number = models.IntegerField(null=True, blank=True)
+    title = models.CharField(max_length=100, blank=True)
+
+
+class Article(models.Model):
+    title = models.CharField(max_length=100)
+    body = models.TextField(blank=True)
+
+    class ReactAdmin:
+        search_fields = ("title", "body")
+        search_backend = "fulltext"
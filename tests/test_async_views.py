@@ -0,0 +1,72 @@
+import json
+
+from django.test import TestCase
+
+from django_react_admin.exports import aexport_rows
+
+from .models import Author, Order
+
+
+class AsyncViewSetTests(TestCase):
+    def setUp(self):
+        self.author = Author.objects.create(name="Ann")
+        self.orders = [
+            Order.objects.create(title=f"Order {i}", author_id=self.author)
+            for i in range(3)
+        ]
+
+    async def test_list(self):
+        response = await self.async_client.get(
+            "/async/tests/order/", {"range": "[0,1]", "sort": '["id","DESC"]'}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Range"], "0-1/3")
+        self.assertEqual(
+            [row["id"] for row in response.json()],
+            [self.orders[2].id, self.orders[1].id],
+        )
+
+    async def test_retrieve_with_embed(self):
+        order = self.orders[0]
+        response = await self.async_client.get(
+            f"/async/tests/order/{order.id}/",
+            {"meta": json.dumps({"embed": ["author_id"]})},
+        )
+        self.assertEqual(response.json()["author"]["name"], "Ann")
+        missing = await self.async_client.get("/async/tests/order/999/")
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_get_many_keeps_request_order(self):
+        first, _, third = self.orders
+        response = await self.async_client.get(
+            "/async/tests/order/get_many/",
+            {"filter": json.dumps({"id": [third.id, first.id, third.id]})},
+        )
+        self.assertEqual([row["id"] for row in response.json()], [third.id, first.id])
+
+    async def test_export_streams_from_an_async_iterator(self):
+        response = await self.async_client.get("/async/tests/order/export_data/")
+        self.assertTrue(response.is_async)
+        content = b"".join([chunk async for chunk in response.streaming_content])
+        lines = content.decode().splitlines()
+        self.assertEqual(
+            lines[0], "id,title,status,author_id,total,updated_at,created_by"
+        )
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(
+            lines[1], f"{self.orders[0].id},Order 0,open,{self.author.id},0.00,,"
+        )
+
+    async def test_export_rows_across_chunks(self):
+        queryset = Order.objects.order_by("id")
+        rows = [row async for row in aexport_rows(queryset, chunk_size=2)]
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(
+            [row[1] for row in rows[1:]], ["Order 0", "Order 1", "Order 2"]
+        )
+
+    async def test_export_rejects_bad_fk_mode(self):
+        response = await self.async_client.get(
+            "/async/tests/order/export_data/", {"fk": "name"}
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,95 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.batch import MAX_BATCH_REQUESTS
+
+from .models import Author, Order
+
+
+class BatchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+        self.orders = [
+            Order.objects.create(title=f"Order {i}", author_id=self.author)
+            for i in range(3)
+        ]
+
+    def batch(self, requests, url="/api/batch/"):
+        response = self.client.post(url, {"requests": requests}, format="json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()["responses"]
+
+    def read_calls(self):
+        first, _, third = self.orders
+        return [
+            {
+                "resource": "tests/order",
+                "action": "list",
+                "params": {"sort": ["id", "DESC"], "range": [0, 1]},
+            },
+            {
+                "resource": "tests/order",
+                "action": "retrieve",
+                "params": {"id": first.id, "meta": {"embed": ["author_id"]}},
+            },
+            {
+                "resource": "tests/author",
+                "action": "get_many",
+                "params": {"ids": [self.author.id]},
+            },
+            {
+                "resource": "tests/order",
+                "action": "get_many",
+                "params": {"ids": [third.id, first.id]},
+            },
+        ]
+
+    def assert_read_calls(self, responses):
+        first, second, third = self.orders
+        listed, retrieved, authors, orders = responses
+        self.assertEqual(listed["status"], 200)
+        self.assertEqual(listed["headers"], {"Content-Range": "0-1/3"})
+        self.assertEqual([row["id"] for row in listed["data"]], [third.id, second.id])
+        self.assertEqual(retrieved["data"]["author"]["name"], "Ann")
+        self.assertEqual(authors["data"][0]["name"], "Ann")
+        self.assertEqual([row["id"] for row in orders["data"]], [third.id, first.id])
+
+    def test_runs_each_call(self):
+        self.assert_read_calls(self.batch(self.read_calls()))
+
+    def test_async_viewset(self):
+        self.assert_read_calls(self.batch(self.read_calls(), url="/async/batch/"))
+
+    def test_identical_calls_run_once(self):
+        call = self.read_calls()[3]
+        with self.assertNumQueries(1):
+            responses = self.batch([call, call])
+        self.assertEqual(responses[0], responses[1])
+
+    def test_failures_stay_in_their_entry(self):
+        responses = self.batch(
+            [
+                {"resource": "tests", "action": "list"},
+                {"resource": "tests/nothing", "action": "list"},
+                {
+                    "resource": "tests/order",
+                    "action": "retrieve",
+                    "params": {"id": 999},
+                },
+                {"resource": "tests/order", "action": "list"},
+            ]
+        )
+        self.assertEqual([r["status"] for r in responses], [400, 404, 404, 200])
+        self.assertEqual(
+            responses[0]["data"], {"error": "'resource' must be 'app_label/model_name'"}
+        )
+
+    def test_too_many_calls(self):
+        call = {"resource": "tests/order", "action": "list"}
+        response = self.client.post(
+            "/api/batch/",
+            {"requests": [call] * (MAX_BATCH_REQUESTS + 1)},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,80 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import Author, Order, OrderLine
+
+
+class ChunkedBulkTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+        self.orders = [
+            Order.objects.create(title=f"Order {i}", author_id=self.author)
+            for i in range(5)
+        ]
+
+    def update_many(self, **data):
+        return self.client.put("/api/tests/order/update_many/", data, format="json")
+
+    def delete_many(self, **data):
+        return self.client.delete("/api/tests/order/delete_many/", data, format="json")
+
+    def statements(self, queries, verb):
+        return [q for q in queries.captured_queries if q["sql"].startswith(verb)]
+
+    def test_update_by_ids_in_chunks(self):
+        ids = [order.id for order in self.orders]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.update_many(
+                ids=ids + ids[:1], data={"status": "paid"}, chunk_size=2
+            )
+        self.assertEqual(response.status_code, 200)
+        # Deduplicated, in request order
+        self.assertEqual(response.json(), ids)
+        self.assertEqual(len(self.statements(queries, "UPDATE")), 3)
+        self.assertEqual(Order.objects.filter(status="paid").count(), 5)
+
+    def test_update_by_filter_reports_a_count(self):
+        self.orders[0].status = "paid"
+        self.orders[0].save()
+        response = self.update_many(
+            filter={"status": "open"}, data={"title": "Bulk"}, chunk_size=2
+        )
+        self.assertEqual(response.json(), {"updated": 4})
+        self.assertEqual(Order.objects.filter(title="Bulk").count(), 4)
+        self.assertEqual(
+            self.update_many(filter={"status": "paid"}, data={}, response="ids").json(),
+            [self.orders[0].id],
+        )
+
+    def test_empty_filter_is_rejected(self):
+        response = self.update_many(filter={}, data={"status": "paid"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"error": "'filter' must be a non-empty object"}
+        )
+        self.assertFalse(Order.objects.filter(status="paid").exists())
+
+    def test_bad_chunk_size_and_ids(self):
+        response = self.update_many(ids=[1], data={}, chunk_size=0)
+        self.assertEqual(
+            response.json(), {"error": "'chunk_size' must be a positive integer"}
+        )
+        response = self.delete_many(ids=["x"])
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.json()["error"].startswith("Invalid ids:"))
+
+    def test_delete_by_ids_cascades(self):
+        first, second = self.orders[:2]
+        OrderLine.objects.create(order_id=first, product="p")
+        response = self.delete_many(ids=[first.id, second.id], chunk_size=1)
+        self.assertEqual(response.json(), [first.id, second.id])
+        self.assertEqual(Order.objects.count(), 3)
+        self.assertFalse(OrderLine.objects.exists())
+
+    def test_delete_by_filter(self):
+        response = self.delete_many(filter={"title": "Order 1"}, response="count")
+        self.assertEqual(response.json(), {"deleted": 1})
+        self.assertEqual(Order.objects.count(), 4)
@@ -0,0 +1,55 @@
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Author
+
+
+class InvalidationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+
+    def test_uncached_viewset_writes_skip_the_cache(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.client.post(
+                "/api/tests/author/", {"name": "Ann"}, format="json"
+            )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(callbacks, [])
+
+    def test_cached_viewset_writes_invalidate_reads(self):
+        Author.objects.create(name="Ann")
+        first = self.client.get("/cached/tests/author/")
+        self.assertEqual(first["Content-Range"], "0-9/1")
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.client.post("/cached/tests/author/", {"name": "Bob"}, format="json")
+        self.assertEqual(len(callbacks), 1)
+
+        second = self.client.get("/cached/tests/author/")
+        self.assertEqual(second["Content-Range"], "0-9/2")
+        self.assertNotEqual(first["ETag"], second["ETag"])
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+        Author.objects.create(name="Ann")
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.client.get("/cached/tests/author/")["ETag"]
+        response = self.client.get(
+            "/cached/tests/author/", HTTP_IF_NONE_MATCH=f'"other", {etag}'
+        )
+        self.assertEqual(response.status_code, 304)
+        response = self.client.get(
+            "/cached/tests/author/", HTTP_IF_NONE_MATCH=f"W/{etag}"
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_wildcard_is_answered_in_full(self):
+        response = self.client.get("/cached/tests/author/", HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["name"], "Ann")
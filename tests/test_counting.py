@@ -0,0 +1,50 @@
+import json
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Author
+
+
+class CountStrategyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        for i in range(5):
+            Author.objects.create(name=f"Author {i}")
+
+    def list(self, count, range_="[0,1]"):
+        return self.client.get(
+            "/api/tests/author/",
+            {"range": range_, "meta": json.dumps({"count": count})},
+        )
+
+    def test_exact(self):
+        response = self.list("exact")
+        self.assertEqual(response["Content-Range"], "0-1/5")
+        self.assertEqual(len(response.json()), 2)
+
+    def test_has_more_skips_the_count(self):
+        with self.assertNumQueries(1):
+            response = self.list("has_more")
+        # One row past the page stands in for the total
+        self.assertEqual(response["Content-Range"], "0-1/3")
+        self.assertEqual(len(response.json()), 2)
+        last = self.list("has_more", range_="[4,5]")
+        self.assertEqual(last["Content-Range"], "4-5/5")
+        self.assertEqual(len(last.json()), 1)
+
+    def test_cached_count_is_reused(self):
+        self.assertEqual(self.list("cached")["Content-Range"], "0-1/5")
+        Author.objects.create(name="Late")
+        # Served from the cache until count_cache_timeout expires
+        with self.assertNumQueries(1):
+            response = self.list("cached")
+        self.assertEqual(response["Content-Range"], "0-1/5")
+        self.assertEqual(self.list("exact")["Content-Range"], "0-1/6")
+
+    def test_invalid_strategy(self):
+        response = self.list("guess")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Invalid count strategy 'guess'"})
@@ -0,0 +1,52 @@
+import json
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Author, Order
+
+GENERATE_ID = {"column": "title", "options": {"prefix": "ORD-", "pad_length": 4}}
+
+
+class CreateManyTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+
+    def create_many(self, items, **data):
+        return self.client.post(
+            "/api/tests/order/create_many/", {"items": items, **data}, format="json"
+        )
+
+    def test_stamps_a_reserved_block_of_ids(self):
+        items = [{"author_id": self.author.id}, {"title": "Own"}, {}]
+        response = self.create_many(items, generate_id=GENERATE_ID, response="ids")
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(
+            list(Order.objects.order_by("id").values_list("title", flat=True)),
+            ["ORD-0001", "Own", "ORD-0002"],
+        )
+        # The next block continues after it
+        response = self.client.get(
+            "/api/tests/order/generate_id/",
+            {"column": "title", "options": json.dumps(GENERATE_ID["options"])},
+        )
+        self.assertEqual(response.json()["id"], "ORD-0003")
+
+    def test_failed_request_returns_its_ids(self):
+        response = self.create_many(
+            [{"author_id": self.author.id}, {"author_id": 999}],
+            generate_id=GENERATE_ID,
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Order.objects.exists())
+        response = self.create_many([{}], generate_id=GENERATE_ID)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Order.objects.get().title, "ORD-0001")
+
+    def test_generate_id_needs_a_column(self):
+        response = self.create_many([{}], generate_id={"column": "number"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"error": "'generate_id' needs a 'column' of the model"}
+        )
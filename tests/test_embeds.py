@@ -0,0 +1,69 @@
+import json
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.instrumentation import max_queries
+
+from .models import Author, Company, LineNote, Order, OrderLine
+
+
+class EmbedQueryTests(TestCase):
+    # Page, count, then one select_related join for author.company and one
+    # prefetch query per reverse level (lines, lines.linenote)
+    BUDGET = 4
+
+    @classmethod
+    def setUpTestData(cls):
+        companies = [Company.objects.create(name=f"Company {i}") for i in range(3)]
+        authors = [
+            Author.objects.create(name=f"Author {i}", company_id=companies[i % 3])
+            for i in range(6)
+        ]
+        for i in range(40):
+            order = Order.objects.create(title=f"Order {i}", author_id=authors[i % 6])
+            lines = OrderLine.objects.bulk_create(
+                OrderLine(order_id=order, product=f"product {j}") for j in range(3)
+            )
+            LineNote.objects.bulk_create(
+                LineNote(orderline_id=line, text="note") for line in lines
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def list_orders(self, size, embed):
+        return self.client.get(
+            "/api/tests/order/",
+            {"range": f"[0,{size - 1}]", "meta": json.dumps({"embed": embed})},
+        )
+
+    def test_forward_and_reverse_embeds_in_fixed_queries(self):
+        with max_queries(self.BUDGET):
+            response = self.list_orders(25, ["author.company", "lines.linenote"])
+        self.assertEqual(response.status_code, 200)
+        rows = response.json()
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(rows[0]["author"]["company"]["name"], "Company 0")
+        self.assertEqual(len(rows[0]["lines"]), 3)
+        self.assertEqual(rows[0]["lines"][0]["linenote"][0]["text"], "note")
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        counts = []
+        for size in (2, 40):
+            with max_queries(self.BUDGET) as recorder:
+                self.list_orders(size, ["author.company", "lines.linenote"])
+            counts.append(recorder.count)
+        self.assertEqual(counts[0], counts[1])
+
+    def test_embed_limit_slices_each_parent(self):
+        with max_queries(self.BUDGET):
+            response = self.client.get(
+                "/api/tests/order/",
+                {
+                    "range": "[0,9]",
+                    "meta": json.dumps({"embed": ["lines"], "embed_limit": 2}),
+                },
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(all(len(row["lines"]) == 2 for row in response.json()))
@@ -0,0 +1,49 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Author, Order
+
+HEADER = "id,title,status,author_id,total,updated_at,created_by\r\n"
+
+
+class CsvExportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+        self.first = Order.objects.create(title="A, b", author_id=self.author, total=3)
+        self.second = Order.objects.create(title="c")
+
+    def export(self, params=None):
+        return self.client.get("/api/tests/order/export_data/", params)
+
+    def content(self, response):
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_streams_raw_ids(self):
+        response = self.export()
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            response["Content-Disposition"], "attachment; filename=order.csv"
+        )
+        self.assertEqual(
+            self.content(response),
+            HEADER
+            + f'{self.first.id},"A, b",open,{self.author.id},3.00,,\r\n'
+            + f"{self.second.id},c,open,,0.00,,\r\n",
+        )
+
+    def test_foreign_keys_as_display_column(self):
+        with self.assertNumQueries(1):
+            content = self.content(self.export({"fk": "display"}))
+        self.assertEqual(
+            content,
+            HEADER
+            + f'{self.first.id},"A, b",open,Ann,3.00,,\r\n'
+            + f"{self.second.id},c,open,,0.00,,\r\n",
+        )
+
+    def test_invalid_fk_mode(self):
+        response = self.export({"fk": "name"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "'fk' must be 'id' or 'display'"})
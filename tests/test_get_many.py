@@ -0,0 +1,54 @@
+import json
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.bulk import pk_lookups
+
+from .models import Author, Order
+
+
+class GetManyTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+        self.orders = [
+            Order.objects.create(title=f"Order {i}", author_id=self.author)
+            for i in range(4)
+        ]
+
+    def get_many(self, ids):
+        return self.client.post(
+            "/api/tests/order/get_many/", {"ids": ids}, format="json"
+        )
+
+    def test_rows_in_request_order_without_duplicates(self):
+        first, second, _, fourth = self.orders
+        with self.assertNumQueries(1):
+            response = self.get_many(
+                [fourth.id, str(first.id), fourth.id, 999, second.id]
+            )
+        self.assertEqual(
+            [row["id"] for row in response.json()], [fourth.id, first.id, second.id]
+        )
+
+    def test_ids_from_the_filter_param(self):
+        first, second = self.orders[:2]
+        response = self.client.get(
+            "/api/tests/order/get_many/",
+            {"filter": json.dumps({"id": [second.id, first.id]})},
+        )
+        self.assertEqual([row["id"] for row in response.json()], [second.id, first.id])
+
+    def test_bad_id(self):
+        response = self.get_many([self.orders[0].id, "abc"])
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.json()["error"].startswith("Invalid ids:"))
+
+    def test_long_id_lists_are_split(self):
+        ids = [order.id for order in self.orders]
+        querysets = pk_lookups(Order.objects.all(), ids, chunk_size=3)
+        self.assertEqual(len(querysets), 2)
+        self.assertEqual(
+            sorted(order.id for queryset in querysets for order in queryset), ids
+        )
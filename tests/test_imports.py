@@ -0,0 +1,54 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Author, Order
+
+
+class CsvImportTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+
+    def upload(self, content, **data):
+        file = SimpleUploadedFile("orders.csv", content.encode(), "text/csv")
+        return self.client.post(
+            "/api/tests/order/import_data/", {"file": file, **data}, format="multipart"
+        )
+
+    def test_imports_rows_and_reports_failures_in_row_order(self):
+        content = (
+            "title,status,author_id,total\r\n"
+            f"First,open,{self.author.id},1.50\r\n"
+            "Bad total,open,,abc\r\n"
+            "Missing author,paid,999,2\r\n"
+            "Last,paid,,3\r\n"
+        )
+        response = self.upload(content, batch_size=2)
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual((body["rows"], body["imported"], body["failed"]), (4, 2, 2))
+        self.assertEqual(body["message"], "Imported with 2 failed rows")
+        self.assertEqual([error["row"] for error in body["errors"]], [3, 4])
+        self.assertIn("total", body["errors"][0]["errors"])
+        self.assertEqual(
+            body["errors"][1]["errors"],
+            {"author_id": ["Related object '999' does not exist."]},
+        )
+        self.assertEqual(
+            list(Order.objects.order_by("id").values_list("title", "author_id")),
+            [("First", self.author.id), ("Last", None)],
+        )
+
+    def test_unknown_column_rejects_the_file(self):
+        response = self.upload("title,colour\r\nFirst,red\r\n")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"error": "Could not import file: Unknown columns: colour"}
+        )
+        self.assertFalse(Order.objects.exists())
+
+    def test_no_file(self):
+        response = self.client.post("/api/tests/order/import_data/", {})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "No file uploaded"})
@@ -0,0 +1,75 @@
+import re
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.instrumentation import max_queries, record_queries
+
+from .models import Author
+
+SERVER_TIMING = re.compile(
+    r'^db;dur=\d+\.\d;desc="(\d+) queries", '
+    r"serialize;dur=\d+\.\d, total;dur=\d+\.\d$"
+)
+
+
+class ServerTimingTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        Author.objects.bulk_create(Author(name=f"Author {i}") for i in range(3))
+
+    def test_header_format(self):
+        response = self.client.get("/instrumented/tests/author/")
+        self.assertEqual(response.status_code, 200)
+        match = SERVER_TIMING.match(response["Server-Timing"])
+        self.assertIsNotNone(match, response["Server-Timing"])
+        # The page and its count
+        self.assertEqual(match.group(1), "2")
+
+    def test_no_header_without_instrument(self):
+        response = self.client.get("/api/tests/author/")
+        self.assertNotIn("Server-Timing", response)
+
+    def test_no_header_for_streaming_responses(self):
+        response = self.client.get("/instrumented/tests/author/export_data/")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 4)
+
+
+class MaxQueriesTests(TestCase):
+    def test_within_budget(self):
+        with max_queries(2) as recorder:
+            list(Author.objects.all())
+            list(Author.objects.all())
+        self.assertEqual(recorder.count, 2)
+
+    def test_over_budget_lists_the_queries(self):
+        with self.assertRaisesRegex(AssertionError, "3 queries executed, budget is 2"):
+            with max_queries(2):
+                for _ in range(3):
+                    list(Author.objects.all())
+
+
+class NPlusOneTests(TestCase):
+    def test_repeated_query_is_logged_with_its_call_site(self):
+        authors = Author.objects.bulk_create(
+            Author(name=f"Author {i}") for i in range(5)
+        )
+        with record_queries() as recorder:
+            for author in authors:
+                Author.objects.get(pk=author.pk)
+        with self.assertLogs("django_react_admin.instrumentation", "WARNING") as logs:
+            recorder.report_n_plus_one("GET /authors/")
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn(
+            "Possible N+1 in GET /authors/: 5 identical queries", logs.output[0]
+        )
+        self.assertIn("test_instrumentation.py", logs.output[0])
+
+    def test_repeats_below_the_threshold_are_not_reported(self):
+        with record_queries() as recorder:
+            for _ in range(4):
+                list(Author.objects.all())
+        with self.assertNoLogs("django_react_admin.instrumentation", "WARNING"):
+            recorder.report_n_plus_one()
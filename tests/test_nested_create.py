@@ -0,0 +1,80 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.instrumentation import max_queries
+
+from .models import Author, LineNote, Order, OrderLine
+
+
+def order_payload(author, lines, notes):
+    return {
+        "title": "Order",
+        "author_id": author.id,
+        "orderline": [
+            {
+                "product": f"product {i}",
+                "qty": i + 1,
+                "linenote": [{"text": f"note {i}.{j}"} for j in range(notes)],
+            }
+            for i in range(lines)
+        ],
+    }
+
+
+class NestedCreateTests(TestCase):
+    # Two savepoints (inside TestCase's transaction), the root INSERT, one
+    # INSERT per child level and the reference check; independent of the
+    # number of children
+    BUDGET = 8
+
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+
+    def test_two_levels_in_fixed_queries(self):
+        with max_queries(self.BUDGET):
+            response = self.client.post(
+                "/api/tests/order/",
+                order_payload(self.author, lines=20, notes=5),
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+        order = Order.objects.get(pk=response.json()["id"])
+        self.assertEqual(order.lines.count(), 20)
+        self.assertEqual(
+            LineNote.objects.filter(orderline_id__order_id=order).count(), 100
+        )
+
+    def test_query_count_does_not_grow_with_children(self):
+        with max_queries(self.BUDGET) as small:
+            self.client.post(
+                "/api/tests/order/", order_payload(self.author, 1, 1), format="json"
+            )
+        with max_queries(self.BUDGET) as large:
+            self.client.post(
+                "/api/tests/order/", order_payload(self.author, 30, 10), format="json"
+            )
+        self.assertEqual(small.count, large.count)
+        self.assertEqual(OrderLine.objects.count(), 31)
+
+    def test_invalid_child_rolls_back(self):
+        payload = order_payload(self.author, lines=2, notes=0)
+        payload["orderline"][1]["qty"] = "many"
+        response = self.client.post("/api/tests/order/", payload, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Order.objects.exists())
+        self.assertFalse(OrderLine.objects.exists())
+
+    def test_created_by_is_set_by_the_server(self):
+        user = User.objects.create(username="user")
+        intruder = User.objects.create(username="intruder")
+        self.client.force_authenticate(user)
+        payload = order_payload(self.author, lines=1, notes=0)
+        payload["created_by_id"] = intruder.id
+        payload["orderline"][0]["created_by_id"] = intruder.id
+        response = self.client.post("/api/tests/order/", payload, format="json")
+        self.assertEqual(response.status_code, 201)
+        order = Order.objects.get(pk=response.json()["id"])
+        self.assertEqual(order.created_by, user)
+        self.assertEqual(order.lines.get().created_by, user)
@@ -0,0 +1,111 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.instrumentation import max_queries
+
+from .models import Author, LineNote, Order, OrderLine
+
+
+class NestedUpdateTests(TestCase):
+    # Two savepoints (inside TestCase's transaction), the root read and
+    # UPDATE, then per level: a read of the existing children, one DELETE
+    # (plus its cascade), one UPDATE per set of changed columns and the
+    # INSERTs; independent of the number of children
+    BUDGET = 17
+
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+
+    def create_order(self, lines):
+        order = Order.objects.create(title="Order", author_id=self.author)
+        for i in range(lines):
+            line = OrderLine.objects.create(order_id=order, product=f"product {i}")
+            LineNote.objects.bulk_create(
+                LineNote(orderline_id=line, text=f"note {j}") for j in range(3)
+            )
+        return order
+
+    def update_payload(self, order):
+        """
+        Drop every third line, rename every other kept line, and per kept
+        line change a note, keep a note, drop a note and add one; append a
+        new line with a note.
+        """
+        rows = []
+        for k, line in enumerate(order.lines.order_by("id")):
+            if k % 3 == 0:
+                continue
+            notes = list(LineNote.objects.filter(orderline_id=line).order_by("id"))
+            rows.append(
+                {
+                    "id": line.id,
+                    "product": line.product + (" (renamed)" if k % 3 == 1 else ""),
+                    "linenote": [
+                        {"id": notes[0].id, "text": "changed"},
+                        {"id": notes[1].id, "text": notes[1].text},
+                        {"text": "added"},
+                    ],
+                }
+            )
+        rows.append({"product": "new", "linenote": [{"text": "new note"}]})
+        return {"title": "Order (edited)", "orderline": rows}
+
+    def test_two_levels_in_fixed_queries(self):
+        order = self.create_order(lines=30)
+        payload = self.update_payload(order)
+        with max_queries(self.BUDGET):
+            response = self.client.put(
+                f"/api/tests/order/{order.id}/", payload, format="json"
+            )
+        self.assertEqual(response.status_code, 200)
+
+        order.refresh_from_db()
+        self.assertEqual(order.title, "Order (edited)")
+        # 20 of 30 lines kept, plus the new one
+        self.assertEqual(order.lines.count(), 21)
+        self.assertEqual(order.lines.filter(product__endswith="(renamed)").count(), 10)
+        notes = LineNote.objects.filter(orderline_id__order_id=order)
+        self.assertEqual(notes.count(), 20 * 3 + 1)
+        self.assertEqual(notes.filter(text="changed").count(), 20)
+        self.assertEqual(notes.filter(text="added").count(), 20)
+        self.assertFalse(notes.filter(text="note 2").exists())
+
+    def test_query_count_does_not_grow_with_children(self):
+        small = self.create_order(lines=3)
+        large = self.create_order(lines=60)
+        counts = []
+        for order in (small, large):
+            payload = self.update_payload(order)
+            with max_queries(self.BUDGET) as recorder:
+                self.client.put(f"/api/tests/order/{order.id}/", payload, format="json")
+            counts.append(recorder.count)
+        self.assertEqual(counts[0], counts[1])
+
+    def test_created_by_is_not_rewritten(self):
+        owner = User.objects.create(username="owner")
+        intruder = User.objects.create(username="intruder")
+        order = Order.objects.create(title="Order", created_by=owner)
+        line = OrderLine.objects.create(order_id=order, product="p", created_by=owner)
+        payload = {
+            "title": "Order (edited)",
+            "created_by": intruder.id,
+            "created_by_id": intruder.id,
+            "orderline": [
+                {"id": line.id, "product": "p (edited)", "created_by": intruder.id},
+                {"product": "new", "created_by_id": intruder.id},
+            ],
+        }
+        response = self.client.put(
+            f"/api/tests/order/{order.id}/", payload, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        order.refresh_from_db()
+        line.refresh_from_db()
+        self.assertEqual(order.title, "Order (edited)")
+        self.assertEqual(order.created_by, owner)
+        self.assertEqual(line.product, "p (edited)")
+        self.assertEqual(line.created_by, owner)
+        # New children get the server's value too
+        self.assertIsNone(order.lines.get(product="new").created_by)
@@ -0,0 +1,51 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Author
+
+
+class CursorPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        # Repeated names, so the cursor has to break ties on the primary key
+        self.authors = [Author.objects.create(name=f"n{i % 4}") for i in range(12)]
+
+    def page(self, cursor, sort='["name","DESC"]'):
+        return self.client.get(
+            "/api/tests/author/", {"range": "[0,4]", "sort": sort, "cursor": cursor}
+        )
+
+    def test_pages_through_all_rows(self):
+        expected = [
+            a.id
+            for a in sorted(self.authors, key=lambda a: (a.name, a.id), reverse=True)
+        ]
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            response = self.page(cursor)
+            self.assertEqual(response.status_code, 200)
+            seen += [row["id"] for row in response.json()]
+            cursor = response.get("X-Next-Cursor")
+        self.assertEqual(seen, expected)
+
+    def test_prev_cursor_returns_previous_page(self):
+        first = self.page("")
+        second = self.page(first["X-Next-Cursor"])
+        back = self.page(second["X-Prev-Cursor"])
+        self.assertEqual(
+            [row["id"] for row in back.json()], [row["id"] for row in first.json()]
+        )
+
+    def test_cursor_must_match_sort(self):
+        cursor = self.page("")["X-Next-Cursor"]
+        response = self.page(cursor, sort='["name","ASC"]')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"error": "Cursor does not match the requested sort."}
+        )
+
+    def test_invalid_cursor(self):
+        response = self.page("garbage")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Invalid cursor."})
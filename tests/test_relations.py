@@ -0,0 +1,53 @@
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.instrumentation import max_queries
+
+from .models import Author, Company, Order, OrderLine
+
+
+class RootReferenceTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+
+    def test_missing_root_reference_reported_like_children(self):
+        response = self.client.post(
+            "/api/tests/order/",
+            {
+                "title": "Order",
+                "author_id": 999,
+                "orderline": [{"product": "A"}],
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            {"author_id": [["Related object(s) 999 do not exist."]]},
+        )
+        self.assertFalse(Order.objects.exists())
+
+    def test_root_references_checked_in_one_query_per_field(self):
+        company = Company.objects.create(name="Acme")
+        # Two savepoints and their releases, the INSERT and one reference
+        # check for company_id; no full_clean() lookup of the company
+        with max_queries(6) as recorder:
+            response = self.client.post(
+                "/api/tests/author/",
+                {"name": "Bob", "company_id": company.id},
+                format="json",
+            )
+        self.assertEqual(response.status_code, 201)
+        lookups = [sql for sql, _ in recorder.queries if "tests_company" in sql]
+        self.assertEqual(len(lookups), 1)
+
+    def test_required_root_reference(self):
+        response = self.client.post(
+            "/api/tests/orderline/", {"product": "A"}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"order_id": [["This field cannot be null."]]}
+        )
+        self.assertFalse(OrderLine.objects.exists())
@@ -0,0 +1,79 @@
+import json
+from unittest import mock
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.search import (
+    SEARCH_INDEX_RECHECK_SECONDS,
+    FulltextSearch,
+    drop_search_index,
+    ensure_search_index,
+)
+
+from .models import Article
+
+
+class FulltextSearchTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        Article.objects.create(title="Django guide", body="models and views")
+        Article.objects.create(title="Django basics")
+
+    def tearDown(self):
+        # Also forgets the cached readiness of the rolled back index
+        drop_search_index(Article)
+
+    def search(self, value):
+        response = self.client.get(
+            "/api/tests/article/", {"filter": json.dumps({"q": value})}
+        )
+        self.assertEqual(response.status_code, 200)
+        return [row["title"] for row in response.json()]
+
+    def test_icontains_until_the_index_exists(self):
+        # The whole value is one substring
+        self.assertEqual(self.search("ango gui"), ["Django guide"])
+        self.assertEqual(self.search("dja gui"), [])
+
+    def test_every_word_matches_a_word_prefix(self):
+        ensure_search_index(Article)
+        self.assertEqual(self.search("dja gui"), ["Django guide"])
+        self.assertEqual(self.search("views"), ["Django guide"])
+        self.assertEqual(self.search("ango"), [])
+        # Rows written after the index was built are indexed by the triggers
+        Article.objects.create(title="Guitar")
+        self.assertEqual(self.search("gui"), ["Django guide", "Guitar"])
+
+
+class ReadinessTests(TestCase):
+    def setUp(self):
+        self.search = FulltextSearch(Article)
+        self.clock = 1000.0
+        patcher = mock.patch(
+            "django_react_admin.search.time.monotonic", lambda: self.clock
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_found_index_is_remembered(self):
+        with mock.patch(
+            "django_react_admin.search.search_index_exists", return_value=True
+        ) as exists:
+            self.assertTrue(self.search.ready("default"))
+            self.clock += SEARCH_INDEX_RECHECK_SECONDS * 10
+            self.assertTrue(self.search.ready("default"))
+        self.assertEqual(exists.call_count, 1)
+
+    def test_missing_index_is_looked_for_again(self):
+        with mock.patch(
+            "django_react_admin.search.search_index_exists",
+            side_effect=[False, True],
+        ) as exists:
+            self.assertFalse(self.search.ready("default"))
+            self.assertFalse(self.search.ready("default"))
+            self.assertEqual(exists.call_count, 1)
+            # Created by another process meanwhile
+            self.clock += SEARCH_INDEX_RECHECK_SECONDS
+            self.assertTrue(self.search.ready("default"))
+        self.assertEqual(exists.call_count, 2)
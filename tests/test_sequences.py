@@ -0,0 +1,55 @@
+import json
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from django_react_admin.models import IdSequence
+
+from .models import Invoice
+
+OPTIONS = {"prefix": "INV-", "pad_length": 4}
+
+
+class GenerateIdTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def generate(self, options=OPTIONS, **params):
+        return self.client.get(
+            "/api/tests/invoice/generate_id/",
+            {"column": "number", "options": json.dumps(options), **params},
+        )
+
+    def test_numbers_are_consecutive(self):
+        self.assertEqual(self.generate().json(), {"id": "INV-0001", "raw": 1})
+        self.assertEqual(self.generate().json(), {"id": "INV-0002", "raw": 2})
+        # Once the counter row exists: its UPDATE and the read-back, inside
+        # a savepoint
+        with self.assertNumQueries(4):
+            self.assertEqual(self.generate().json()["raw"], 3)
+
+    def test_counter_is_seeded_from_existing_rows(self):
+        Invoice.objects.create(number=41)
+        self.assertEqual(self.generate().json(), {"id": "INV-0042", "raw": 42})
+        self.assertEqual(IdSequence.objects.get().last_value, 42)
+
+    def test_each_prefix_has_its_own_sequence(self):
+        self.generate()
+        self.generate()
+        response = self.generate({"prefix": "CN-", "pad_length": 3})
+        self.assertEqual(response.json(), {"id": "CN-001", "raw": 1})
+
+    def test_without_sequence_table_numbers_follow_stored_rows(self):
+        Invoice.objects.create(number=7)
+        options = {**OPTIONS, "sequence": False}
+        self.assertEqual(self.generate(options).json()["raw"], 8)
+        # Nothing is reserved: the same number until a row stores it
+        self.assertEqual(self.generate(options).json()["raw"], 8)
+        self.assertFalse(IdSequence.objects.exists())
+
+    def test_unknown_column(self):
+        response = self.client.get(
+            "/api/tests/invoice/generate_id/", {"column": "code"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"error": "Column 'code' not found on model"})
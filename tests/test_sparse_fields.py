@@ -0,0 +1,51 @@
+import json
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .models import Author, Order
+
+
+class SparseFieldsTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+        self.order = Order.objects.create(title="T", author_id=self.author, total=2)
+
+    def test_list_returns_pk_and_requested_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/tests/order/", {"fields": "title,total"})
+        self.assertEqual(
+            response.json(), [{"id": self.order.id, "title": "T", "total": 2.0}]
+        )
+        # Only those columns are read
+        page_sql = queries.captured_queries[-1]["sql"]
+        self.assertNotIn('"status"', page_sql)
+        self.assertNotIn('"updated_at"', page_sql)
+
+    def test_meta_fields_on_detail_accepts_attnames(self):
+        response = self.client.get(
+            f"/api/tests/order/{self.order.id}/",
+            {"meta": json.dumps({"fields": ["author_id_id"]})},
+        )
+        self.assertEqual(
+            response.json(), {"id": self.order.id, "author_id": self.author.id}
+        )
+
+    def test_embeds_keep_their_foreign_key(self):
+        response = self.client.get(
+            "/api/tests/order/",
+            {"fields": "title", "meta": json.dumps({"embed": ["author_id"]})},
+        )
+        (row,) = response.json()
+        self.assertEqual(set(row), {"id", "title", "author_id", "author"})
+        self.assertEqual(row["author"]["name"], "Ann")
+
+    def test_unknown_field(self):
+        response = self.client.get("/api/tests/order/", {"fields": "nope"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(), {"error": "Invalid fields parameter: Unknown field 'nope'"}
+        )
@@ -0,0 +1,108 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import DataError
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from .models import Author, Order
+
+
+class PerRowUpdateTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.author = Author.objects.create(name="Ann")
+        self.orders = [
+            Order.objects.create(title=f"Order {i}", author_id=self.author)
+            for i in range(3)
+        ]
+
+    def update_rows(self, rows):
+        return self.client.put(
+            "/api/tests/order/update_many/", {"data": rows}, format="json"
+        )
+
+    def test_results_per_id(self):
+        first, second, _ = self.orders
+        response = self.update_rows(
+            [
+                {"id": first.id, "title": "Renamed", "total": "9.50"},
+                {"id": second.id, "title": second.title},
+                {"id": 999, "title": "Missing"},
+            ]
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["updated"], 1)
+        self.assertEqual(
+            body["results"],
+            [
+                {"id": first.id, "status": 200, "changed": ["title", "total"]},
+                {"id": second.id, "status": 200, "changed": []},
+                {"id": 999, "status": 404, "errors": {"id": ["Not found."]}},
+            ],
+        )
+        first.refresh_from_db()
+        self.assertEqual(first.title, "Renamed")
+
+    def test_rows_are_validated_individually(self):
+        first, second, third = self.orders
+        response = self.update_rows(
+            [
+                {"id": first.id, "title": "x" * 101},
+                {"id": second.id, "status": "archived", "colour": "red"},
+                {"id": third.id, "status": "paid"},
+            ]
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["updated"], 1)
+        results = body["results"]
+        self.assertEqual(results[0]["status"], 400)
+        self.assertEqual(
+            results[0]["errors"],
+            {"title": ["Ensure this value has at most 100 characters (it has 101)."]},
+        )
+        self.assertEqual(
+            results[1],
+            {"id": second.id, "status": 400, "errors": {"colour": ["Unknown field."]}},
+        )
+        self.assertEqual(results[2]["status"], 200)
+
+        response = self.update_rows([{"id": second.id, "status": "archived"}])
+        self.assertEqual(
+            response.json()["results"][0]["errors"],
+            {"status": ["Value 'archived' is not a valid choice."]},
+        )
+        first.refresh_from_db()
+        second.refresh_from_db()
+        third.refresh_from_db()
+        self.assertEqual(first.title, "Order 0")
+        self.assertEqual(second.status, "open")
+        self.assertEqual(third.status, "paid")
+
+    def test_created_by_is_not_rewritten(self):
+        owner = User.objects.create(username="owner")
+        order = self.orders[0]
+        Order.objects.filter(id=order.id).update(created_by=owner)
+        response = self.update_rows(
+            [{"id": order.id, "title": "Renamed", "created_by_id": None}]
+        )
+        self.assertEqual(
+            response.json()["results"],
+            [{"id": order.id, "status": 200, "changed": ["title"]}],
+        )
+        order.refresh_from_db()
+        self.assertEqual(order.created_by, owner)
+
+    def test_database_errors_are_a_400(self):
+        with mock.patch(
+            "django_react_admin.views.bulk_update_changed",
+            side_effect=DataError("value too long for type character varying(100)"),
+        ):
+            response = self.update_rows([{"id": self.orders[0].id, "title": "x"}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json(),
+            {"non_field_errors": ["value too long for type character varying(100)"]},
+        )
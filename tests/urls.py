@@ -0,0 +1,84 @@
+from django.urls import path
+
+from django_react_admin.async_views import AsyncDynamicModelViewSet
+from django_react_admin.views import DynamicModelViewSet
+
+
+class CachedViewSet(DynamicModelViewSet):
+    cache_timeout = 60
+
+
+class InstrumentedViewSet(DynamicModelViewSet):
+    instrument = True
+
+
+urlpatterns = [
+    path("api/batch/", DynamicModelViewSet.as_view({"post": "batch"})),
+    path("async/batch/", AsyncDynamicModelViewSet.as_view({"post": "batch"})),
+    path(
+        "async/<str:app_label>/<str:model_name>/export_data/",
+        AsyncDynamicModelViewSet.as_view({"get": "export_data"}),
+    ),
+    path(
+        "async/<str:app_label>/<str:model_name>/get_many/",
+        AsyncDynamicModelViewSet.as_view({"get": "get_many", "post": "get_many"}),
+    ),
+    path(
+        "async/<str:app_label>/<str:model_name>/",
+        AsyncDynamicModelViewSet.as_view({"get": "list"}),
+    ),
+    path(
+        "async/<str:app_label>/<str:model_name>/<str:pk>/",
+        AsyncDynamicModelViewSet.as_view({"get": "retrieve"}),
+    ),
+    path(
+        "instrumented/<str:app_label>/<str:model_name>/export_data/",
+        InstrumentedViewSet.as_view({"get": "export_data"}),
+    ),
+    path(
+        "instrumented/<str:app_label>/<str:model_name>/",
+        InstrumentedViewSet.as_view({"get": "list"}),
+    ),
+    path(
+        "cached/<str:app_label>/<str:model_name>/",
+        CachedViewSet.as_view({"get": "list", "post": "create"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/delete_many/",
+        DynamicModelViewSet.as_view({"delete": "delete_many"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/export_data/",
+        DynamicModelViewSet.as_view({"get": "export_data"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/create_many/",
+        DynamicModelViewSet.as_view({"post": "create_many"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/generate_id/",
+        DynamicModelViewSet.as_view(
+            {"get": "generate_id_action", "post": "generate_id_action"}
+        ),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/get_many/",
+        DynamicModelViewSet.as_view({"get": "get_many", "post": "get_many"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/import_data/",
+        DynamicModelViewSet.as_view({"post": "import_data"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/update_many/",
+        DynamicModelViewSet.as_view({"put": "update_many"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/",
+        DynamicModelViewSet.as_view({"get": "list", "post": "create"}),
+    ),
+    path(
+        "api/<str:app_label>/<str:model_name>/<str:pk>/",
+        DynamicModelViewSet.as_view({"get": "retrieve", "put": "update"}),
+    ),
+]